@@ -2,18 +2,36 @@
 
 import typer
 
-from src.cli.ui import console, print_error, print_header, print_success
-from src.core.auth import setup_auth
+from src.cli.ui import print_error, print_header, print_info, print_success
+from src.core.exceptions import AuthenticationError
+
+# Shown when setup fails, after the error itself
+SETUP_TIPS = (
+    "Ensure client_id and client_secret are correct",
+    "The OAuth app type must be 'TVs and Limited Input devices'",
+    "YouTube Data API v3 must be enabled in your Google Cloud project",
+    "Make sure you're logged into your Google account",
+)
 
 
 def auth(ctx: typer.Context) -> None:
     """Authenticate with YouTube Music via OAuth."""
+    # Deferred so 'ymd --help' and other commands skip ytmusicapi
+    from src.core.auth import OAUTH_FILE, setup_auth
+
     print_header("YouTube Music Authentication")
+    print_info("This will start a device-code authentication flow.")
+    print_info("Follow the prompts to grant access to your YouTube Music library.")
 
-    if setup_auth():
-        print_success("Authentication complete!")
-        console.print("You can now use [bold]ymd sync[/bold] to download music.")
-        raise typer.Exit(code=0)
-    else:
-        print_error("Authentication failed. See tips above.")
+    try:
+        setup_auth()
+    except AuthenticationError as e:
+        print_error(str(e))
+        for tip in SETUP_TIPS:
+            print_info(tip)
         raise typer.Exit(code=1)
+
+    print_success("Authentication complete!")
+    print_info(f"Credentials saved to {OAUTH_FILE}")
+    print_info("You can now use 'ymd sync' to download music.")
+    raise typer.Exit(code=0)
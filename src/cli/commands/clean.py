@@ -1,28 +1,88 @@
 """Clean command - remove orphaned downloaded files."""
 
 import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from typing import TYPE_CHECKING
 
 import typer
 
+from src.cli import ui
 from src.cli.ui import (
     confirm_action,
-    console,
     print_error,
     print_header,
     print_info,
     print_success,
     print_warning,
 )
-from src.core.auth import load_auth
 from src.core.config import load_config
 from src.core.exceptions import AuthenticationError
+from src.core.rate_limit import LeakyBucket
 from src.core.sync_state import SyncState
-from src.providers.youtube import YouTubeProvider
+
+if TYPE_CHECKING:
+    from src.providers.youtube import YouTubeProvider
 
 logger = logging.getLogger(__name__)
 
 
+def _dir_is_empty(path: str) -> bool:
+    """Check if a directory has no entries, stopping at the first one."""
+    with os.scandir(path) as entries:
+        return next(entries, None) is None
+
+
+def _remove_empty_dirs(dirs: set[str]) -> None:
+    """Remove directories left empty after deleting files.
+
+    Each directory is checked once, regardless of how many of its
+    files were removed.
+    """
+    for directory in dirs:
+        try:
+            if _dir_is_empty(directory):
+                os.rmdir(directory)
+        except OSError as e:
+            logger.warning("Could not remove directory %s: %s", directory, e)
+
+
+def _fetch_current_ids(
+    provider: "YouTubeProvider",
+    playlist_ids: list[str],
+) -> set[str]:
+    """Collect video IDs from the given playlists plus liked songs.
+
+    Sources are fetched concurrently. One that fails is skipped with a
+    warning, except for AuthenticationError, which is re-raised.
+    """
+    from src.providers.youtube import MAX_FETCH_WORKERS
+
+    def _fetch(pid: str | None) -> set[str]:
+        if pid is None:
+            return set(provider.iter_liked_video_ids())
+        return set(provider.iter_playlist_video_ids(pid))
+
+    sources: list[str | None] = [*playlist_ids, None]
+    current_ids: set[str] = set()
+    with ThreadPoolExecutor(
+        max_workers=min(MAX_FETCH_WORKERS, len(sources))
+    ) as executor:
+        futures = [(pid, executor.submit(_fetch, pid)) for pid in sources]
+        for pid, future in futures:
+            try:
+                current_ids.update(future.result())
+            except AuthenticationError:
+                raise
+            except Exception as e:
+                if pid is None:
+                    logger.warning("Could not fetch liked songs: %s", e)
+                else:
+                    logger.warning("Could not fetch playlist %s: %s", pid, e)
+    return current_ids
+
+
 def clean_command(
     output_dir: Path | None = typer.Option(
         None, "--output-dir", "-o", help="Downloads directory"
@@ -36,6 +96,10 @@ def clean_command(
     yes: bool = typer.Option(False, "--yes", "-y", help="Skip confirmation prompt"),
 ) -> None:
     """Remove files that are no longer in your playlists."""
+    # Deferred so 'ymd --help' and other commands skip ytmusicapi
+    from src.core.auth import load_auth
+    from src.providers.youtube import YouTubeProvider
+
     config = load_config()
     download_path = output_dir or config.download_dir
 
@@ -54,34 +118,18 @@ def clean_command(
         print_error(str(e))
         raise typer.Exit(code=1)
 
-    provider = YouTubeProvider(ytmusic)
+    provider = YouTubeProvider(ytmusic, LeakyBucket(config.rate_limit))
     print_success("Authenticated")
 
     print_header("Checking for orphaned tracks")
 
-    # Gather current video IDs from all synced playlists
-    current_ids: set[str] = set()
-
-    playlists = sync_state.synced_playlists
-    for pid in playlists:
-        try:
-            raw_tracks = provider.get_playlist_tracks(pid)
-            for t in raw_tracks:
-                vid = t.get("videoId", "")
-                if vid:
-                    current_ids.add(vid)
-        except Exception as e:
-            logger.warning("Could not fetch playlist %s: %s", pid, e)
-
-    # Also check liked songs if they were synced
+    # Gather current video IDs from all synced playlists and liked songs
     try:
-        liked = provider.get_liked_songs()
-        for t in liked:
-            vid = t.get("videoId", "")
-            if vid:
-                current_ids.add(vid)
-    except Exception as e:
-        logger.warning("Could not fetch liked songs: %s", e)
+        current_ids = _fetch_current_ids(provider, list(sync_state.synced_playlists))
+    except AuthenticationError as e:
+        # Without playlist contents every track would look orphaned
+        print_error(str(e))
+        raise typer.Exit(code=1)
 
     orphaned = sync_state.get_orphaned_tracks(current_ids)
 
@@ -89,15 +137,16 @@ def clean_command(
         print_success("No orphaned tracks found. Everything is in sync!")
         raise typer.Exit(code=0)
 
-    # Display orphaned tracks
-    console.print(f"\n[warning]Found {len(orphaned)} " f"orphaned tracks:[/warning]")
+    # Display orphaned tracks, rendered and written in one print
+    lines = [f"\n[warning]Found {len(orphaned)} orphaned tracks:[/warning]"]
     for track in orphaned:
         artist = track.get("artist", "Unknown")
         title = track.get("title", "Unknown")
         filepath = track.get("filepath", "")
-        console.print(f"  [dim]-[/dim] {artist} - {title}")
+        lines.append(f"  [dim]-[/dim] {artist} - {title}")
         if filepath:
-            console.print(f"    [dim]{filepath}[/dim]")
+            lines.append(f"    [dim]{filepath}[/dim]")
+    ui.console.print("\n".join(lines))
 
     if dry_run:
         print_info("Dry run - no files were removed")
@@ -110,24 +159,27 @@ def clean_command(
 
     # Remove files and update state
     removed = 0
+    parents_to_check: set[str] = set()
     for track in orphaned:
         filepath_str = track.get("filepath", "")
         video_id = track.get("video_id", "")
 
+        # Work on the stored path strings directly; this loop can run
+        # over thousands of orphans
         if filepath_str:
-            filepath = Path(filepath_str)
-            if filepath.exists():
-                try:
-                    filepath.unlink()
-                    removed += 1
-                    # Remove empty parent directories
-                    parent = filepath.parent
-                    if parent.exists() and not any(parent.iterdir()):
-                        parent.rmdir()
-                except OSError as e:
-                    print_error(f"Could not remove {filepath}: {e}")
+            try:
+                os.unlink(filepath_str)
+                removed += 1
+                parents_to_check.add(os.path.dirname(filepath_str))
+            except FileNotFoundError:
+                pass
+            except OSError as e:
+                print_error(f"Could not remove {filepath_str}: {e}")
 
         sync_state.remove_track(video_id)
 
+    # Remove empty parent directories
+    _remove_empty_dirs(parents_to_check)
+
     sync_state.save()
     print_success(f"Removed {removed} files")
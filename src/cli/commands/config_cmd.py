@@ -1,12 +1,42 @@
 """Config command - view and edit configuration."""
 
+from collections.abc import Callable
+from typing import Any
+
 import typer
 
-from src.cli.ui import console, print_header, print_info, print_success
-from src.core.config import AppConfig, load_config, save_config
+from src.cli import ui
+from src.cli.ui import print_header, print_info, print_success
+from src.core.config import CONFIG_FILE, AppConfig, save_config
+
+SENSITIVE_KEYS: frozenset[str] = frozenset({"client_id", "client_secret"})
+
+
+def _parse_bool(value: str) -> bool:
+    """Parse a CLI boolean string."""
+    return value.lower() in ("true", "1", "yes")
+
 
-CONFIG_FILE = "config.json"
-SENSITIVE_KEYS = {"client_id", "client_secret"}
+def _make_caster(annotation: Any) -> Callable[[str], Any]:
+    """Return a str -> value converter for a config field type.
+
+    bool is checked before int since bool is a subclass of int. Other
+    types (str, Path) are passed through for Pydantic to coerce.
+    """
+    if annotation is bool:
+        return _parse_bool
+    if annotation is int:
+        return int
+    if annotation is float:
+        return float
+    return str
+
+
+# Built once from the model's declared field types
+_FIELD_CASTERS: dict[str, Callable[[str], Any]] = {
+    name: _make_caster(field.annotation)
+    for name, field in AppConfig.model_fields.items()
+}
 
 
 def _mask_sensitive(key: str, value: str) -> str:
@@ -22,10 +52,10 @@ def _mask_sensitive(key: str, value: str) -> str:
     Returns:
         Masked or original value string.
     """
-    if key not in SENSITIVE_KEYS or not value:
+    if not value or key not in SENSITIVE_KEYS:
         return value
     if len(value) > 8:
-        return value[:4] + "****" + value[-4:]
+        return f"{value[:4]}****{value[-4:]}"
     return "****"
 
 
@@ -54,35 +84,26 @@ def config_command(
         print_success(f"Created default config at {CONFIG_FILE}")
         return
 
-    config = load_config()
+    # The editable model, not the read-only snapshot load_config returns
+    config = AppConfig.load()
 
     if set_value:
         data = config.model_dump()
         for kv in set_value:
             if "=" not in kv:
-                console.print(
+                ui.console.print(
                     f"[error]Invalid format: {kv} " f"(use key=value)[/error]"
                 )
                 raise typer.Exit(code=1)
             key, value = kv.split("=", 1)
             key = key.strip()
             if key not in data:
-                console.print(f"[error]Unknown config key: {key}[/error]")
-                console.print("[dim]Valid keys: " f"{', '.join(data.keys())}[/dim]")
+                ui.console.print(f"[error]Unknown config key: {key}[/error]")
+                ui.console.print("[dim]Valid keys: " f"{', '.join(data.keys())}[/dim]")
                 raise typer.Exit(code=1)
 
-            # Cast to the right type
-            current = data[key]
-            if isinstance(current, int):
-                data[key] = int(value)
-            elif isinstance(current, bool):
-                data[key] = value.lower() in (
-                    "true",
-                    "1",
-                    "yes",
-                )
-            else:
-                data[key] = value
+            # Cast to the field's declared type
+            data[key] = _FIELD_CASTERS.get(key, str)(value)
 
         config = AppConfig(**data)
         save_config(config)
@@ -94,5 +115,5 @@ def config_command(
         data = config.model_dump(mode="json")
         for key, value in data.items():
             display = _mask_sensitive(key, str(value))
-            console.print(f"  {key}: [bold]{display}[/bold]")
+            ui.console.print(f"  {key}: [bold]{display}[/bold]")
         print_info(f"Config file: {CONFIG_FILE}")
@@ -1,37 +1,48 @@
 """Doctor command - system health checks for ymd."""
 
-import json
 import shutil
-from pathlib import Path
+from collections.abc import Callable
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 import typer
+from rich.text import Text
 
-from src.cli.ui import console, print_error, print_header, print_info, print_success
-from src.core.config import CONFIG_FILE, load_config
+from src.cli import ui
+from src.cli.ui import print_error, print_header, print_info, print_success
+from src.core.config import CONFIG_FILE, OAUTH_FILE, FastConfig, load_config
 from src.core.exceptions import ConfigError
 
 
-def _check_config() -> bool:
+def _load_config() -> tuple[FastConfig | None, ConfigError | None]:
+    """Load config once for all checks, capturing any validation error."""
+    try:
+        return load_config(), None
+    except ConfigError as e:
+        return None, e
+
+
+def _check_config(
+    config: FastConfig | None,
+    error: ConfigError | None = None,
+) -> bool:
     """Check if config.json exists and is valid."""
     if not CONFIG_FILE.exists():
         print_error("config.json not found")
         print_info("Run 'ymd config --init' to create a default config")
         return False
 
-    try:
-        load_config()
-        print_success("config.json is valid")
-        return True
-    except ConfigError as e:
-        print_error(f"config.json is invalid: {e}")
+    if config is None:
+        print_error(f"config.json is invalid: {error}")
         return False
 
+    print_success("config.json is valid")
+    return True
+
 
-def _check_oauth_credentials() -> bool:
+def _check_oauth_credentials(config: FastConfig | None) -> bool:
     """Check if OAuth credentials are configured."""
-    try:
-        config = load_config()
-    except ConfigError:
+    if config is None:
         return False
 
     if not config.client_id or not config.client_secret:
@@ -48,13 +59,12 @@ def _check_oauth_credentials() -> bool:
 
 def _check_oauth_tokens() -> bool:
     """Check if oauth.json exists and has valid structure."""
-    oauth_file = Path("oauth.json")
-    if not oauth_file.exists():
+    if not OAUTH_FILE.exists():
         print_error("oauth.json not found - run 'ymd auth' to authenticate")
         return False
 
     try:
-        data = json.loads(oauth_file.read_text())
+        data = orjson.loads(OAUTH_FILE.read_bytes())
         if "access_token" not in data and "token" not in data:
             print_error("oauth.json appears corrupted - run 'ymd auth'")
             return False
@@ -72,7 +82,7 @@ def _check_oauth_tokens() -> bool:
                     print_info("Token expired - will be refreshed on next use")
 
         return True
-    except (json.JSONDecodeError, OSError) as e:
+    except (orjson.JSONDecodeError, OSError) as e:
         print_error(f"Cannot read oauth.json: {e}")
         return False
 
@@ -104,11 +114,9 @@ def _check_ffmpeg() -> bool:
         return False
 
 
-def _check_download_dir() -> bool:
+def _check_download_dir(config: FastConfig | None) -> bool:
     """Check if download directory is accessible."""
-    try:
-        config = load_config()
-    except ConfigError:
+    if config is None:
         return False
 
     download_dir = config.download_dir
@@ -151,6 +159,17 @@ def _check_api_connection() -> bool:
         return False
 
 
+def _run_check(check_fn: Callable[[], bool]) -> tuple[bool, str]:
+    """Run a check in a worker thread, capturing its console output.
+
+    Rich's capture buffer is thread-local, so concurrent checks don't
+    interleave their messages.
+    """
+    with ui.console.capture() as capture:
+        passed = check_fn()
+    return passed, capture.get()
+
+
 def doctor_command(
     skip_api: bool = typer.Option(
         False,
@@ -160,36 +179,43 @@ def doctor_command(
 ) -> None:
     """Run system health checks for ymd."""
     print_header("ymd Doctor - System Health Check")
-    console.print()
+    ui.console.print()
 
     checks_passed = 0
     checks_total = 0
 
-    checks = [
-        ("Configuration", _check_config),
-        ("OAuth Credentials", _check_oauth_credentials),
+    config, config_error = _load_config()
+
+    checks: list[tuple[str, Callable[[], bool]]] = [
+        ("Configuration", lambda: _check_config(config, config_error)),
+        ("OAuth Credentials", lambda: _check_oauth_credentials(config)),
         ("OAuth Tokens", _check_oauth_tokens),
         ("yt-dlp", _check_yt_dlp),
         ("ffmpeg", _check_ffmpeg),
-        ("Download Directory", _check_download_dir),
+        ("Download Directory", lambda: _check_download_dir(config)),
     ]
 
-    for name, check_fn in checks:
-        checks_total += 1
-        console.print(f"\n  [bold]Checking {name}...[/bold]")
-        if check_fn():
-            checks_passed += 1
-
     if not skip_api:
+        checks.append(("API Connection", _check_api_connection))
+
+    # Checks are independent and mostly wait on syscalls or the
+    # network, so run them together and print results in order.
+    with ThreadPoolExecutor(max_workers=len(checks)) as executor:
+        futures = [executor.submit(_run_check, check_fn) for _, check_fn in checks]
+        results = [future.result() for future in futures]
+
+    for (name, _), (passed, output) in zip(checks, results, strict=True):
         checks_total += 1
-        console.print("\n  [bold]Checking API Connection...[/bold]")
-        if _check_api_connection():
+        ui.console.print(f"\n  [bold]Checking {name}...[/bold]")
+        ui.console.print(Text.from_ansi(output), end="")
+        if passed:
             checks_passed += 1
-    else:
+
+    if skip_api:
         print_info("Skipping API connection check (--skip-api)")
 
     # Summary
-    console.print()
+    ui.console.print()
     print_header("Results")
     if checks_passed == checks_total:
         print_success(f"All checks passed ({checks_passed}/{checks_total})")
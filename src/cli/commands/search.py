@@ -3,24 +3,23 @@
 import logging
 from pathlib import Path
 
-import questionary
 import typer
 
+from src.cli import ui
 from src.cli.ui import (
-    console,
+    is_machine_output,
     print_error,
     print_header,
     print_info,
     print_success,
+    print_track_table,
     print_warning,
 )
-from src.core.auth import load_auth
 from src.core.config import load_config
-from src.core.download import download_track
+from src.core.download import Downloader
 from src.core.exceptions import AuthenticationError, DownloadError
 from src.core.organizer import organize_track
-from src.core.tagger import tag_file
-from src.providers.youtube import YouTubeProvider
+from src.core.rate_limit import LeakyBucket
 
 logger = logging.getLogger(__name__)
 
@@ -32,7 +31,19 @@ def search_command(
         None, "--output-dir", "-o", help="Output directory"
     ),
 ) -> None:
-    """Search YouTube Music and optionally download results."""
+    """Search YouTube Music and optionally download results.
+
+    With --output json or tsv the results are listed on stdout and no
+    selection prompt is shown.
+    """
+    # Deferred so 'ymd --help' and other commands skip ytmusicapi,
+    # questionary and mutagen
+    import questionary
+
+    from src.core.auth import load_auth
+    from src.core.tagger import tag_file
+    from src.providers.youtube import YouTubeProvider
+
     config = load_config()
 
     print_header("Authenticating")
@@ -42,20 +53,29 @@ def search_command(
         print_error(str(e))
         raise typer.Exit(code=1)
 
-    provider = YouTubeProvider(ytmusic)
+    provider = YouTubeProvider(ytmusic, LeakyBucket(config.rate_limit))
     print_success("Authenticated")
 
     print_header(f'Searching for "{query}"')
-    results = provider.search(query, limit=limit)
+    try:
+        results = provider.search(query, limit=limit)
+    except AuthenticationError as e:
+        print_error(str(e))
+        raise typer.Exit(code=1)
 
     if not results:
         print_warning("No results found")
         raise typer.Exit(code=0)
 
+    tracks = [YouTubeProvider.normalize_track(result) for result in results]
+
+    if is_machine_output():
+        print_track_table(tracks, show_all=True)
+        return
+
     # Build choices with search results
     choices: list[questionary.Choice] = []
-    for result in results:
-        normalized = YouTubeProvider.normalize_track(result)
+    for normalized in tracks:
         artist = normalized["artist"]
         title = normalized["title"]
         album = normalized["album"]
@@ -85,31 +105,27 @@ def search_command(
     temp_dir = download_path / ".tmp"
     temp_dir.mkdir(parents=True, exist_ok=True)
 
-    for track in selected:
-        video_id = track["video_id"]
-        title = track["title"]
-        artist = track["artist"]
-        console.print(f"[dim]  -> Downloading {artist} - {title}...[/dim]")
-
-        try:
-            filepath = download_track(
-                video_id,
-                temp_dir,
-                config.audio_format,
-                config.fallback_format,
-            )
-            if filepath:
-                tag_file(filepath, track)
-                final_path = organize_track(
-                    filepath,
-                    download_path,
-                    track,
-                    config.organize_by,
-                    config.max_filename_length,
-                    config.default_genre,
-                )
-                print_success(f"Saved: {final_path}")
-            else:
-                print_error(f"Download returned no file for {title}")
-        except (DownloadError, Exception) as e:
-            print_error(f"Failed: {title} - {e}")
+    with Downloader(config.audio_format, config.fallback_format) as downloader:
+        for track in selected:
+            video_id = track["video_id"]
+            title = track["title"]
+            artist = track["artist"]
+            ui.console.print(f"[dim]  -> Downloading {artist} - {title}...[/dim]")
+
+            try:
+                filepath = downloader.download(video_id, temp_dir)
+                if filepath:
+                    tag_file(filepath, track)
+                    final_path = organize_track(
+                        filepath,
+                        download_path,
+                        track,
+                        config.organize_by,
+                        config.max_filename_length,
+                        config.default_genre,
+                    )
+                    print_success(f"Saved: {final_path}")
+                else:
+                    print_error(f"Download returned no file for {title}")
+            except (DownloadError, Exception) as e:
+                print_error(f"Failed: {title} - {e}")
@@ -4,7 +4,13 @@ from pathlib import Path
 
 import typer
 
-from src.cli.ui import console, print_header, print_info, print_warning
+from src.cli import ui
+from src.cli.ui import (
+    print_header,
+    print_info,
+    print_synced_playlists,
+    print_warning,
+)
 from src.core.config import load_config
 from src.core.sync_state import SyncState
 
@@ -25,21 +31,16 @@ def status_command(
 
     last_sync = sync_state.last_sync
     if last_sync:
-        console.print(f"  Last sync:     {last_sync}")
+        ui.console.print(f"  Last sync:     {last_sync}")
     else:
         print_warning("Never synced")
+        # JSON output still gets an (empty) list on stdout
+        print_synced_playlists({})
         return
 
-    console.print(f"  Total tracks:  {sync_state.total_tracks}")
-    console.print(f"  Download dir:  {download_path}")
-
-    playlists = sync_state.synced_playlists
-    if playlists:
-        console.print("\n  [bold]Synced Playlists:[/bold]")
-        for pid, info in playlists.items():
-            name = info.get("name", pid)
-            count = info.get("track_count", "?")
-            last = info.get("last_sync", "unknown")
-            console.print(f"    {name}: {count} tracks (synced: {last})")
+    ui.console.print(f"  Total tracks:  {sync_state.total_tracks}")
+    ui.console.print(f"  Download dir:  {download_path}")
+
+    print_synced_playlists(sync_state.synced_playlists)
 
     print_info(f"State file: {state_file}")
@@ -1,10 +1,12 @@
 """Sync command - the main feature of ymd."""
 
 import logging
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Any
+from typing import TYPE_CHECKING, Any
 
-import questionary
 import typer
 
 from src.cli.ui import (
@@ -17,9 +19,9 @@ from src.cli.ui import (
     print_track_table,
     print_warning,
 )
-from src.core.auth import load_auth
-from src.core.config import load_config
-from src.core.download import download_track
+from src.core.cache import PlaylistCache
+from src.core.config import MAX_CONCURRENT_DOWNLOADS, load_config
+from src.core.download import Downloader
 from src.core.exceptions import (
     AuthenticationError,
     DownloadError,
@@ -27,12 +29,19 @@ from src.core.exceptions import (
     OrganizationError,
 )
 from src.core.organizer import cleanup_temp_dir, organize_track
+from src.core.rate_limit import LeakyBucket
 from src.core.sync_state import SyncState
-from src.core.tagger import tag_file
-from src.providers.youtube import YouTubeProvider
+
+if TYPE_CHECKING:
+    from src.providers.youtube import YouTubeProvider
 
 logger = logging.getLogger(__name__)
 
+LIKED_SONGS_ID = "__liked__"
+# Minimum seconds between progress bar updates; completions in between
+# are counted and applied together
+PROGRESS_UPDATE_INTERVAL = 0.5
+
 
 def sync_command(
     output_dir: Path | None = typer.Option(
@@ -54,8 +63,26 @@ def sync_command(
         "-f",
         help="Force re-download all tracks",
     ),
+    jobs: int | None = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        min=1,
+        max=MAX_CONCURRENT_DOWNLOADS,
+        help="Parallel downloads (default: max_concurrent_downloads from config)",
+    ),
+    refresh: bool = typer.Option(
+        False,
+        "--refresh",
+        "-r",
+        help="Refetch playlists instead of using the cached track lists",
+    ),
 ) -> None:
     """Sync playlists from YouTube Music and download tracks."""
+    # Deferred so 'ymd --help' and other commands skip ytmusicapi
+    from src.core.auth import load_auth
+    from src.providers.youtube import YouTubeProvider
+
     config = load_config()
     download_path = output_dir or config.download_dir
 
@@ -67,19 +94,26 @@ def sync_command(
         print_error(str(e))
         raise typer.Exit(code=1)
 
-    provider = YouTubeProvider(ytmusic)
+    playlist_cache = PlaylistCache()
+    if refresh:
+        playlist_cache.clear()
+    provider = YouTubeProvider(ytmusic, LeakyBucket(config.rate_limit), playlist_cache)
     print_success("Authenticated")
 
     # Determine which playlists to sync
     all_tracks: list[dict[str, str]] = []
     playlist_name = "Liked Songs"
 
-    if liked:
-        all_tracks, playlist_name = _fetch_liked(provider)
-    elif playlist_id:
-        all_tracks = _fetch_by_ids(provider, playlist_id)
-    else:
-        all_tracks, playlist_name = _interactive_select(provider)
+    try:
+        if liked:
+            all_tracks, playlist_name = _fetch_liked(provider)
+        elif playlist_id:
+            all_tracks = _fetch_by_ids(provider, playlist_id)
+        else:
+            all_tracks, playlist_name = _interactive_select(provider)
+    except AuthenticationError as e:
+        print_error(str(e))
+        raise typer.Exit(code=1)
 
     if not all_tracks:
         print_warning("No tracks to download")
@@ -113,48 +147,87 @@ def sync_command(
     downloaded = 0
     failed = 0
     skipped_count = len(all_tracks) - len(tracks_to_download)
+    max_workers = jobs or config.max_concurrent_downloads
+    state_lock = threading.Lock()
+    created_dirs: set[Path] = set()
 
     progress = create_download_progress()
-    with progress:
+    downloader = Downloader(config.audio_format, config.fallback_format)
+    with progress, downloader:
         task_id = progress.add_task(
             "Downloading...",
             total=len(tracks_to_download),
         )
 
-        for track in tracks_to_download:
-            video_id = track.get("video_id", "")
-            artist = track.get("artist", "Unknown")
-            title = track.get("title", "Unknown")
-
-            progress.update(
-                task_id,
-                description=f"{artist} - {title}",
-            )
-
-            if not video_id:
-                logger.warning("Skipping track without video ID: %s", title)
-                failed += 1
-                progress.advance(task_id)
-                continue
+        executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Finished tracks not yet applied to the progress bar
+        unshown = 0
+        try:
+            futures: dict[Future[Path | None], dict[str, str]] = {}
+            for track in tracks_to_download:
+                video_id = track.get("video_id", "")
+                if not video_id:
+                    logger.warning(
+                        "Skipping track without video ID: %s",
+                        track.get("title", "Unknown"),
+                    )
+                    failed += 1
+                    unshown += 1
+                    continue
 
-            try:
-                filepath = _download_and_process(
+                future = executor.submit(
+                    _download_and_process,
                     video_id,
                     temp_dir,
                     download_path,
                     track,
                     config,
+                    downloader,
                     sync_state,
+                    state_lock,
+                    created_dirs,
                 )
-                if filepath:
-                    downloaded += 1
-                else:
+                futures[future] = track
+
+            last_update = 0.0
+            for future in as_completed(futures):
+                track = futures[future]
+
+                try:
+                    if future.result():
+                        downloaded += 1
+                    else:
+                        failed += 1
+                except DownloadError as e:
+                    logger.error("Download failed: %s", e)
+                    failed += 1
+                except Exception:
+                    # One broken track must not end the whole sync
+                    logger.exception(
+                        "Unexpected error processing %s",
+                        track.get("title", "Unknown"),
+                    )
                     failed += 1
-            except DownloadError as e:
-                logger.error("Download failed: %s", e)
-                failed += 1
 
-            progress.advance(task_id)
+                unshown += 1
+                now = time.monotonic()
+                if now - last_update >= PROGRESS_UPDATE_INTERVAL:
+                    artist = track.get("artist", "Unknown")
+                    title = track.get("title", "Unknown")
+                    progress.update(
+                        task_id,
+                        advance=unshown,
+                        description=f"{artist} - {title}",
+                    )
+                    unshown = 0
+                    last_update = now
+
+            if unshown:
+                progress.update(task_id, advance=unshown)
+        finally:
+            # Every future has been collected on success. On an error or
+            # Ctrl-C, drop queued downloads instead of draining them.
+            executor.shutdown(wait=False, cancel_futures=True)
 
     # Save sync state
     sync_state.update_last_sync()
@@ -173,9 +246,11 @@ def sync_command(
 
 
 def _fetch_liked(
-    provider: YouTubeProvider,
+    provider: "YouTubeProvider",
 ) -> tuple[list[dict[str, str]], str]:
     """Fetch and normalize liked songs."""
+    from src.providers.youtube import YouTubeProvider
+
     print_header("Fetching liked songs")
     raw_tracks = provider.get_liked_songs()
     tracks = [YouTubeProvider.normalize_track(t) for t in raw_tracks]
@@ -183,25 +258,57 @@ def _fetch_liked(
     return tracks, "Liked Songs"
 
 
+def _fetch_raw_tracks(
+    provider: "YouTubeProvider",
+    playlist_ids: list[str],
+) -> list[list[dict[str, Any]]]:
+    """Fetch raw tracks for several playlists concurrently.
+
+    Results are returned in the same order as playlist_ids. The
+    LIKED_SONGS_ID sentinel fetches the user's liked songs. A playlist
+    given more than once is fetched once: concurrent fetches of the same
+    ID would all miss the provider's cache.
+    """
+    from src.providers.youtube import MAX_FETCH_WORKERS
+
+    def _fetch_one(pid: str) -> list[dict[str, Any]]:
+        if pid == LIKED_SONGS_ID:
+            return provider.get_liked_songs()
+        return provider.get_playlist_tracks(pid)
+
+    unique_ids = list(dict.fromkeys(playlist_ids))
+    max_workers = max(1, min(MAX_FETCH_WORKERS, len(unique_ids)))
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        fetched = dict(zip(unique_ids, executor.map(_fetch_one, unique_ids)))
+    return [fetched[pid] for pid in playlist_ids]
+
+
 def _fetch_by_ids(
-    provider: YouTubeProvider,
+    provider: "YouTubeProvider",
     playlist_ids: list[str],
 ) -> list[dict[str, str]]:
     """Fetch tracks from specific playlist IDs."""
+    from src.providers.youtube import YouTubeProvider
+
+    print_header(f"Fetching {len(playlist_ids)} playlist(s)")
     all_tracks: list[dict[str, str]] = []
-    for pid in playlist_ids:
-        print_header(f"Fetching playlist {pid}")
-        raw_tracks = provider.get_playlist_tracks(pid)
+    for pid, raw_tracks in zip(
+        playlist_ids, _fetch_raw_tracks(provider, playlist_ids), strict=True
+    ):
         normalized = [YouTubeProvider.normalize_track(t) for t in raw_tracks]
         all_tracks.extend(normalized)
-        print_info(f"Found {len(normalized)} tracks")
+        print_info(f"Found {len(normalized)} tracks in {pid}")
     return all_tracks
 
 
 def _interactive_select(
-    provider: YouTubeProvider,
+    provider: "YouTubeProvider",
 ) -> tuple[list[dict[str, str]], str]:
     """Interactive playlist selection via questionary."""
+    import questionary
+
+    from src.providers.youtube import YouTubeProvider
+
     print_header("Fetching your playlists")
     playlists = provider.get_playlists()
 
@@ -220,7 +327,7 @@ def _interactive_select(
         0,
         questionary.Choice(
             title="Liked Songs",
-            value="__liked__",
+            value=LIKED_SONGS_ID,
         ),
     )
 
@@ -235,19 +342,17 @@ def _interactive_select(
 
     all_tracks: list[dict[str, str]] = []
     playlist_name = "Multiple Playlists"
+    if LIKED_SONGS_ID in selected:
+        playlist_name = "Liked Songs"
 
-    for sel in selected:
-        if sel == "__liked__":
-            print_header("Fetching liked songs")
-            raw_tracks = provider.get_liked_songs()
-            playlist_name = "Liked Songs"
-        else:
-            print_header(f"Fetching playlist {sel}")
-            raw_tracks = provider.get_playlist_tracks(sel)
-
+    print_header(f"Fetching {len(selected)} playlist(s)")
+    for sel, raw_tracks in zip(
+        selected, _fetch_raw_tracks(provider, selected), strict=True
+    ):
         normalized = [YouTubeProvider.normalize_track(t) for t in raw_tracks]
         all_tracks.extend(normalized)
-        print_info(f"Found {len(normalized)} tracks")
+        label = "Liked Songs" if sel == LIKED_SONGS_ID else sel
+        print_info(f"Found {len(normalized)} tracks in {label}")
 
     return all_tracks, playlist_name
 
@@ -258,20 +363,27 @@ def _download_and_process(
     download_path: Path,
     track: dict[str, str],
     config: Any,
+    downloader: Downloader,
     sync_state: SyncState,
+    state_lock: threading.Lock,
+    created_dirs: set[Path],
 ) -> Path | None:
     """Download, tag, organize a single track.
 
+    Runs in a worker thread, so tagging and organizing this track
+    overlap the other workers' downloads. Sync state mutations are
+    guarded by state_lock since SyncState is not thread-safe.
+    created_dirs is shared across workers so each output folder is only
+    created once; a racing duplicate mkdir is harmless because of
+    exist_ok.
+
     Returns the final path on success, None on failure.
     """
+    from src.core.tagger import tag_file
+
     title = track.get("title", "Unknown")
 
-    filepath = download_track(
-        video_id,
-        temp_dir,
-        config.audio_format,
-        config.fallback_format,
-    )
+    filepath = downloader.download(video_id, temp_dir)
 
     if filepath is None:
         return None
@@ -291,16 +403,18 @@ def _download_and_process(
             config.organize_by,
             config.max_filename_length,
             config.default_genre,
+            created_dirs,
         )
     except OrganizationError as e:
         logger.warning("Organization failed for %s: %s", title, e)
         final_path = filepath
 
     # Update sync state
-    sync_state.mark_downloaded(
-        video_id,
-        str(final_path),
-        track,
-    )
+    with state_lock:
+        sync_state.mark_downloaded(
+            video_id,
+            str(final_path),
+            track,
+        )
 
     return final_path
@@ -1,40 +1,57 @@
 """YMD - YouTube Music Downloader CLI."""
 
+import importlib
 import logging
+import sys
+from collections.abc import Iterable
 
 import typer
 
-from src.cli.commands.auth import auth
-from src.cli.commands.clean import clean_command
-from src.cli.commands.config_cmd import config_command
-from src.cli.commands.doctor import doctor_command
-from src.cli.commands.search import search_command
-from src.cli.commands.status import status_command
-from src.cli.commands.sync import sync_command
+# Subcommand name -> (module, callback). Modules are imported only when
+# their command is registered, so 'ymd status' doesn't load sync/search.
+COMMANDS: dict[str, tuple[str, str]] = {
+    "auth": ("src.cli.commands.auth", "auth"),
+    "sync": ("src.cli.commands.sync", "sync_command"),
+    "search": ("src.cli.commands.search", "search_command"),
+    "status": ("src.cli.commands.status", "status_command"),
+    "clean": ("src.cli.commands.clean", "clean_command"),
+    "config": ("src.cli.commands.config_cmd", "config_command"),
+    "doctor": ("src.cli.commands.doctor", "doctor_command"),
+}
 
-app = typer.Typer(
-    name="ymd",
-    help="YMD - Sync and download YouTube Music playlists for your DAP",
-    add_completion=False,
-    no_args_is_help=True,
-)
+# Full app, built on first access (see __getattr__ below)
+app: typer.Typer
+
+# Root options that consume the following argument as their value
+VALUE_OPTIONS = frozenset({"--output"})
 
 
 def _setup_logging(verbose: bool) -> None:
     """Configure logging based on verbosity level.
 
+    Without verbose, INFO and DEBUG are disabled globally so those calls
+    return before a LogRecord is built, and warnings are printed without
+    a timestamp.
+
     Args:
         verbose: If True, set DEBUG level; otherwise WARNING.
     """
-    level = logging.DEBUG if verbose else logging.WARNING
+    if not verbose:
+        logging.disable(logging.INFO)
+        logging.basicConfig(
+            level=logging.WARNING,
+            format="[%(levelname)s] %(name)s: %(message)s",
+        )
+        return
+
+    logging.disable(logging.NOTSET)
     logging.basicConfig(
-        level=level,
+        level=logging.DEBUG,
         format="%(asctime)s [%(levelname)s] %(name)s: %(message)s",
         datefmt="%H:%M:%S",
     )
 
 
-@app.callback()
 def app_callback(
     verbose: bool = typer.Option(
         False,
@@ -42,23 +59,84 @@ def app_callback(
         "-v",
         help="Enable verbose/debug logging output",
     ),
+    output: str = typer.Option(
+        "table",
+        "--output",
+        help="Listing format: table, json or tsv",
+    ),
 ) -> None:
     """YMD - YouTube Music Downloader for DAP devices."""
     _setup_logging(verbose)
 
+    # Deferred to keep importing src.cli.main free of Rich
+    from src.cli.ui import OUTPUT_FORMATS, set_output_format
+
+    if output not in OUTPUT_FORMATS:
+        raise typer.BadParameter(
+            f"must be one of: {', '.join(OUTPUT_FORMATS)}", param_hint="--output"
+        )
+    set_output_format(output)
 
-app.command(name="auth")(auth)
-app.command(name="sync")(sync_command)
-app.command(name="search")(search_command)
-app.command(name="status")(status_command)
-app.command(name="clean")(clean_command)
-app.command(name="config")(config_command)
-app.command(name="doctor")(doctor_command)
+
+def build_app(commands: Iterable[str] = COMMANDS) -> typer.Typer:
+    """Build the Typer app with the given subcommands registered.
+
+    Args:
+        commands: Names from COMMANDS to register, in display order.
+
+    Returns:
+        Configured Typer application.
+    """
+    cli = typer.Typer(
+        name="ymd",
+        help="YMD - Sync and download YouTube Music playlists for your DAP",
+        add_completion=False,
+        no_args_is_help=True,
+    )
+    cli.callback()(app_callback)
+    for name in commands:
+        module_name, attr = COMMANDS[name]
+        module = importlib.import_module(module_name)
+        cli.command(name=name)(getattr(module, attr))
+    return cli
+
+
+def __getattr__(name: str) -> typer.Typer:
+    """Build the full app on first access to src.cli.main.app."""
+    if name == "app":
+        global app
+        app = build_app()
+        return app
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _requested_command(argv: list[str]) -> str | None:
+    """Return the subcommand named on the command line, if any.
+
+    The first argument that is neither an option nor the value of one
+    of the root VALUE_OPTIONS (e.g. "json" in "--output json") is the
+    subcommand.
+    """
+    args = iter(argv)
+    for arg in args:
+        if arg in VALUE_OPTIONS:
+            next(args, None)
+        elif not arg.startswith("-"):
+            return arg
+    return None
 
 
 def main() -> None:
-    """Entry point for the CLI."""
-    app()
+    """Entry point for the CLI.
+
+    Only the invoked subcommand is imported; '--help', no arguments or
+    an unknown command fall back to the full app.
+    """
+    command = _requested_command(sys.argv[1:])
+    if command in COMMANDS:
+        build_app([command])()
+    else:
+        build_app()()
 
 
 if __name__ == "__main__":
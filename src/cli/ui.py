@@ -1,7 +1,11 @@
 """CLI UI components - Rich-based, pacman-inspired interface."""
 
+import sys
 from typing import Any
 
+import orjson
+from rich import box
+from rich.cells import cell_len
 from rich.console import Console
 from rich.progress import (
     BarColumn,
@@ -10,50 +14,153 @@ from rich.progress import (
     TextColumn,
     TimeRemainingColumn,
 )
+from rich.style import Style
 from rich.table import Table
+from rich.text import Text
 from rich.theme import Theme
 
-# Pacman-inspired theme
+# Pacman-inspired theme. Styles are built directly rather than parsed
+# from strings; Rich's defaults are inherited for progress and table
+# styles.
 ymd_theme = Theme(
     {
-        "info": "bold cyan",
-        "warning": "bold yellow",
-        "error": "bold red",
-        "success": "bold green",
-        "header": "bold white",
-        "dim": "dim",
-        "track.artist": "cyan",
-        "track.title": "white",
-        "track.album": "yellow",
+        "info": Style(color="cyan", bold=True),
+        "warning": Style(color="yellow", bold=True),
+        "error": Style(color="red", bold=True),
+        "success": Style(color="green", bold=True),
+        "header": Style(color="white", bold=True),
+        "dim": Style(dim=True),
+        "track.artist": Style(color="cyan"),
+        "track.title": Style(color="white"),
+        "track.album": Style(color="yellow"),
     }
 )
 
-console = Console(theme=ymd_theme)
+# Shared by every module that prints, built on first access (see
+# __getattr__ below). Output is plain text with explicit markup, so
+# Rich's repr highlighter and emoji codes are disabled.
+console: Console
+_console: Console | None = None
+
+# Live progress redraw rate; Rich defaults to 10Hz
+PROGRESS_REFRESH_PER_SECOND = 4
+PROGRESS_REFRESH_PER_SECOND_NON_TTY = 1
+
+# show_all track tables longer than this are printed in fixed-width
+# chunks, since Rich measures every cell before laying out a table
+TRACK_TABLE_CHUNK_THRESHOLD = 200
+TRACK_TABLE_CHUNK_SIZE = 100
+ALBUM_COLUMN_MAX_WIDTH = 30
+
+# Formats accepted by the root --output option. "json" and "tsv" write
+# listings straight to stdout, skipping Rich, and move everything the
+# console prints (headers, progress, messages) to stderr.
+OUTPUT_FORMATS = ("table", "json", "tsv")
+_output_format = "table"
+
+# Fields written per row in TSV listings
+TRACK_TSV_FIELDS = ("artist", "title", "album", "video_id")
+PLAYLIST_TSV_FIELDS = ("title", "count", "playlistId")
+SYNCED_PLAYLIST_TSV_FIELDS = ("playlist_id", "name", "track_count", "last_sync")
+
+
+def _get_console() -> Console:
+    """Return the shared console, building it on first use.
+
+    A console patched onto the module (as tests do) takes precedence.
+    With a machine --output format the console writes to stderr, so
+    stdout carries only the listing.
+    """
+    global _console
+    patched: Console | None = globals().get("console")
+    if patched is not None:
+        return patched
+    if _console is None:
+        _console = Console(
+            theme=ymd_theme,
+            highlight=False,
+            emoji=False,
+            stderr=_output_format != "table",
+        )
+    return _console
+
+
+def __getattr__(name: str) -> Console:
+    """Build the shared console on first access to src.cli.ui.console."""
+    if name == "console":
+        return _get_console()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def set_output_format(fmt: str) -> None:
+    """Select how track and playlist listings are printed.
+
+    Args:
+        fmt: One of OUTPUT_FORMATS.
+    """
+    global _output_format
+    _output_format = fmt
+    # Rich picks stdout or stderr per write, so an already built
+    # console can be switched in place
+    if _console is not None:
+        _console.stderr = fmt != "table"
+
+
+def is_machine_output() -> bool:
+    """Return True if listings are written as JSON or TSV."""
+    return _output_format != "table"
+
+
+def _write_records(records: list[dict[str, Any]], fields: tuple[str, ...]) -> bool:
+    """Write records as JSON or TSV if a machine format is selected.
+
+    Returns:
+        True if the records were written, False for table output.
+    """
+    if _output_format == "json":
+        sys.stdout.write(orjson.dumps(records).decode() + "\n")
+        return True
+    if _output_format == "tsv":
+        sys.stdout.writelines(
+            "\t".join(_tsv_cell(record.get(field, "")) for field in fields) + "\n"
+            for record in records
+        )
+        return True
+    return False
+
+
+def _tsv_cell(value: Any) -> str:
+    """Collapse whitespace so tabs or newlines can't break the TSV layout."""
+    return " ".join(str(value).split())
+
+
+# The print_* helpers build styled Text directly: no markup is parsed
+# per call, and brackets in track titles or paths print literally.
 
 
 def print_header(message: str) -> None:
     """Print a pacman-style section header."""
-    console.print(f"\n[info]:: {message}[/info]")
+    _get_console().print(Text(f"\n:: {message}", style="info"))
 
 
 def print_success(message: str) -> None:
     """Print a success message."""
-    console.print(f"[success] -> {message}[/success]")
+    _get_console().print(Text(f" -> {message}", style="success"))
 
 
 def print_warning(message: str) -> None:
     """Print a warning message."""
-    console.print(f"[warning] -> {message}[/warning]")
+    _get_console().print(Text(f" -> {message}", style="warning"))
 
 
 def print_error(message: str) -> None:
     """Print an error message."""
-    console.print(f"[error]error: {message}[/error]")
+    _get_console().print(Text(f"error: {message}", style="error"))
 
 
 def print_info(message: str) -> None:
     """Print an info message."""
-    console.print(f"[dim] -> {message}[/dim]")
+    _get_console().print(Text(f" -> {message}", style="dim"))
 
 
 def print_track_table(
@@ -66,11 +173,19 @@ def print_track_table(
     Args:
         tracks: List of normalized track dicts.
         title: Table title.
-        show_all: Show all tracks or limit to 20.
+        show_all: Show all tracks or limit to 20. JSON and TSV output
+            always include every track.
     """
+    if _write_records(tracks, TRACK_TSV_FIELDS):
+        return
+
     display_tracks = tracks if show_all else tracks[:20]
     total = len(tracks)
 
+    if show_all and total > TRACK_TABLE_CHUNK_THRESHOLD:
+        _print_track_table_chunked(tracks, title)
+        return
+
     table = Table(
         title=f"{title} ({total} tracks)",
         show_lines=False,
@@ -79,26 +194,80 @@ def print_track_table(
     table.add_column("#", style="dim", width=4)
     table.add_column("Artist", style="track.artist")
     table.add_column("Title", style="track.title")
-    table.add_column("Album", style="track.album", max_width=30)
+    table.add_column("Album", style="track.album", max_width=ALBUM_COLUMN_MAX_WIDTH)
 
+    # Bound once outside the loop; this runs per row on large libraries.
+    add_row = table.add_row
+    get = dict.get
     for i, track in enumerate(display_tracks, 1):
-        table.add_row(
+        add_row(
             str(i),
-            track.get("artist", "Unknown"),
-            track.get("title", "Unknown"),
-            track.get("album", ""),
+            get(track, "artist", "Unknown"),
+            get(track, "title", "Unknown"),
+            get(track, "album", ""),
         )
 
-    console.print(table)
+    _get_console().print(table)
 
     if not show_all and total > 20:
-        console.print(f"[dim]  ... and {total - 20} more tracks[/dim]")
+        _get_console().print(f"[dim]  ... and {total - 20} more tracks[/dim]")
+
+
+def _print_track_table_chunked(tracks: list[dict[str, str]], title: str) -> None:
+    """Print a long track table as a series of fixed-width tables.
+
+    Column widths are measured once up front so every chunk lines up
+    and Rich skips its per-table measuring pass. Only the first chunk
+    has a title and header; chunks are borderless so they read as one
+    table.
+    """
+    total = len(tracks)
+    get = dict.get
+    rows = [
+        (
+            str(i),
+            get(track, "artist", "Unknown"),
+            get(track, "title", "Unknown"),
+            get(track, "album", ""),
+        )
+        for i, track in enumerate(tracks, 1)
+    ]
+    num_width = max(4, len(str(total)))
+    artist_width = max(cell_len("Artist"), *(cell_len(r[1]) for r in rows))
+    title_width = max(cell_len("Title"), *(cell_len(r[2]) for r in rows))
+    album_width = min(
+        ALBUM_COLUMN_MAX_WIDTH,
+        max(cell_len("Album"), *(cell_len(r[3]) for r in rows)),
+    )
+
+    for start in range(0, total, TRACK_TABLE_CHUNK_SIZE):
+        first = start == 0
+        table = Table(
+            title=f"{title} ({total} tracks)" if first else None,
+            show_header=first,
+            show_edge=False,
+            box=box.SIMPLE,
+            border_style="dim",
+        )
+        table.add_column("#", style="dim", width=num_width)
+        table.add_column("Artist", style="track.artist", width=artist_width)
+        table.add_column("Title", style="track.title", width=title_width)
+        table.add_column("Album", style="track.album", width=album_width, no_wrap=True)
+
+        add_row = table.add_row
+        for row in rows[start : start + TRACK_TABLE_CHUNK_SIZE]:
+            add_row(*row)
+
+        _get_console().print(table)
 
 
 def print_playlist_table(
     playlists: list[dict[str, Any]],
 ) -> None:
     """Display playlists in a table."""
+    if _write_records(playlists, PLAYLIST_TSV_FIELDS):
+        return
+
     table = Table(
         title="Your Playlists",
         show_lines=False,
@@ -117,11 +286,48 @@ def print_playlist_table(
             pl.get("playlistId", ""),
         )
 
-    console.print(table)
+    _get_console().print(table)
+
+
+def print_synced_playlists(playlists: dict[str, Any]) -> None:
+    """Display playlists recorded in the sync state.
+
+    Args:
+        playlists: Playlist ID -> info dict with name, track_count and
+            last_sync, as kept by SyncState.
+    """
+    records = [{"playlist_id": pid, **info} for pid, info in playlists.items()]
+    if _write_records(records, SYNCED_PLAYLIST_TSV_FIELDS):
+        return
+    if not records:
+        return
+
+    console = _get_console()
+    console.print("\n  [bold]Synced Playlists:[/bold]")
+    for record in records:
+        name = record.get("name", record["playlist_id"])
+        count = record.get("track_count", "?")
+        last = record.get("last_sync", "unknown")
+        console.print(f"    {name}: {count} tracks (synced: {last})")
 
 
 def create_download_progress() -> Progress:
-    """Create a pacman-inspired download progress bar."""
+    """Create a pacman-inspired download progress bar.
+
+    When output isn't a terminal (piped, CI logs) the spinner, bar and
+    ETA are dropped and redraws slow to once a second, since nothing
+    animates there anyway.
+    """
+    console = _get_console()
+    if not console.is_terminal:
+        return Progress(
+            TextColumn("{task.description}"),
+            TextColumn("{task.percentage:>3.0f}%"),
+            TextColumn("{task.completed}/{task.total}"),
+            console=console,
+            refresh_per_second=PROGRESS_REFRESH_PER_SECOND_NON_TTY,
+        )
+
     return Progress(
         SpinnerColumn(),
         TextColumn("[bold]{task.description}"),
@@ -134,12 +340,13 @@ def create_download_progress() -> Progress:
         TextColumn("[dim]{task.completed}/{task.total}"),
         TimeRemainingColumn(),
         console=console,
+        refresh_per_second=PROGRESS_REFRESH_PER_SECOND,
     )
 
 
 def confirm_action(message: str) -> bool:
     """Ask user to confirm an action."""
-    response = console.input(f"\n[warning]:: {message} [Y/n] [/warning]")
+    response = _get_console().input(f"\n[warning]:: {message} [Y/n] [/warning]")
     return response.strip().lower() in ("", "y", "yes")
 
 
@@ -149,12 +356,13 @@ def print_sync_summary(
     skipped: int,
     failed: int,
 ) -> None:
-    """Print a summary after sync operation."""
-    console.print("\n[header]:: Sync Summary[/header]")
-    console.print(f"   Total tracks:      {total}")
-    console.print(f"   [success]Downloaded:        {downloaded}[/success]")
+    """Print a summary after sync operation, as a single write."""
+    summary = Text()
+    summary.append("\n:: Sync Summary\n", style="header")
+    summary.append(f"   Total tracks:      {total}\n")
+    summary.append(f"   Downloaded:        {downloaded}\n", style="success")
     if skipped > 0:
-        console.print(f"   [dim]Already synced:     {skipped}[/dim]")
+        summary.append(f"   Already synced:    {skipped}\n", style="dim")
     if failed > 0:
-        console.print(f"   [error]Failed:            {failed}[/error]")
-    console.print()
+        summary.append(f"   Failed:            {failed}\n", style="error")
+    _get_console().print(summary)
@@ -1,17 +1,24 @@
 """YouTube Music OAuth authentication module."""
 
-from pathlib import Path
+import functools
+import time
 
-from rich.console import Console
+import orjson
 from ytmusicapi import OAuthCredentials, YTMusic
 from ytmusicapi import setup_oauth as ytmusicapi_setup_oauth
 
-from src.core.config import load_config
+from src.core.config import OAUTH_FILE, load_config
 from src.core.exceptions import AuthenticationError
 
-console = Console()
+__all__ = ["OAUTH_FILE", "clear_auth_cache", "load_auth", "setup_auth"]
 
-OAUTH_FILE = Path("oauth.json")
+# Refresh the access token up front when it expires within this many
+# seconds, rather than letting the first API request trigger it.
+TOKEN_REFRESH_BUFFER = 300
+
+# Authenticated client reused within a process, keyed on the token
+# file's path and mtime so a re-auth on disk invalidates it.
+_ytmusic_cache: tuple[tuple[str, int], YTMusic] | None = None
 
 
 def _validate_credentials() -> tuple[str, str]:
@@ -49,100 +56,139 @@ def _get_oauth_credentials() -> OAuthCredentials:
         AuthenticationError: If client_id or client_secret are not configured.
     """
     client_id, client_secret = _validate_credentials()
+    return _build_oauth_credentials(client_id, client_secret)
+
+
+@functools.lru_cache(maxsize=1)
+def _build_oauth_credentials(client_id: str, client_secret: str) -> OAuthCredentials:
+    """Build OAuthCredentials, reusing the last one while the pair is unchanged."""
     return OAuthCredentials(
         client_id=client_id,
         client_secret=client_secret,
     )
 
 
-def setup_auth() -> bool:
+def setup_auth() -> None:
     """
     Interactive OAuth authentication setup for YouTube Music.
 
-    Uses ytmusicapi's OAuth flow with custom client credentials.
-    Opens a browser for Google account authorization.
+    Uses ytmusicapi's OAuth flow with custom client credentials and
+    saves the token to OAUTH_FILE. The device-code prompts come from
+    ytmusicapi; everything else is reported by the caller.
 
-    Returns:
-        True if authentication was successful.
+    Raises:
+        AuthenticationError: If credentials are missing or the flow fails.
     """
-    console.print("\n[bold cyan]:: YouTube Music OAuth Setup[/bold cyan]\n")
-
-    try:
-        client_id, client_secret = _validate_credentials()
-    except AuthenticationError as e:
-        console.print(f"[red]{e}[/red]")
-        return False
-
-    console.print("This will start a device-code authentication flow.")
-    console.print(
-        "Follow the prompts to grant access to your " "YouTube Music library.\n"
-    )
+    oauth_credentials = _get_oauth_credentials()
 
+    # The token exchange in setup_oauth is the validation; a rejected
+    # grant later surfaces from the first provider call instead.
     try:
-        # setup_oauth takes client_id and client_secret as direct strings
-        # (it constructs OAuthCredentials internally)
+        OAUTH_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # setup_oauth only takes client_id and client_secret as strings
         ytmusicapi_setup_oauth(
-            client_id=client_id,
-            client_secret=client_secret,
+            client_id=oauth_credentials.client_id,
+            client_secret=oauth_credentials.client_secret,
             filepath=str(OAUTH_FILE),
             open_browser=True,
         )
+    except Exception as e:
+        raise AuthenticationError(f"Authentication failed: {e}") from e
 
-        # Validate the new credentials
-        # YTMusic() accepts OAuthCredentials object
-        oauth_credentials = OAuthCredentials(
-            client_id=client_id,
-            client_secret=client_secret,
-        )
-        ytmusic = YTMusic(
-            str(OAUTH_FILE),
-            oauth_credentials=oauth_credentials,
-        )
-        ytmusic.get_library_playlists(limit=1)
+    clear_auth_cache()
+
+
+def _refresh_token_if_expiring(oauth_credentials: OAuthCredentials) -> None:
+    """Refresh the stored access token if it is expired or about to expire.
+
+    The refreshed token is written back to OAUTH_FILE atomically.
+    Files without an expires_at field, or that can't be parsed, are
+    left for YTMusic to handle.
+
+    Args:
+        oauth_credentials: Client credentials used for the refresh request.
 
-        console.print("[green]Authentication successful![/green]")
-        console.print(f"[dim]Credentials saved to {OAUTH_FILE}[/dim]")
-        return True
+    Raises:
+        AuthenticationError: If the refresh request fails.
+    """
+    try:
+        data = orjson.loads(OAUTH_FILE.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        return
 
+    expires_at = data.get("expires_at")
+    refresh_token = data.get("refresh_token")
+    if not isinstance(expires_at, int | float) or not refresh_token:
+        return
+    if expires_at - time.time() > TOKEN_REFRESH_BUFFER:
+        return
+
+    try:
+        fresh = oauth_credentials.refresh_token(refresh_token)
     except Exception as e:
-        console.print(f"[red]Authentication failed:[/red] {e}")
-        console.print("\n[yellow]Tips:[/yellow]")
-        console.print("  - Ensure client_id and client_secret are correct")
-        console.print(
-            "  - The OAuth app type must be " "'TVs and Limited Input devices'"
-        )
-        console.print(
-            "  - YouTube Data API v3 must be enabled " "in your Google Cloud project"
-        )
-        console.print("  - Make sure you're logged into your Google account")
-        return False
+        raise AuthenticationError(
+            f"Failed to refresh OAuth token: {e}. "
+            "Run 'ymd auth' to re-authenticate."
+        ) from e
+
+    data["access_token"] = fresh["access_token"]
+    data["expires_at"] = int(time.time()) + fresh["expires_in"]
+    # Written to a temp sibling and renamed into place: oauth.json is the
+    # only copy of the refresh token, so a torn write must not replace it
+    tmp_file = OAUTH_FILE.with_name(OAUTH_FILE.name + ".tmp")
+    tmp_file.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
+    tmp_file.replace(OAUTH_FILE)
+
+
+def clear_auth_cache() -> None:
+    """Drop the cached YTMusic client and OAuthCredentials.
+
+    The next load_auth() rebuilds both.
+    """
+    global _ytmusic_cache
+    _ytmusic_cache = None
+    _build_oauth_credentials.cache_clear()
 
 
 def load_auth() -> YTMusic:
     """
     Load saved OAuth credentials and create YTMusic client.
 
+    The client is cached per process and stays in use until oauth.json
+    changes on disk, e.g. after 'ymd auth' saves a new token. An access
+    token close to expiry is refreshed before the client is built. No
+    request is made to validate the credentials; a rejected token
+    surfaces as AuthenticationError from the first YouTubeProvider call.
+
     Returns:
         Authenticated YTMusic instance.
 
     Raises:
         AuthenticationError: If credentials don't exist or are invalid.
     """
+    global _ytmusic_cache
+
     if not OAUTH_FILE.exists():
         raise AuthenticationError("Not authenticated. Run 'ymd auth' first.")
 
+    cache_key = (str(OAUTH_FILE), OAUTH_FILE.stat().st_mtime_ns)
+    if _ytmusic_cache is not None and _ytmusic_cache[0] == cache_key:
+        return _ytmusic_cache[1]
+
     oauth_credentials = _get_oauth_credentials()
+    _refresh_token_if_expiring(oauth_credentials)
+    cache_key = (str(OAUTH_FILE), OAUTH_FILE.stat().st_mtime_ns)
 
     try:
         ytmusic = YTMusic(
             str(OAUTH_FILE),
             oauth_credentials=oauth_credentials,
         )
-        # Validate with a simple request
-        ytmusic.get_library_playlists(limit=1)
-        return ytmusic
     except Exception as e:
         raise AuthenticationError(
             f"Stored credentials are invalid: {e}. "
             "Run 'ymd auth' to re-authenticate."
         ) from e
+
+    _ytmusic_cache = (cache_key, ytmusic)
+    return ytmusic
@@ -0,0 +1,114 @@
+"""On-disk cache of fetched playlist track lists."""
+
+import hashlib
+import logging
+import os
+import time
+from pathlib import Path
+from typing import Any
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# Per-user cache directory: $XDG_CACHE_HOME/ymd, or ~/.cache/ymd
+CACHE_DIR = (
+    Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "ymd"
+).resolve()
+
+# Seconds a cached playlist is served before it's fetched again
+PLAYLIST_CACHE_TTL = 3600.0
+
+# Most playlists kept on disk; the least recently used are evicted
+MAX_CACHED_PLAYLISTS = 64
+
+
+class PlaylistCache:
+    """Best-effort disk cache of raw playlist tracks, keyed by playlist ID.
+
+    Each entry is one JSON file holding the fetch time and the tracks.
+    Entries older than ttl are treated as missing. A file's mtime marks
+    its last use, so eviction beyond max_entries drops the least recently
+    used. Cache I/O errors are logged and treated as a miss, never raised:
+    a broken cache must not fail a sync.
+
+    Args:
+        cache_dir: Directory holding the entries; created on first write.
+        ttl: Seconds an entry stays fresh.
+        max_entries: Entries kept before the oldest are evicted.
+    """
+
+    def __init__(
+        self,
+        cache_dir: Path = CACHE_DIR / "playlists",
+        ttl: float = PLAYLIST_CACHE_TTL,
+        max_entries: int = MAX_CACHED_PLAYLISTS,
+    ) -> None:
+        self._dir = cache_dir
+        self._ttl = ttl
+        self._max_entries = max_entries
+
+    def _path(self, key: str) -> Path:
+        """Return the entry file for key; hashed so any ID is a safe name."""
+        digest = hashlib.sha1(key.encode(), usedforsecurity=False).hexdigest()
+        return self._dir / f"{digest}.json"
+
+    def get(self, key: str) -> list[dict[str, Any]] | None:
+        """
+        Return the cached tracks for key, if present and fresh.
+
+        Args:
+            key: Playlist ID.
+
+        Returns:
+            The cached track list, or None on a miss.
+        """
+        path = self._path(key)
+        try:
+            entry = orjson.loads(path.read_bytes())
+            if time.time() - entry["fetched_at"] > self._ttl:
+                path.unlink(missing_ok=True)
+                return None
+            tracks: list[dict[str, Any]] = entry["tracks"]
+            os.utime(path)
+        except FileNotFoundError:
+            return None
+        except (OSError, orjson.JSONDecodeError, KeyError, TypeError) as e:
+            logger.warning("Ignoring unreadable playlist cache %s: %s", path, e)
+            return None
+        logger.debug("Playlist cache hit for %s", key)
+        return tracks
+
+    def set(self, key: str, tracks: list[dict[str, Any]]) -> None:
+        """
+        Store the tracks fetched for key.
+
+        Args:
+            key: Playlist ID.
+            tracks: Raw tracks as returned by the API.
+        """
+        path = self._path(key)
+        tmp_path = path.with_name(path.name + ".tmp")
+        try:
+            self._dir.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(
+                orjson.dumps({"fetched_at": time.time(), "tracks": tracks})
+            )
+            tmp_path.replace(path)
+            self._evict()
+        except (OSError, TypeError) as e:
+            logger.warning("Could not write playlist cache %s: %s", path, e)
+
+    def _evict(self) -> None:
+        """Delete the least recently used entries beyond max_entries."""
+        entries = list(self._dir.glob("*.json"))
+        if len(entries) <= self._max_entries:
+            return
+        by_age = sorted(entries, key=lambda p: p.stat().st_mtime)
+        for path in by_age[: len(entries) - self._max_entries]:
+            path.unlink(missing_ok=True)
+
+    def clear(self) -> None:
+        """Delete every cached entry."""
+        for path in self._dir.glob("*.json"):
+            path.unlink(missing_ok=True)
@@ -1,20 +1,67 @@
 """Application configuration with Pydantic validation."""
 
-import json
 import os
+from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+import orjson
 from pydantic import BaseModel, Field, field_validator
 
 from src.core.exceptions import ConfigError
 
-CONFIG_FILE = Path("config.json")
-CONFIG_EXAMPLE = Path("config.example.json")
+# Per-user settings directory: $XDG_CONFIG_HOME/ymd, or ~/.config/ymd
+CONFIG_DIR = (
+    Path(os.environ.get("XDG_CONFIG_HOME") or Path.home() / ".config") / "ymd"
+).resolve()
+
+
+# Per-user files; they always live together in one directory
+APP_FILES = ("config.json", "oauth.json")
+
+
+def app_dir() -> Path:
+    """Return the directory holding config.json and oauth.json.
+
+    The working directory (the original layout) is used when it already
+    has either file, so an existing setup keeps working and the pair is
+    never split across locations; otherwise CONFIG_DIR.
+
+    Returns:
+        Resolved directory, which may not exist yet.
+    """
+    cwd = Path.cwd().resolve()
+    if any((cwd / name).exists() for name in APP_FILES):
+        return cwd
+    return CONFIG_DIR
+
+
+# Resolved once at import so later cwd changes don't move them
+APP_DIR = app_dir()
+CONFIG_FILE = APP_DIR / "config.json"
+OAUTH_FILE = APP_DIR / "oauth.json"
 
 VALID_AUDIO_FORMATS = {"best", "mp3", "m4a", "opus"}
 VALID_ORGANIZE_BY = {"genre_artist", "artist_album", "playlist"}
 
+# Upper bound for max_concurrent_downloads and 'ymd sync --jobs'
+MAX_CONCURRENT_DOWNLOADS = 16
+
+# Last loaded config, keyed on the file's path, mtime and size plus the
+# env overrides, so repeat loads within a process skip parsing and
+# validation until something it depends on changes.
+_ConfigCacheKey = tuple[str, int, int, str | None, str | None]
+_config_cache: tuple[_ConfigCacheKey, "AppConfig"] | None = None
+
+# Bytes most recently written by save() for each path, with the model they
+# were dumped from. A load that reads back exactly these bytes is trusted
+# and rebuilt with model_construct instead of re-running validation.
+_saved_configs: dict[str, tuple[bytes, "AppConfig"]] = {}
+
+# Read-only snapshot handed out by load_config, paired with the cached
+# AppConfig it was built from.
+_fast_config_cache: tuple["AppConfig", "FastConfig"] | None = None
+
 
 class AppConfig(BaseModel):
     """Application configuration model."""
@@ -44,7 +91,13 @@ class AppConfig(BaseModel):
         default=3,
         description="Max parallel downloads",
         gt=0,
-        le=10,
+        le=MAX_CONCURRENT_DOWNLOADS,
+    )
+    rate_limit: float = Field(
+        default=5.0,
+        description="Max YouTube Music API requests per second",
+        gt=0,
+        le=50,
     )
     default_genre: str = Field(
         default="Unknown",
@@ -91,6 +144,10 @@ class AppConfig(BaseModel):
     def save(self, path: Path | None = None) -> None:
         """Save configuration to JSON file.
 
+        The file is left untouched when its content wouldn't change.
+        Otherwise it is written to a temp sibling and renamed into
+        place, so an interrupted save never leaves a truncated config.
+
         Note: client_id and client_secret are saved to the file.
         For better security, consider using YMD_CLIENT_ID and
         YMD_CLIENT_SECRET environment variables instead.
@@ -99,7 +156,23 @@ class AppConfig(BaseModel):
         data = self.model_dump(mode="json")
         # Convert Path to string for JSON serialization
         data["download_dir"] = str(data["download_dir"])
-        target.write_text(json.dumps(data, indent=2) + "\n")
+        content = orjson.dumps(
+            data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE
+        )
+
+        _saved_configs[str(target)] = (content, self.model_copy())
+
+        try:
+            if target.read_bytes() == content:
+                return
+        except FileNotFoundError:
+            pass
+
+        target.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = target.with_name(target.name + ".tmp")
+        tmp_file.write_bytes(content)
+        tmp_file.replace(target)
+        clear_config_cache()
 
     @classmethod
     def load(cls, path: Path | None = None) -> "AppConfig":
@@ -109,37 +182,106 @@ class AppConfig(BaseModel):
         - YMD_CLIENT_ID overrides client_id
         - YMD_CLIENT_SECRET overrides client_secret
 
+        The result is cached and returned again while the file and the
+        env overrides are unchanged, so callers must treat it as
+        read-only.
+
         Returns:
             Loaded AppConfig instance.
 
         Raises:
             ConfigError: If config file contains invalid values.
         """
-        target = path or CONFIG_FILE
-        data: dict[str, Any] = {}
-        if target.exists():
-            try:
-                data = json.loads(target.read_text())
-            except json.JSONDecodeError as e:
-                raise ConfigError(f"Invalid JSON in {target}: {e}") from e
+        global _config_cache
 
-        # Environment variables override config file for secrets
+        target = path or CONFIG_FILE
         env_client_id = os.environ.get("YMD_CLIENT_ID")
         env_client_secret = os.environ.get("YMD_CLIENT_SECRET")
+
+        try:
+            stat = target.stat()
+            mtime_ns, size = stat.st_mtime_ns, stat.st_size
+        except FileNotFoundError:
+            mtime_ns, size = -1, -1
+        cache_key = (str(target), mtime_ns, size, env_client_id, env_client_secret)
+        if _config_cache is not None and _config_cache[0] == cache_key:
+            return _config_cache[1]
+
+        raw = target.read_bytes() if mtime_ns != -1 else b""
+
+        # Environment variables override config file for secrets
+        overrides: dict[str, Any] = {}
         if env_client_id:
-            data["client_id"] = env_client_id
+            overrides["client_id"] = env_client_id
         if env_client_secret:
-            data["client_secret"] = env_client_secret
+            overrides["client_secret"] = env_client_secret
 
-        try:
-            return cls(**data)
-        except Exception as e:
-            raise ConfigError(f"Invalid configuration: {e}") from e
+        saved = _saved_configs.get(str(target))
+        if saved is not None and saved[0] == raw:
+            # Written by save() from an already validated model; the env
+            # overrides are plain strings, so nothing needs coercing.
+            config = cls.model_construct(**{**dict(saved[1]), **overrides})
+        else:
+            data: dict[str, Any] = {}
+            if mtime_ns != -1:
+                try:
+                    data = orjson.loads(raw)
+                except orjson.JSONDecodeError as e:
+                    raise ConfigError(f"Invalid JSON in {target}: {e}") from e
+            data.update(overrides)
+
+            try:
+                config = cls(**data)
+            except Exception as e:
+                raise ConfigError(f"Invalid configuration: {e}") from e
+
+        _config_cache = (cache_key, config)
+        return config
+
+
+@dataclass(slots=True, frozen=True)
+class FastConfig:
+    """Immutable, validated snapshot of AppConfig for read-only callers.
+
+    Has the same fields as AppConfig without Pydantic's per-instance
+    bookkeeping. Use AppConfig.load when the config is to be edited or
+    saved.
+    """
+
+    download_dir: Path
+    audio_format: str
+    fallback_format: str
+    organize_by: str
+    max_filename_length: int
+    max_concurrent_downloads: int
+    rate_limit: float
+    default_genre: str
+    client_id: str
+    client_secret: str
+
+
+def clear_config_cache() -> None:
+    """Drop the cached config so the next load re-reads the file."""
+    global _config_cache, _fast_config_cache
+    _config_cache = None
+    _fast_config_cache = None
+
+
+def load_config(path: Path | None = None) -> FastConfig:
+    """Load application config as a read-only FastConfig.
+
+    Validation goes through AppConfig.load; the snapshot is rebuilt only
+    when that returns a different instance.
+    """
+    global _fast_config_cache
 
+    config = AppConfig.load(path)
+    if _fast_config_cache is not None and _fast_config_cache[0] is config:
+        return _fast_config_cache[1]
 
-def load_config(path: Path | None = None) -> AppConfig:
-    """Load application config. Creates default if missing."""
-    return AppConfig.load(path)
+    fast = FastConfig(**dict(config))
+    _fast_config_cache = (config, fast)
+    return fast
 
 
 def save_config(config: AppConfig, path: Path | None = None) -> None:
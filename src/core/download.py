@@ -1,27 +1,45 @@
 """Download engine using yt-dlp for audio extraction."""
 
 import logging
+import random
+import re
+import threading
 import time
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from email.utils import parsedate_to_datetime
 from pathlib import Path
 from typing import Any
 
 from src.core.exceptions import DownloadError
+from src.core.rate_limit import ThrottleController
 
 logger = logging.getLogger(__name__)
 
 # yt-dlp format selection:
 # Best audio quality available, prefer m4a/opus containers
 BEST_AUDIO_FORMAT = "bestaudio[ext=m4a]/bestaudio[ext=webm]/bestaudio"
-MP3_POSTPROCESS = {
-    "key": "FFmpegExtractAudio",
-    "preferredcodec": "mp3",
-    "preferredquality": "320",
-}
+# Containers DAPs play natively; with audio_format "best" a download
+# already in one is kept as-is instead of being re-encoded
+DAP_AUDIO_EXTS = ("m4a", "mp3")
+# Bitrate (kbps) used when audio does have to be re-encoded
+TRANSCODE_QUALITY = "320"
 
 # Retry configuration
 MAX_RETRIES = 3
-RETRY_BACKOFF_BASE = 2  # seconds: 2, 4, 8
+RETRY_BACKOFF_BASE = 2  # seconds: 2, 4, 8 before jitter
+MAX_BACKOFF = 30  # seconds, cap on any retry delay
+
+# A server-requested wait quoted in an error message, e.g. "Retry-After: 12"
+_RETRY_AFTER_RE = re.compile(r"retry[- ]after[:\s]+(\d+)", re.IGNORECASE)
+
+# Markers of the server throttling us, as opposed to other failures
+_THROTTLED_RE = re.compile(r"429|too many requests|rate limit", re.IGNORECASE)
+
+# Markers of a transient failure (network, throttling) in an error message
+_RETRYABLE_RE = re.compile(
+    r"403|429|http error|connection|timeout|network|temporary|unavailable"
+    r"|rate limit",
+    re.IGNORECASE,
+)
 
 
 def _build_yt_dlp_opts(
@@ -52,6 +70,7 @@ def _build_yt_dlp_opts(
         "extract_flat": False,
         "writethumbnail": True,
         "postprocessors": [
+            _audio_postprocessor(audio_format, fallback_format),
             {
                 "key": "FFmpegMetadata",
             },
@@ -61,13 +80,39 @@ def _build_yt_dlp_opts(
         ],
     }
 
-    # If user wants mp3 specifically or as fallback
-    if audio_format == "mp3" or fallback_format == "mp3":
-        opts["postprocessors"].insert(0, MP3_POSTPROCESS)
-
     return opts
 
 
+def _audio_postprocessor(audio_format: str, fallback_format: str) -> dict[str, Any]:
+    """
+    Build the FFmpegExtractAudio step for the requested format.
+
+    A specific format converts every download to it; FFmpeg copies the
+    stream when the codec already matches (AAC into .m4a, Opus into
+    .opus), so only a real codec change is re-encoded. "best" keeps
+    downloads already in a DAP_AUDIO_EXTS container and converts the
+    rest (e.g. webm/opus) to fallback_format, using yt-dlp's
+    "source>target" mapping syntax.
+
+    Args:
+        audio_format: Preferred format (best, mp3, m4a, opus).
+        fallback_format: Target for "best" downloads a DAP can't play.
+
+    Returns:
+        yt-dlp postprocessor options.
+    """
+    if audio_format == "best":
+        keep = "/".join(f"{ext}>{ext}" for ext in DAP_AUDIO_EXTS)
+        codec = f"{keep}/{fallback_format}"
+    else:
+        codec = audio_format
+    return {
+        "key": "FFmpegExtractAudio",
+        "preferredcodec": codec,
+        "preferredquality": TRANSCODE_QUALITY,
+    }
+
+
 def _is_retryable_error(error: Exception) -> bool:
     """Check if an error is transient and worth retrying.
 
@@ -77,65 +122,194 @@ def _is_retryable_error(error: Exception) -> bool:
     Returns:
         True if the error is likely transient (network, rate limit).
     """
-    error_str = str(error).lower()
-    retryable_patterns = [
-        "403",
-        "429",
-        "http error",
-        "connection",
-        "timeout",
-        "network",
-        "temporary",
-        "unavailable",
-        "rate limit",
-    ]
-    return any(pattern in error_str for pattern in retryable_patterns)
+    return _RETRYABLE_RE.search(str(error)) is not None
 
 
-def download_track(
-    video_id: str,
-    output_dir: Path,
-    audio_format: str = "best",
-    fallback_format: str = "mp3",
-    max_retries: int = MAX_RETRIES,
-) -> Path | None:
-    """
-    Download a single track from YouTube Music with retry logic.
+def _parse_retry_after(value: str) -> float | None:
+    """Parse a Retry-After header value: delay seconds or an HTTP date."""
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    return max(0.0, retry_at.timestamp() - time.time())
+
+
+def _retry_after_header(error: BaseException) -> float | None:
+    """Return the Retry-After of the HTTP error behind a download failure.
 
-    Retries up to max_retries times with exponential backoff
-    (2s, 4s, 8s) for transient errors (403, 429, network issues).
+    yt-dlp keeps the original exception in DownloadError.exc_info; its
+    HTTPError exposes headers on .response, urllib's directly on
+    .headers. The exception chain is followed as a fallback.
 
     Args:
-        video_id: YouTube video ID.
-        output_dir: Directory to save the downloaded file.
-        audio_format: Preferred audio format.
-        fallback_format: Fallback format for DAP compatibility.
-        max_retries: Maximum number of retry attempts.
+        error: Exception raised by YoutubeDL.extract_info.
 
     Returns:
-        Path to downloaded file, or None if download failed.
+        Seconds to wait, or None if no usable header was found.
+    """
+    seen: set[int] = set()
+    current: BaseException | None = error
+    while current is not None and id(current) not in seen:
+        seen.add(id(current))
+        headers = getattr(current, "headers", None)
+        if headers is None:
+            headers = getattr(getattr(current, "response", None), "headers", None)
+        value = headers.get("Retry-After") if headers is not None else None
+        if value:
+            parsed = _parse_retry_after(str(value))
+            if parsed is not None:
+                return parsed
+        exc_info = getattr(current, "exc_info", None)
+        if isinstance(exc_info, tuple) and len(exc_info) > 1:
+            current = exc_info[1]
+        else:
+            current = current.__cause__ or current.__context__
+    return None
+
+
+def _retry_delay(attempt: int, error: Exception) -> float:
+    """Return how long to wait before retrying a failed download.
+
+    The server's Retry-After, from the underlying HTTP error's headers or
+    quoted in the message, is honored up to MAX_BACKOFF, so a long
+    requested wait can't park a worker thread for minutes. Otherwise the
+    exponential backoff is capped at MAX_BACKOFF and scaled by a random
+    factor in [0.5, 1.0], so parallel workers that failed together don't
+    retry in lockstep.
 
-    Raises:
-        DownloadError: If download fails after all attempts.
+    Args:
+        attempt: Zero-based index of the attempt that failed.
+        error: The exception it raised.
+
+    Returns:
+        Delay in seconds.
     """
-    # Import here to avoid import-time side effects
-    import yt_dlp
+    retry_after = _retry_after_header(error)
+    if retry_after is None:
+        match = _RETRY_AFTER_RE.search(str(error))
+        if match:
+            retry_after = float(match.group(1))
+    if retry_after is not None:
+        return min(MAX_BACKOFF, retry_after)
+    backoff = min(MAX_BACKOFF, float(RETRY_BACKOFF_BASE ** (attempt + 1)))
+    return backoff * random.uniform(0.5, 1.0)
+
 
-    url = f"https://music.youtube.com/watch?v={video_id}"
-    output_dir.mkdir(parents=True, exist_ok=True)
+def _reported_filepath(info: dict[str, Any]) -> Path | None:
+    """Return the final file path yt-dlp reports for a finished download.
 
-    opts = _build_yt_dlp_opts(output_dir, audio_format, fallback_format)
+    Modern yt-dlp records it, after postprocessing (e.g. the .mp3 from
+    FFmpegExtractAudio), in the last entry of requested_downloads.
 
-    last_error: Exception | None = None
+    Args:
+        info: Info dict returned by YoutubeDL.extract_info.
+
+    Returns:
+        Path to the downloaded file, or None if yt-dlp didn't report one.
+    """
+    requested = info.get("requested_downloads") or [{}]
+    filepath = requested[-1].get("filepath") or info.get("filepath")
+    if not filepath:
+        return None
+    return Path(filepath)
 
-    for attempt in range(max_retries + 1):
-        try:
-            with yt_dlp.YoutubeDL(opts) as ydl:
+
+class Downloader:
+    """
+    Reusable yt-dlp downloader.
+
+    Keeps one YoutubeDL instance per worker thread and output directory,
+    so its HTTP connection pool and extractor setup are shared across
+    tracks instead of rebuilt for every download. YoutubeDL is not
+    thread-safe, hence one instance per thread.
+
+    Workers sharing a Downloader also share a ThrottleController: a
+    429 seen by one pauses them all before their next attempt.
+    """
+
+    def __init__(
+        self,
+        audio_format: str = "best",
+        fallback_format: str = "mp3",
+        max_retries: int = MAX_RETRIES,
+    ) -> None:
+        self.audio_format = audio_format
+        self.fallback_format = fallback_format
+        self.max_retries = max_retries
+        self._throttle = ThrottleController()
+        self._local = threading.local()
+        self._instances: list[Any] = []
+        self._lock = threading.Lock()
+
+    def __enter__(self) -> "Downloader":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def _get_ydl(self, output_dir: Path) -> Any:
+        """Return this thread's YoutubeDL for output_dir, creating it once."""
+        # Import here to avoid import-time side effects
+        import yt_dlp
+
+        instances: dict[Path, Any] | None = getattr(self._local, "ydls", None)
+        if instances is None:
+            instances = self._local.ydls = {}
+
+        ydl = instances.get(output_dir)
+        if ydl is None:
+            opts = _build_yt_dlp_opts(
+                output_dir, self.audio_format, self.fallback_format
+            )
+            ydl = yt_dlp.YoutubeDL(opts)
+            instances[output_dir] = ydl
+            with self._lock:
+                self._instances.append(ydl)
+        return ydl
+
+    def download(self, video_id: str, output_dir: Path) -> Path | None:
+        """
+        Download a single track from YouTube Music with retry logic.
+
+        Retries up to max_retries times with jittered exponential backoff
+        for transient errors (403, 429, network issues), or after the
+        server's Retry-After when the error carries one. Attempts also
+        wait out the cooldown set by 429s any worker has seen.
+
+        Args:
+            video_id: YouTube video ID.
+            output_dir: Directory to save the downloaded file.
+
+        Returns:
+            Path to downloaded file, or None if download failed.
+
+        Raises:
+            DownloadError: If download fails after all attempts.
+        """
+        url = f"https://music.youtube.com/watch?v={video_id}"
+        output_dir.mkdir(parents=True, exist_ok=True)
+
+        ydl = self._get_ydl(output_dir)
+        max_retries = self.max_retries
+        last_error: Exception | None = None
+
+        for attempt in range(max_retries + 1):
+            if attempt == 0:
+                self._throttle.wait()
+            try:
                 info = ydl.extract_info(url, download=True)
                 if info is None:
                     raise DownloadError(f"No info extracted for {video_id}")
 
-                # Find the downloaded file
+                reported = _reported_filepath(info)
+                if reported is not None:
+                    logger.info("Downloaded: %s", reported)
+                    return reported
+
+                # Older yt-dlp doesn't report the final path; probe for it.
                 # yt-dlp may change extension after postprocessing
                 for ext in ["mp3", "m4a", "opus", "webm", "ogg"]:
                     candidate = output_dir / f"{video_id}.{ext}"
@@ -152,98 +326,73 @@ def download_track(
                     f"Download completed but file not found for {video_id}"
                 )
 
-        except DownloadError:
-            raise
-        except Exception as e:
-            last_error = e
-            if attempt < max_retries and _is_retryable_error(e):
-                wait_time = RETRY_BACKOFF_BASE ** (attempt + 1)
-                logger.warning(
-                    "Attempt %d/%d failed for %s: %s. " "Retrying in %ds...",
-                    attempt + 1,
-                    max_retries + 1,
-                    video_id,
-                    e,
-                    wait_time,
-                )
-                time.sleep(wait_time)
-            else:
-                break
-
-    raise DownloadError(
-        f"Failed to download {video_id} after "
-        f"{max_retries + 1} attempts: {last_error}"
-    ) from last_error
+            except DownloadError:
+                raise
+            except Exception as e:
+                last_error = e
+                if _THROTTLED_RE.search(str(e)):
+                    self._throttle.record_throttled()
+                if attempt < max_retries and _is_retryable_error(e):
+                    wait_time = max(
+                        _retry_delay(attempt, e), self._throttle.remaining()
+                    )
+                    logger.warning(
+                        "Attempt %d/%d failed for %s: %s. Retrying in %.1fs...",
+                        attempt + 1,
+                        max_retries + 1,
+                        video_id,
+                        e,
+                        wait_time,
+                    )
+                    time.sleep(wait_time)
+                else:
+                    break
+
+        raise DownloadError(
+            f"Failed to download {video_id} after "
+            f"{max_retries + 1} attempts: {last_error}"
+        ) from last_error
+
+    def close(self) -> None:
+        """Close every YoutubeDL instance created by this downloader."""
+        with self._lock:
+            instances, self._instances = self._instances, []
+            self._local = threading.local()
+        for ydl in instances:
+            ydl.close()
 
 
-def download_tracks_parallel(
-    tracks: list[dict[str, str]],
+def download_track(
+    video_id: str,
     output_dir: Path,
     audio_format: str = "best",
     fallback_format: str = "mp3",
-    max_workers: int = 3,
-    progress_callback: Any = None,
-) -> list[dict[str, Any]]:
+    max_retries: int = MAX_RETRIES,
+    downloader: Downloader | None = None,
+) -> Path | None:
     """
-    Download multiple tracks in parallel.
+    Download a single track from YouTube Music with retry logic.
+
+    Convenience wrapper around Downloader. Without a downloader a one-off
+    one is built and closed; pass a shared one when fetching several
+    tracks so its YoutubeDL instances are reused.
 
     Args:
-        tracks: List of normalized track dicts (must have
-            'video_id').
-        output_dir: Base download directory.
+        video_id: YouTube video ID.
+        output_dir: Directory to save the downloaded file.
         audio_format: Preferred audio format.
-        fallback_format: Fallback format.
-        max_workers: Max concurrent downloads.
-        progress_callback: Optional callable(track, filepath, error)
-            for progress updates.
+        fallback_format: Fallback format for DAP compatibility.
+        max_retries: Maximum number of retry attempts.
+        downloader: Shared Downloader to reuse; the format and retry
+            arguments are ignored when given.
 
     Returns:
-        List of result dicts with keys: track, filepath, error.
-    """
-    results: list[dict[str, Any]] = []
-
-    # Use a temp directory for raw downloads, then organize
-    temp_dir = output_dir / ".tmp"
-    temp_dir.mkdir(parents=True, exist_ok=True)
-
-    def _download_one(
-        track: dict[str, str],
-    ) -> dict[str, Any]:
-        video_id = track.get("video_id", "")
-        if not video_id:
-            return {
-                "track": track,
-                "filepath": None,
-                "error": "Missing video_id",
-            }
-        try:
-            filepath = download_track(video_id, temp_dir, audio_format, fallback_format)
-            return {
-                "track": track,
-                "filepath": filepath,
-                "error": None,
-            }
-        except DownloadError as e:
-            logger.error(f"Download failed: {e}")
-            return {
-                "track": track,
-                "filepath": None,
-                "error": str(e),
-            }
-
-    with ThreadPoolExecutor(max_workers=max_workers) as executor:
-        future_to_track = {
-            executor.submit(_download_one, track): track for track in tracks
-        }
-
-        for future in as_completed(future_to_track):
-            result = future.result()
-            results.append(result)
-            if progress_callback is not None:
-                progress_callback(
-                    result["track"],
-                    result["filepath"],
-                    result["error"],
-                )
+        Path to downloaded file, or None if download failed.
 
-    return results
+    Raises:
+        DownloadError: If download fails after all attempts.
+    """
+    if downloader is not None:
+        return downloader.download(video_id, output_dir)
+    with Downloader(audio_format, fallback_format, max_retries) as one_off:
+        return one_off.download(video_id, output_dir)
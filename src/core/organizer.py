@@ -1,6 +1,9 @@
 """File organizer - moves and renames downloaded tracks for DAP compatibility."""
 
+import errno
+import functools
 import logging
+import os
 import re
 import shutil
 import unicodedata
@@ -13,8 +16,7 @@ logger = logging.getLogger(__name__)
 # Characters not allowed in filenames on FAT32/NTFS
 INVALID_CHARS = re.compile(r'[<>:"/\\|?*\x00-\x1f]')
 
-# Multiple spaces/dots/dashes cleanup
-MULTI_SPACE = re.compile(r"\s+")
+# Dash runs collapse to a single dash
 MULTI_DASH = re.compile(r"-{2,}")
 
 
@@ -41,9 +43,11 @@ def sanitize_filename(name: str, max_length: int = 120) -> str:
     # Replace common problematic patterns
     name = name.replace("&", "and")
 
-    # Collapse whitespace and trim
-    name = MULTI_SPACE.sub(" ", name).strip()
-    name = MULTI_DASH.sub("-", name)
+    # Collapse whitespace and trim; str.split() treats the same
+    # characters as whitespace as \s, without a regex pass
+    name = " ".join(name.split())
+    if "--" in name:
+        name = MULTI_DASH.sub("-", name)
 
     # Remove leading/trailing dots and spaces
     name = name.strip(". ")
@@ -59,11 +63,13 @@ def sanitize_filename(name: str, max_length: int = 120) -> str:
     return name
 
 
+@functools.lru_cache(maxsize=4096)
 def sanitize_dirname(name: str, max_length: int = 80) -> str:
     """
     Sanitize a string for use as a directory name.
 
-    More restrictive than filename sanitization.
+    More restrictive than filename sanitization. Memoized: the same
+    artist, album and genre names recur across a playlist.
 
     Args:
         name: Raw directory name.
@@ -75,6 +81,24 @@ def sanitize_dirname(name: str, max_length: int = 80) -> str:
     return sanitize_filename(name, max_length)
 
 
+def _numbered_name(base_name: str, counter: int, ext: str, max_len: int) -> str:
+    """Build "base_name (counter)ext", shortening base_name to fit the suffix."""
+    suffix = f" ({counter})"
+    stem = base_name
+    if len(stem) + len(suffix) > max_len:
+        stem = stem[: max_len - len(suffix)].rstrip(". ")
+    return f"{stem}{suffix}{ext}"
+
+
+def _claim(path: Path) -> bool:
+    """Atomically create an empty placeholder at path; False if taken."""
+    try:
+        os.close(os.open(path, os.O_CREAT | os.O_EXCL | os.O_WRONLY))
+    except FileExistsError:
+        return False
+    return True
+
+
 def organize_track(
     source_path: Path,
     base_dir: Path,
@@ -82,6 +106,7 @@ def organize_track(
     organize_by: str = "genre_artist",
     max_filename_length: int = 120,
     default_genre: str = "Unknown",
+    created_dirs: set[Path] | None = None,
 ) -> Path:
     """
     Move a downloaded track to its organized location.
@@ -98,6 +123,9 @@ def organize_track(
             (genre_artist, artist_album, playlist).
         max_filename_length: Max filename character length.
         default_genre: Default genre when not available.
+        created_dirs: Directories already created during this run.
+            When given, known directories skip the mkdir call and
+            newly created ones are added to the set.
 
     Returns:
         Path to the organized file.
@@ -128,7 +156,8 @@ def organize_track(
         target_dir = base_dir / genre / artist
 
     # Build filename: "Artist - Title.ext"
-    filename = f"{artist} - {title}"
+    base_name = f"{artist} - {title}"
+    filename = base_name
 
     # Ensure total filename (with ext) fits in max_filename_length
     max_name_len = max_filename_length - len(ext)
@@ -137,28 +166,60 @@ def organize_track(
 
     filename = f"{filename}{ext}"
 
-    target_dir.mkdir(parents=True, exist_ok=True)
+    if created_dirs is None or target_dir not in created_dirs:
+        target_dir.mkdir(parents=True, exist_ok=True)
+        if created_dirs is not None:
+            created_dirs.add(target_dir)
     target_path = target_dir / filename
 
-    # Handle duplicates by adding a counter
-    counter = 1
-    while target_path.exists():
-        stem = f"{artist} - {title} ({counter})"
-        if len(stem) > max_name_len:
-            stem = stem[:max_name_len].rstrip(". ")
-        target_path = target_dir / f"{stem}{ext}"
-        counter += 1
+    # Handle duplicates by adding a counter. Each name is claimed with
+    # an exclusive create, so parallel workers organizing the same
+    # track never pick the same target. On a collision the directory
+    # is listed once and free names are found in memory instead of a
+    # stat per candidate; names compare casefolded since DAP
+    # filesystems (FAT32, exFAT) ignore case.
+    try:
+        taken: set[str] | None = None
+        counter = 0
+        while not _claim(target_path):
+            if taken is None:
+                taken = {entry.casefold() for entry in os.listdir(target_dir)}
+            taken.add(target_path.name.casefold())
+            while target_path.name.casefold() in taken:
+                counter += 1
+                target_path = target_dir / _numbered_name(
+                    base_name, counter, ext, max_name_len
+                )
+    except OSError as e:
+        raise OrganizationError(f"Failed to claim {target_path}: {e}") from e
 
     try:
-        shutil.move(str(source_path), str(target_path))
+        # Replaces the empty placeholder left by _claim
+        _move(source_path, target_path)
         logger.info(f"Organized: {target_path}")
         return target_path
     except OSError as e:
+        target_path.unlink(missing_ok=True)
         raise OrganizationError(
             f"Failed to move {source_path} to {target_path}: {e}"
         ) from e
 
 
+def _move(source_path: Path, target_path: Path) -> None:
+    """Move a file onto target_path, replacing whatever is there.
+
+    A same-filesystem move is a single rename; shutil.move's copy and
+    delete is only used when the download directory is on another
+    device.
+    """
+    try:
+        os.replace(source_path, target_path)
+    except OSError as e:
+        if e.errno != errno.EXDEV:
+            raise
+        shutil.move(str(source_path), str(target_path))
+
+
 def cleanup_temp_dir(temp_dir: Path) -> None:
     """
     Remove temporary download directory and any leftover files.
@@ -0,0 +1,90 @@
+"""Request rate limiting for YouTube Music API and download calls."""
+
+import threading
+import time
+from collections import deque
+
+# Seconds a throttling response (HTTP 429) counts toward the cooldown
+THROTTLE_WINDOW = 60.0
+# Cooldown after one throttling response; doubles with each further one
+# inside THROTTLE_WINDOW
+THROTTLE_BASE_DELAY = 1.0
+# Cap on the shared cooldown, in seconds
+MAX_THROTTLE_DELAY = 30.0
+
+
+class LeakyBucket:
+    """Thread-safe leaky bucket that spaces calls evenly at a fixed rate.
+
+    Each acquire() reserves the next free slot, one every 1/rate seconds,
+    and sleeps until it arrives. Callers from concurrent fetch threads
+    are therefore metered as one stream instead of bursting together.
+
+    Args:
+        rate: Maximum calls per second; validated by AppConfig.
+    """
+
+    def __init__(self, rate: float) -> None:
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Block until the caller may make its next request."""
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval
+        delay = slot - now
+        if delay > 0:
+            time.sleep(delay)
+
+
+class ThrottleController:
+    """Thread-safe cooldown shared by workers hitting the same server.
+
+    Each worker backs off on its own after a failure, but a 429 seen by
+    one worker means the others are about to get one too. Every
+    throttling response is recorded here, and the cooldown before the
+    next request grows with how many arrived within the window, so all
+    workers pause together instead of each spending retries on it.
+
+    Args:
+        window: Seconds a throttling response keeps counting.
+        base_delay: Cooldown after a single throttling response.
+        max_delay: Cap on the cooldown.
+    """
+
+    def __init__(
+        self,
+        window: float = THROTTLE_WINDOW,
+        base_delay: float = THROTTLE_BASE_DELAY,
+        max_delay: float = MAX_THROTTLE_DELAY,
+    ) -> None:
+        self._window = window
+        self._base_delay = base_delay
+        self._max_delay = max_delay
+        self._hits: deque[float] = deque()
+        self._resume_at = 0.0
+        self._lock = threading.Lock()
+
+    def record_throttled(self) -> None:
+        """Record a throttling response and extend the shared cooldown."""
+        with self._lock:
+            now = time.monotonic()
+            while self._hits and now - self._hits[0] > self._window:
+                self._hits.popleft()
+            self._hits.append(now)
+            delay = min(self._max_delay, self._base_delay * 2 ** (len(self._hits) - 1))
+            self._resume_at = max(self._resume_at, now + delay)
+
+    def remaining(self) -> float:
+        """Return the seconds left in the shared cooldown, or 0.0."""
+        with self._lock:
+            return max(0.0, self._resume_at - time.monotonic())
+
+    def wait(self) -> None:
+        """Block until the shared cooldown, if any, has passed."""
+        delay = self.remaining()
+        if delay > 0:
+            time.sleep(delay)
@@ -1,33 +1,48 @@
 """Sync state management for incremental downloads."""
 
-import json
 import logging
+import os
 from datetime import UTC, datetime
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+# Pending operations that trigger an automatic save, bounding the work
+# an interrupted bulk sync can lose
+CHECKPOINT_OPS = 50
+
 
 class SyncState:
     """
     Manages the state of synced tracks for incremental downloads.
 
     Tracks which songs have been downloaded to avoid re-downloading.
-    State is persisted as a JSON file alongside the downloads.
+    State is persisted as a JSON snapshot alongside the downloads plus
+    an append-only JSONL log of changes made since that snapshot, so a
+    save only writes what changed in this run.
     """
 
     def __init__(self, state_file: Path) -> None:
         self._file = state_file
+        self._log_file = state_file.with_suffix(".jsonl")
+        self._pending_ops: list[dict[str, Any]] = []
+        self._log_ops = 0
         self._state: dict[str, Any] = self._load()
+        # Bound once: every mutation goes through this same dict, so
+        # lookups skip the per-call _state.get chain
+        self._tracks: dict[str, Any] = self._state.setdefault("tracks", {})
+        self._replay_log()
 
     def _load(self) -> dict[str, Any]:
-        """Load state from disk."""
+        """Load the snapshot from disk."""
         if self._file.exists():
             try:
-                data: dict[str, Any] = json.loads(self._file.read_text())
+                data: dict[str, Any] = orjson.loads(self._file.read_bytes())
                 return data
-            except (json.JSONDecodeError, OSError) as e:
+            except (orjson.JSONDecodeError, OSError) as e:
                 logger.warning(f"Failed to load sync state: {e}")
         return {
             "version": 1,
@@ -36,14 +51,107 @@ class SyncState:
             "playlists": {},
         }
 
+    def _replay_log(self) -> None:
+        """Apply logged operations on top of the loaded snapshot."""
+        try:
+            lines = self._log_file.read_bytes().splitlines()
+        except FileNotFoundError:
+            return
+        except OSError as e:
+            logger.warning(f"Failed to read sync state log: {e}")
+            return
+
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                self._apply(orjson.loads(line))
+            except (orjson.JSONDecodeError, KeyError, TypeError) as e:
+                # Most likely a line cut short by an interrupted save
+                logger.warning(f"Skipping bad sync state log entry: {e}")
+                continue
+            self._log_ops += 1
+
+    def _apply(self, op: dict[str, Any]) -> None:
+        """Apply a single operation to the in-memory state.
+
+        Operations are idempotent, so replaying a log that was already
+        folded into the snapshot yields the same state.
+        """
+        kind = op["op"]
+        if kind == "add":
+            self._tracks[op["video_id"]] = op["track"]
+        elif kind == "remove":
+            self._tracks.pop(op["video_id"], None)
+        elif kind == "playlist":
+            playlists = self._state.setdefault("playlists", {})
+            playlists[op["playlist_id"]] = op["playlist"]
+        elif kind == "last_sync":
+            self._state["last_sync"] = op["value"]
+        else:
+            raise KeyError(f"unknown op {kind!r}")
+
+    def _record(self, op: dict[str, Any]) -> None:
+        """Apply an operation and queue it for the next save.
+
+        Once CHECKPOINT_OPS operations are pending they are saved
+        right away, so a long run persists progress in batches.
+        """
+        self._apply(op)
+        self._pending_ops.append(op)
+        if len(self._pending_ops) >= CHECKPOINT_OPS:
+            self.save()
+
     def save(self) -> None:
-        """Persist state to disk."""
+        """Persist state to disk.
+
+        Mutators only touch the in-memory state; this is the single
+        write. Pending operations are appended to the log and fsynced.
+        A full snapshot is written instead when none exists yet or the
+        log has grown past twice the number of tracked songs.
+        """
+        if not self._file.exists() or (
+            self._log_ops + len(self._pending_ops) > 2 * self.total_tracks
+        ):
+            self.compact()
+            return
+        if not self._pending_ops:
+            return
+
+        payload = b"".join(orjson.dumps(op) + b"\n" for op in self._pending_ops)
+        with self._log_file.open("ab") as f:
+            f.write(payload)
+            f.flush()
+            os.fsync(f.fileno())
+        self._log_ops += len(self._pending_ops)
+        self._pending_ops.clear()
+
+    def compact(self) -> None:
+        """Write a full snapshot and truncate the operation log.
+
+        The snapshot is written to a temp sibling and renamed into place
+        so an interrupted save never leaves a truncated state file. It is
+        fsynced before the rename: the log is deleted right after, so a
+        snapshot still sitting in the page cache at a power loss would
+        otherwise take the only durable copy of the changes with it.
+        """
         self._file.parent.mkdir(parents=True, exist_ok=True)
-        self._file.write_text(json.dumps(self._state, indent=2, default=str) + "\n")
+        tmp_file = self._file.with_name(self._file.name + ".tmp")
+        with tmp_file.open("wb") as f:
+            f.write(
+                orjson.dumps(self._state, default=str, option=orjson.OPT_INDENT_2)
+                + b"\n"
+            )
+            f.flush()
+            os.fsync(f.fileno())
+        tmp_file.replace(self._file)
+        self._log_file.unlink(missing_ok=True)
+        self._log_ops = 0
+        self._pending_ops.clear()
 
     def is_downloaded(self, video_id: str) -> bool:
         """Check if a track has already been downloaded."""
-        return video_id in self._state.get("tracks", {})
+        return video_id in self._tracks
 
     def mark_downloaded(
         self,
@@ -59,15 +167,18 @@ class SyncState:
             filepath: Path where file was saved.
             metadata: Track metadata for reference.
         """
-        if "tracks" not in self._state:
-            self._state["tracks"] = {}
-
-        self._state["tracks"][video_id] = {
-            "filepath": filepath,
-            "title": metadata.get("title", ""),
-            "artist": metadata.get("artist", ""),
-            "downloaded_at": (datetime.now(UTC).isoformat()),
-        }
+        self._record(
+            {
+                "op": "add",
+                "video_id": video_id,
+                "track": {
+                    "filepath": filepath,
+                    "title": metadata.get("title", ""),
+                    "artist": metadata.get("artist", ""),
+                    "downloaded_at": (datetime.now(UTC).isoformat()),
+                },
+            }
+        )
 
     def mark_playlist_synced(
         self,
@@ -76,18 +187,21 @@ class SyncState:
         track_count: int,
     ) -> None:
         """Record that a playlist was synced."""
-        if "playlists" not in self._state:
-            self._state["playlists"] = {}
-
-        self._state["playlists"][playlist_id] = {
-            "name": playlist_name,
-            "track_count": track_count,
-            "last_sync": (datetime.now(UTC).isoformat()),
-        }
+        self._record(
+            {
+                "op": "playlist",
+                "playlist_id": playlist_id,
+                "playlist": {
+                    "name": playlist_name,
+                    "track_count": track_count,
+                    "last_sync": (datetime.now(UTC).isoformat()),
+                },
+            }
+        )
 
     def update_last_sync(self) -> None:
         """Update the global last sync timestamp."""
-        self._state["last_sync"] = datetime.now(UTC).isoformat()
+        self._record({"op": "last_sync", "value": datetime.now(UTC).isoformat()})
 
     def get_new_tracks(self, tracks: list[dict[str, str]]) -> list[dict[str, str]]:
         """
@@ -99,7 +213,11 @@ class SyncState:
         Returns:
             List of tracks that need downloading.
         """
-        return [t for t in tracks if not self.is_downloaded(t.get("video_id", ""))]
+        downloaded = self._tracks
+        if not downloaded:
+            # First sync into this directory: nothing to filter out
+            return list(tracks)
+        return [t for t in tracks if t.get("video_id", "") not in downloaded]
 
     def get_orphaned_tracks(self, current_video_ids: set[str]) -> list[dict[str, Any]]:
         """
@@ -113,17 +231,21 @@ class SyncState:
         Returns:
             List of orphaned track entries from state.
         """
-        orphaned: list[dict[str, Any]] = []
-        for vid, info in self._state.get("tracks", {}).items():
-            if vid not in current_video_ids:
-                orphaned.append({"video_id": vid, **info})
-        return orphaned
+        tracks = self._tracks
+        orphan_ids = tracks.keys() - current_video_ids
+        if not orphan_ids:
+            return []
+        # Keep state (download) order for stable display
+        return [
+            {"video_id": vid, **info}
+            for vid, info in tracks.items()
+            if vid in orphan_ids
+        ]
 
     def remove_track(self, video_id: str) -> None:
         """Remove a track from the sync state."""
-        tracks = self._state.get("tracks", {})
-        if video_id in tracks:
-            del tracks[video_id]
+        if video_id in self._tracks:
+            self._record({"op": "remove", "video_id": video_id})
 
     @property
     def last_sync(self) -> str | None:
@@ -134,7 +256,7 @@ class SyncState:
     @property
     def total_tracks(self) -> int:
         """Get total number of synced tracks."""
-        return len(self._state.get("tracks", {}))
+        return len(self._tracks)
 
     @property
     def synced_playlists(self) -> dict[str, Any]:
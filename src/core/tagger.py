@@ -1,18 +1,29 @@
 """Audio metadata tagger using Mutagen."""
 
+import functools
 import logging
 from pathlib import Path
 
 from mutagen import File as MutagenFile  # type: ignore[attr-defined]
-from mutagen.easyid3 import EasyID3
-from mutagen.id3 import APIC, ID3  # type: ignore[attr-defined]
-from mutagen.mp3 import MP3
+from mutagen.id3 import (  # type: ignore[attr-defined]
+    APIC,
+    ID3,
+    TALB,
+    TCON,
+    TIT2,
+    TPE1,
+    ID3NoHeaderError,
+)
 from mutagen.mp4 import MP4, MP4Cover
 
 from src.core.exceptions import MetadataError
 
 logger = logging.getLogger(__name__)
 
+# Cover images kept in memory; tracks of one album share a cover, so a
+# small cache saves re-reading it for every track
+MAX_CACHED_COVERS = 50
+
 
 def tag_file(
     filepath: Path,
@@ -50,55 +61,64 @@ def tag_file(
         raise MetadataError(f"Failed to tag {filepath.name}: {e}") from e
 
 
+@functools.lru_cache(maxsize=MAX_CACHED_COVERS)
+def _read_cover_cached(path: str, mtime_ns: int, size: int) -> bytes:
+    """Read a cover image; mtime and size in the key catch a rewrite."""
+    return Path(path).read_bytes()
+
+
+def _read_cover(cover_path: Path) -> bytes:
+    """Return a cover image's bytes, reading each unchanged file once."""
+    stat = cover_path.stat()
+    return _read_cover_cached(str(cover_path), stat.st_mtime_ns, stat.st_size)
+
+
+def clear_cover_cache() -> None:
+    """Drop cover images cached by _read_cover."""
+    _read_cover_cached.cache_clear()
+
+
 def _tag_mp3(
     filepath: Path,
     metadata: dict[str, str],
     cover_path: Path | None = None,
 ) -> None:
-    """Tag an MP3 file using EasyID3."""
+    """Tag an MP3 file's ID3 frames, opening and saving it once."""
     try:
-        audio = EasyID3(str(filepath))
-    except Exception:
-        # No ID3 tag exists, create one
-        audio_raw = MP3(str(filepath))
-        audio_raw.add_tags()
-        audio_raw.save()
-        audio = EasyID3(str(filepath))
-
-    audio["title"] = metadata.get("title", "Unknown")
-    audio["artist"] = metadata.get("artist", "Unknown")
-    audio["album"] = metadata.get("album", "Unknown")
+        audio = ID3(str(filepath))
+    except ID3NoHeaderError:
+        # No ID3 tag yet; save() writes a new one
+        audio = ID3()
+
+    # encoding=3 is UTF-8; add() replaces any existing frame of the kind
+    audio.add(TIT2(encoding=3, text=[metadata.get("title", "Unknown")]))
+    audio.add(TPE1(encoding=3, text=[metadata.get("artist", "Unknown")]))
+    audio.add(TALB(encoding=3, text=[metadata.get("album", "Unknown")]))
 
     genre = metadata.get("genre", "")
     if genre:
-        audio["genre"] = genre
-
-    audio.save()
+        audio.add(TCON(encoding=3, text=[genre]))
 
     # Embed cover art if provided
     if cover_path and cover_path.exists():
-        _embed_cover_mp3(filepath, cover_path)
+        audio.add(_cover_frame_mp3(cover_path))
 
+    audio.save(str(filepath))
 
-def _embed_cover_mp3(filepath: Path, cover_path: Path) -> None:
-    """Embed cover art in MP3 file."""
-    audio = ID3(str(filepath))
-    cover_data = cover_path.read_bytes()
 
+def _cover_frame_mp3(cover_path: Path) -> APIC:
+    """Build the front-cover APIC frame for an MP3."""
     mime = "image/jpeg"
     if cover_path.suffix.lower() == ".png":
         mime = "image/png"
 
-    audio.add(
-        APIC(
-            encoding=3,
-            mime=mime,
-            type=3,  # Cover (front)
-            desc="Cover",
-            data=cover_data,
-        )
+    return APIC(
+        encoding=3,
+        mime=mime,
+        type=3,  # Cover (front)
+        desc="Cover",
+        data=_read_cover(cover_path),
     )
-    audio.save()
 
 
 def _tag_m4a(
@@ -118,7 +138,7 @@ def _tag_m4a(
         audio["\xa9gen"] = [genre]
 
     if cover_path and cover_path.exists():
-        cover_data = cover_path.read_bytes()
+        cover_data = _read_cover(cover_path)
         fmt = MP4Cover.FORMAT_JPEG
         if cover_path.suffix.lower() == ".png":
             fmt = MP4Cover.FORMAT_PNG
@@ -1,20 +1,110 @@
 """YouTube Music provider - wraps ytmusicapi for playlist and track operations."""
 
 import logging
+import re
+import time
+from collections.abc import Iterator
 from typing import Any
 
 from ytmusicapi import YTMusic
+from ytmusicapi.auth.oauth.exceptions import BadOAuthClient, UnauthorizedOAuthClient
 
+from src.core.cache import PlaylistCache
 from src.core.exceptions import AuthenticationError, PlaylistNotFoundError
+from src.core.rate_limit import LeakyBucket
 
 logger = logging.getLogger(__name__)
 
+# Seconds a fetched track list is reused within one provider instance
+TRACK_CACHE_TTL = 60.0
+
+# Cap on concurrent requests when fetching several playlists at once;
+# kept modest to stay clear of YouTube Music rate limiting
+MAX_FETCH_WORKERS = 8
+
+# Exceptions ytmusicapi raises when the OAuth client or token is rejected
+AUTH_FAILURE_TYPES = (BadOAuthClient, UnauthorizedOAuthClient)
+
+# Other rejections are only visible in the message: ytmusicapi reports
+# "HTTP 401" or "status_code: 401", and OAuth errors carry their code.
+# Anchored so IDs, URLs or byte counts containing "401" don't match.
+_AUTH_FAILURE_RE = re.compile(
+    r"\bHTTP 401\b|\bstatus_code: 401\b|\binvalid_grant\b|\binvalid_client\b"
+)
+
+
+def _raise_if_auth_failure(error: Exception) -> None:
+    """
+    Re-raise an API error as AuthenticationError if credentials were rejected.
+
+    load_auth doesn't validate credentials up front, so the first real
+    request is where a revoked or expired grant shows up. The cached
+    client needs no reset here: load_auth keys it on oauth.json's
+    mtime, so 'ymd auth' writing a new token invalidates it.
+
+    Args:
+        error: Exception raised by a ytmusicapi call.
+
+    Raises:
+        AuthenticationError: If the error looks like an auth rejection.
+    """
+    if isinstance(error, AUTH_FAILURE_TYPES) or _AUTH_FAILURE_RE.search(str(error)):
+        raise AuthenticationError(
+            f"Stored credentials were rejected: {error}. "
+            "Run 'ymd auth' to re-authenticate."
+        ) from error
+
 
 class YouTubeProvider:
-    """Interface to YouTube Music API via ytmusicapi."""
+    """Interface to YouTube Music API via ytmusicapi.
+
+    Args:
+        ytmusic: Authenticated YTMusic client.
+        rate_limiter: Optional limiter every API request waits on; share
+            one across threads to meter them together.
+        disk_cache: Optional on-disk cache consulted when a track list
+            isn't cached in memory, so repeat syncs skip the fetch.
+    """
 
-    def __init__(self, ytmusic: YTMusic) -> None:
+    def __init__(
+        self,
+        ytmusic: YTMusic,
+        rate_limiter: LeakyBucket | None = None,
+        disk_cache: PlaylistCache | None = None,
+    ) -> None:
         self._ytmusic = ytmusic
+        self._rate_limiter = rate_limiter
+        self._disk_cache = disk_cache
+        self._track_cache: dict[str, tuple[float, list[dict[str, Any]]]] = {}
+
+    def _throttle(self) -> None:
+        """Wait for the rate limiter, if any, before an API request."""
+        if self._rate_limiter is not None:
+            self._rate_limiter.acquire()
+
+    def _get_cached(self, key: str) -> list[dict[str, Any]] | None:
+        """Return a cached track list if it's younger than TRACK_CACHE_TTL.
+
+        Falls back to the disk cache, if any, on an in-memory miss.
+        """
+        entry = self._track_cache.get(key)
+        if entry is not None:
+            fetched_at, tracks = entry
+            if time.monotonic() - fetched_at <= TRACK_CACHE_TTL:
+                return tracks
+            del self._track_cache[key]
+        if self._disk_cache is None:
+            return None
+        disk_tracks = self._disk_cache.get(key)
+        if disk_tracks is not None:
+            self._track_cache[key] = (time.monotonic(), disk_tracks)
+        return disk_tracks
+
+    def _set_cached(self, key: str, tracks: list[dict[str, Any]]) -> None:
+        """Store a fetched track list with the current timestamp."""
+        self._track_cache[key] = (time.monotonic(), tracks)
+        if self._disk_cache is not None:
+            self._disk_cache.set(key, tracks)
 
     def get_playlists(self) -> list[dict[str, Any]]:
         """
@@ -24,6 +114,7 @@ class YouTubeProvider:
             List of playlist dicts with keys: playlistId, title, count.
         """
         try:
+            self._throttle()
             playlists = self._ytmusic.get_library_playlists(limit=100)
             return [
                 {
@@ -34,6 +125,7 @@ class YouTubeProvider:
                 for p in playlists
             ]
         except Exception as e:
+            _raise_if_auth_failure(e)
             logger.error(f"Failed to fetch playlists: {e}")
             raise AuthenticationError(f"Could not fetch playlists: {e}") from e
 
@@ -41,15 +133,24 @@ class YouTubeProvider:
         """
         Fetch user's liked songs.
 
+        Repeat calls within TRACK_CACHE_TTL return the cached list.
+
         Returns:
             List of track dictionaries.
         """
+        cached = self._get_cached("__liked__")
+        if cached is not None:
+            return cached
+
         try:
+            self._throttle()
             result = self._ytmusic.get_liked_songs(limit=5000)
             tracks: list[dict[str, Any]] = result.get("tracks", [])
             logger.info(f"Fetched {len(tracks)} liked songs")
+            self._set_cached("__liked__", tracks)
             return tracks
         except Exception as e:
+            _raise_if_auth_failure(e)
             logger.error(f"Failed to fetch liked songs: {e}")
             raise AuthenticationError(f"Could not fetch liked songs: {e}") from e
 
@@ -57,6 +158,8 @@ class YouTubeProvider:
         """
         Fetch tracks from a specific playlist.
 
+        Repeat calls within TRACK_CACHE_TTL return the cached list.
+
         Args:
             playlist_id: YouTube Music playlist ID.
 
@@ -65,15 +168,53 @@ class YouTubeProvider:
 
         Raises:
             PlaylistNotFoundError: If playlist doesn't exist.
+            AuthenticationError: If the stored credentials are rejected.
         """
+        cached = self._get_cached(playlist_id)
+        if cached is not None:
+            return cached
+
         try:
+            self._throttle()
             playlist = self._ytmusic.get_playlist(playlist_id, limit=5000)
             tracks: list[dict[str, Any]] = playlist.get("tracks", [])
             logger.info(f"Fetched {len(tracks)} tracks from {playlist_id}")
+            self._set_cached(playlist_id, tracks)
             return tracks
         except Exception as e:
+            _raise_if_auth_failure(e)
             raise PlaylistNotFoundError(f"Playlist {playlist_id} not found: {e}") from e
 
+    def iter_playlist_video_ids(self, playlist_id: str) -> Iterator[str]:
+        """
+        Yield only the video IDs of a playlist's tracks.
+
+        Avoids building normalized track dicts when callers just need
+        membership, e.g. orphan detection in clean.
+
+        Args:
+            playlist_id: YouTube Music playlist ID.
+
+        Raises:
+            PlaylistNotFoundError: If playlist doesn't exist.
+        """
+        for track in self.get_playlist_tracks(playlist_id):
+            video_id = track.get("videoId")
+            if video_id:
+                yield video_id
+
+    def iter_liked_video_ids(self) -> Iterator[str]:
+        """
+        Yield only the video IDs of the user's liked songs.
+
+        Raises:
+            AuthenticationError: If liked songs can't be fetched.
+        """
+        for track in self.get_liked_songs():
+            video_id = track.get("videoId")
+            if video_id:
+                yield video_id
+
     def search(
         self,
         query: str,
@@ -90,13 +231,18 @@ class YouTubeProvider:
 
         Returns:
             List of search result dictionaries.
+
+        Raises:
+            AuthenticationError: If the stored credentials are rejected.
         """
         try:
+            self._throttle()
             results: list[dict[str, Any]] = self._ytmusic.search(
                 query, filter=filter_type, limit=limit
             )
             return results
         except Exception as e:
+            _raise_if_auth_failure(e)
             logger.error(f"Search failed for '{query}': {e}")
             return []
 
@@ -109,23 +255,26 @@ class YouTubeProvider:
             Dict with keys: title, artist, album, video_id, duration,
             genre.
         """
-        artists = track.get("artists") or []
-        artist_name = ", ".join(a.get("name", "Unknown") for a in artists)
-
-        album_data = track.get("album") or {}
-        album_name = album_data.get("name", "Unknown Album")
+        # Called once per track of every fetched playlist; the bound get
+        # and list-based join keep it cheap for large libraries
+        get = track.get
+        artists = get("artists")
+        artist_name = (
+            ", ".join([a.get("name", "Unknown") for a in artists]) if artists else ""
+        )
 
-        # ytmusicapi doesn't always provide genre at track level
-        # It may be available via album or category
-        genre = ""
-        if "category" in track:
-            genre = track["category"]
+        album_data = get("album")
+        album_name = (
+            album_data.get("name", "Unknown Album") if album_data else "Unknown Album"
+        )
 
         return {
-            "title": track.get("title", "Unknown Title"),
+            "title": get("title", "Unknown Title"),
             "artist": artist_name or "Unknown Artist",
             "album": album_name,
-            "video_id": track.get("videoId", ""),
-            "duration": track.get("duration", "0:00"),
-            "genre": genre,
+            "video_id": get("videoId", ""),
+            "duration": get("duration", "0:00"),
+            # ytmusicapi doesn't always provide genre at track level
+            # It may be available via album or category
+            "genre": get("category", ""),
         }
@@ -1,12 +1,16 @@
 """Shared test fixtures."""
 
 import json
+from collections.abc import Iterator
 from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
 
+from src.core.config import FastConfig
+from src.core.exceptions import AuthenticationError
+
 
 @pytest.fixture
 def mock_ytmusic() -> MagicMock:
@@ -19,7 +23,11 @@ def mock_ytmusic() -> MagicMock:
     return mock
 
 
-@pytest.fixture
+# Session-scoped data fixtures below are built once and shared by every
+# test that requests them: treat them as read-only.
+
+
+@pytest.fixture(scope="session")
 def sample_track() -> dict[str, Any]:
     """Sample raw track from ytmusicapi."""
     return {
@@ -32,7 +40,7 @@ def sample_track() -> dict[str, Any]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_tracks() -> list[dict[str, Any]]:
     """Multiple sample tracks."""
     return [
@@ -63,7 +71,7 @@ def sample_tracks() -> list[dict[str, Any]]:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def normalized_track() -> dict[str, str]:
     """Pre-normalized track metadata."""
     return {
@@ -76,7 +84,7 @@ def normalized_track() -> dict[str, str]:
     }
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def config_data() -> dict[str, Any]:
     """Sample configuration data."""
     return {
@@ -90,9 +98,55 @@ def config_data() -> dict[str, Any]:
     }
 
 
+@pytest.fixture(scope="session")
+def fast_config() -> FastConfig:
+    """Default read-only config, as load_config returns it.
+
+    Frozen, so sharing it is safe; derive variants with dataclasses.replace.
+    """
+    return FastConfig(
+        download_dir=Path("downloads"),
+        audio_format="best",
+        fallback_format="mp3",
+        organize_by="genre_artist",
+        max_filename_length=120,
+        max_concurrent_downloads=3,
+        rate_limit=5.0,
+        default_genre="Unknown",
+        client_id="",
+        client_secret="",
+    )
+
+
+@pytest.fixture
+def mock_auth_failure(
+    request: pytest.FixtureRequest, fast_config: FastConfig
+) -> Iterator[None]:
+    """Load the default config in a CLI command and fail its authentication.
+
+    Parametrize indirectly with the command's module name, e.g.
+    @pytest.mark.parametrize("mock_auth_failure", ["sync"], indirect=True).
+    """
+    with (
+        patch(f"src.cli.commands.{request.param}.load_config") as mock_config,
+        patch(
+            "src.core.auth.load_auth",
+            side_effect=AuthenticationError("Not authenticated"),
+        ),
+    ):
+        mock_config.return_value = fast_config
+        yield
+
+
+@pytest.fixture(scope="session")
+def config_bytes(config_data: dict[str, Any]) -> bytes:
+    """Sample configuration serialized as a config file's contents."""
+    return json.dumps(config_data).encode()
+
+
 @pytest.fixture
-def config_file(tmp_path: Path, config_data: dict[str, Any]) -> Path:
+def config_file(tmp_path: Path, config_bytes: bytes) -> Path:
     """Create a temporary config file."""
     path = tmp_path / "config.json"
-    path.write_text(json.dumps(config_data))
+    path.write_bytes(config_bytes)
     return path
@@ -1,5 +1,11 @@
 """Tests for authentication module."""
 
+import json
+import os
+import time
+from collections.abc import Iterator
+from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -7,19 +13,28 @@ import pytest
 from src.core.auth import (
     _get_oauth_credentials,
     _validate_credentials,
+    clear_auth_cache,
     load_auth,
     setup_auth,
 )
 from src.core.exceptions import AuthenticationError
 
 
+@pytest.fixture(autouse=True)
+def _reset_auth_cache() -> Iterator[None]:
+    """Ensure each test starts without cached auth objects."""
+    clear_auth_cache()
+    yield
+    clear_auth_cache()
+
+
 class TestValidateCredentials:
     """Tests for _validate_credentials helper."""
 
     @patch("src.core.auth.load_config")
     def test_valid_credentials(self, mock_config: MagicMock) -> None:
         """Returns tuple of (client_id, client_secret) from config."""
-        mock_config.return_value = MagicMock(
+        mock_config.return_value = SimpleNamespace(
             client_id="test_id", client_secret="test_secret"
         )
         client_id, client_secret = _validate_credentials()
@@ -29,14 +44,18 @@ class TestValidateCredentials:
     @patch("src.core.auth.load_config")
     def test_missing_client_id(self, mock_config: MagicMock) -> None:
         """Raises AuthenticationError when client_id is empty."""
-        mock_config.return_value = MagicMock(client_id="", client_secret="test_secret")
+        mock_config.return_value = SimpleNamespace(
+            client_id="", client_secret="test_secret"
+        )
         with pytest.raises(AuthenticationError, match="client_id"):
             _validate_credentials()
 
     @patch("src.core.auth.load_config")
     def test_missing_client_secret(self, mock_config: MagicMock) -> None:
         """Raises AuthenticationError when client_secret is empty."""
-        mock_config.return_value = MagicMock(client_id="test_id", client_secret="")
+        mock_config.return_value = SimpleNamespace(
+            client_id="test_id", client_secret=""
+        )
         with pytest.raises(AuthenticationError, match="client_id"):
             _validate_credentials()
 
@@ -47,7 +66,7 @@ class TestGetOAuthCredentials:
     @patch("src.core.auth.load_config")
     def test_valid_credentials(self, mock_config: MagicMock) -> None:
         """Returns OAuthCredentials when config has client_id and secret."""
-        mock_config.return_value = MagicMock(
+        mock_config.return_value = SimpleNamespace(
             client_id="test_id", client_secret="test_secret"
         )
         creds = _get_oauth_credentials()
@@ -57,111 +76,173 @@ class TestGetOAuthCredentials:
     @patch("src.core.auth.load_config")
     def test_missing_client_id(self, mock_config: MagicMock) -> None:
         """Raises AuthenticationError when client_id is empty."""
-        mock_config.return_value = MagicMock(client_id="", client_secret="test_secret")
+        mock_config.return_value = SimpleNamespace(
+            client_id="", client_secret="test_secret"
+        )
         with pytest.raises(AuthenticationError, match="client_id"):
             _get_oauth_credentials()
 
+    @patch("src.core.auth.load_config")
+    def test_reuses_credentials_for_same_pair(self, mock_config: MagicMock) -> None:
+        """Unchanged client_id/secret return the same OAuthCredentials."""
+        mock_config.return_value = SimpleNamespace(
+            client_id="test_id", client_secret="test_secret"
+        )
+        assert _get_oauth_credentials() is _get_oauth_credentials()
+
+    @patch("src.core.auth.load_config")
+    def test_rebuilds_when_credentials_change(self, mock_config: MagicMock) -> None:
+        """A new client_id/secret pair gets a fresh OAuthCredentials."""
+        mock_config.return_value = SimpleNamespace(
+            client_id="first_id", client_secret="test_secret"
+        )
+        first = _get_oauth_credentials()
+
+        mock_config.return_value = SimpleNamespace(
+            client_id="second_id", client_secret="test_secret"
+        )
+        second = _get_oauth_credentials()
+
+        assert second is not first
+        assert second.client_id == "second_id"
+
 
 class TestSetupAuth:
     """Tests for OAuth setup flow."""
 
-    @patch("src.core.auth.YTMusic")
+    @pytest.fixture(autouse=True)
+    def oauth_file(self, tmp_path: Path) -> Iterator[Path]:
+        """Point OAUTH_FILE at a not-yet-existing config dir."""
+        path = tmp_path / "ymd" / "oauth.json"
+        with patch("src.core.auth.OAUTH_FILE", path):
+            yield path
+
+    def test_core_does_not_import_cli(self) -> None:
+        """Auth reports through exceptions, not the CLI console."""
+        import src.core.auth as auth_module
+
+        assert not hasattr(auth_module, "console")
+
     @patch("src.core.auth.ytmusicapi_setup_oauth")
     @patch("src.core.auth._validate_credentials")
     def test_setup_success(
         self,
         mock_validate: MagicMock,
         mock_setup_oauth: MagicMock,
-        mock_ytmusic_cls: MagicMock,
+        oauth_file: Path,
     ) -> None:
-        """Successful OAuth setup returns True."""
+        """Successful OAuth setup runs the flow against OAUTH_FILE."""
         mock_validate.return_value = ("test_id", "test_secret")
-
-        mock_instance = MagicMock()
-        mock_instance.get_library_playlists.return_value = [{"title": "Test"}]
-        mock_ytmusic_cls.return_value = mock_instance
         mock_setup_oauth.return_value = None
 
-        result = setup_auth()
+        setup_auth()
 
-        assert result is True
         mock_setup_oauth.assert_called_once_with(
             client_id="test_id",
             client_secret="test_secret",
-            filepath="oauth.json",
+            filepath=str(oauth_file),
             open_browser=True,
         )
+        assert oauth_file.parent.is_dir()
 
-    @patch("src.core.auth._validate_credentials")
-    def test_setup_failure_missing_credentials(
+    @patch("src.core.auth.ytmusicapi_setup_oauth")
+    @patch("src.core.auth._get_oauth_credentials")
+    def test_setup_builds_credentials_once(
         self,
-        mock_validate: MagicMock,
+        mock_get_credentials: MagicMock,
+        mock_setup_oauth: MagicMock,
     ) -> None:
-        """Setup returns False when OAuth credentials are missing."""
-        mock_validate.side_effect = AuthenticationError("Missing creds")
-
-        result = setup_auth()
-        assert result is False
-
+        """The flow takes its id and secret from one OAuthCredentials."""
+        creds = mock_get_credentials.return_value
+        creds.client_id = "test_id"
+        creds.client_secret = "test_secret"
+
+        setup_auth()
+
+        mock_get_credentials.assert_called_once()
+        assert mock_setup_oauth.call_args.kwargs["client_id"] == "test_id"
+
+    @pytest.mark.parametrize(
+        ("validate_error", "oauth_error", "match"),
+        [
+            (AuthenticationError("Missing creds"), None, "Missing creds"),
+            (None, Exception("OAuth failed"), "OAuth failed"),
+        ],
+        ids=["missing_credentials", "oauth_error"],
+    )
     @patch("src.core.auth.ytmusicapi_setup_oauth")
     @patch("src.core.auth._validate_credentials")
-    def test_setup_failure_oauth_error(
+    def test_setup_failure(
         self,
         mock_validate: MagicMock,
         mock_setup_oauth: MagicMock,
+        validate_error: Exception | None,
+        oauth_error: Exception | None,
+        match: str,
     ) -> None:
-        """Failed OAuth setup returns False."""
+        """Missing credentials or a failed flow raise AuthenticationError."""
         mock_validate.return_value = ("test_id", "test_secret")
-        mock_setup_oauth.side_effect = Exception("OAuth failed")
+        mock_validate.side_effect = validate_error
+        mock_setup_oauth.side_effect = oauth_error
 
-        result = setup_auth()
-        assert result is False
+        with pytest.raises(AuthenticationError, match=match):
+            setup_auth()
 
     @patch("src.core.auth.YTMusic")
     @patch("src.core.auth.ytmusicapi_setup_oauth")
     @patch("src.core.auth._validate_credentials")
-    def test_setup_failure_validation_error(
+    def test_setup_makes_no_validation_request(
         self,
         mock_validate: MagicMock,
         mock_setup_oauth: MagicMock,
         mock_ytmusic_cls: MagicMock,
     ) -> None:
-        """Setup returns False when credential validation fails."""
+        """The token exchange is trusted; no extra API round-trip is made."""
         mock_validate.return_value = ("test_id", "test_secret")
         mock_setup_oauth.return_value = None
-        mock_instance = MagicMock()
-        mock_instance.get_library_playlists.side_effect = Exception("Bad creds")
-        mock_ytmusic_cls.return_value = mock_instance
 
-        result = setup_auth()
-        assert result is False
+        setup_auth()
+        mock_ytmusic_cls.assert_not_called()
 
 
 class TestLoadAuth:
     """Tests for loading saved credentials."""
 
-    @patch("src.core.auth.OAUTH_FILE")
-    def test_missing_credentials(self, mock_oauth_file: MagicMock) -> None:
+    @pytest.fixture
+    def oauth_file(self, tmp_path: Path) -> Iterator[Path]:
+        """Point OAUTH_FILE at a stored, empty token file."""
+        path = tmp_path / "oauth.json"
+        path.write_bytes(b"{}")
+        with patch("src.core.auth.OAUTH_FILE", path):
+            yield path
+
+    @pytest.fixture
+    def mock_get_creds(self) -> Iterator[MagicMock]:
+        """Patch the OAuthCredentials lookup."""
+        with patch("src.core.auth._get_oauth_credentials") as mock:
+            yield mock
+
+    @pytest.fixture
+    def mock_ytmusic_cls(self) -> Iterator[MagicMock]:
+        """Patch the YTMusic client class."""
+        with patch("src.core.auth.YTMusic") as mock:
+            yield mock
+
+    def test_missing_credentials(self, tmp_path: Path) -> None:
         """Raises AuthenticationError when no credentials exist."""
-        mock_oauth_file.exists.return_value = False
-
-        with pytest.raises(AuthenticationError, match="Not authenticated"):
+        with (
+            patch("src.core.auth.OAUTH_FILE", tmp_path / "oauth.json"),
+            pytest.raises(AuthenticationError, match="Not authenticated"),
+        ):
             load_auth()
 
-    @patch("src.core.auth.YTMusic")
-    @patch("src.core.auth._get_oauth_credentials")
-    @patch("src.core.auth.OAUTH_FILE")
     def test_valid_credentials(
         self,
-        mock_oauth_file: MagicMock,
         mock_get_creds: MagicMock,
         mock_ytmusic_cls: MagicMock,
+        oauth_file: Path,
     ) -> None:
         """Valid credentials return YTMusic instance."""
-        mock_oauth_file.exists.return_value = True
-        mock_oauth_file.configure_mock(
-            **{"__str__": MagicMock(return_value="oauth.json")}
-        )
         mock_get_creds.return_value = MagicMock()
 
         mock_instance = MagicMock()
@@ -172,63 +253,184 @@ class TestLoadAuth:
 
         assert result is mock_instance
 
-    @patch("src.core.auth.YTMusic")
-    @patch("src.core.auth._get_oauth_credentials")
-    @patch("src.core.auth.OAUTH_FILE")
-    def test_invalid_credentials(
+    def test_load_auth_skips_validation_request(
         self,
-        mock_oauth_file: MagicMock,
         mock_get_creds: MagicMock,
         mock_ytmusic_cls: MagicMock,
+        oauth_file: Path,
     ) -> None:
-        """Invalid credentials raise AuthenticationError."""
-        mock_oauth_file.exists.return_value = True
-        mock_oauth_file.configure_mock(
-            **{"__str__": MagicMock(return_value="oauth.json")}
-        )
+        """load_auth builds the client without a validation round-trip."""
         mock_get_creds.return_value = MagicMock()
 
         mock_instance = MagicMock()
-        mock_instance.get_library_playlists.side_effect = Exception("Expired")
+        mock_instance.get_library_playlists.return_value = []
         mock_ytmusic_cls.return_value = mock_instance
 
-        with pytest.raises(AuthenticationError, match="invalid"):
+        load_auth()
+
+        mock_instance.get_library_playlists.assert_not_called()
+
+    @pytest.mark.parametrize(
+        ("credentials_error", "ytmusic_error", "match"),
+        [
+            (AuthenticationError("Missing creds"), None, "Missing creds"),
+            (None, Exception("Malformed token file"), "invalid"),
+        ],
+        ids=["missing_oauth_credentials", "invalid_token_file"],
+    )
+    def test_load_auth_failure(
+        self,
+        mock_get_creds: MagicMock,
+        mock_ytmusic_cls: MagicMock,
+        oauth_file: Path,
+        credentials_error: Exception | None,
+        ytmusic_error: Exception | None,
+        match: str,
+    ) -> None:
+        """Missing client credentials or an unusable token file raise."""
+        mock_get_creds.side_effect = credentials_error
+        mock_ytmusic_cls.side_effect = ytmusic_error
+
+        with pytest.raises(AuthenticationError, match=match):
             load_auth()
 
-    @patch("src.core.auth.YTMusic")
-    @patch("src.core.auth._get_oauth_credentials")
-    @patch("src.core.auth.OAUTH_FILE")
-    def test_load_auth_calls_validation(
+    def test_load_auth_reuses_cached_client(
         self,
-        mock_oauth_file: MagicMock,
         mock_get_creds: MagicMock,
         mock_ytmusic_cls: MagicMock,
+        tmp_path: Path,
     ) -> None:
-        """load_auth validates credentials with a library request."""
-        mock_oauth_file.exists.return_value = True
-        mock_oauth_file.configure_mock(
-            **{"__str__": MagicMock(return_value="oauth.json")}
-        )
+        """Repeated load_auth calls reuse the client until oauth.json changes."""
+        oauth_file = tmp_path / "oauth.json"
+        oauth_file.write_text("{}")
         mock_get_creds.return_value = MagicMock()
 
-        mock_instance = MagicMock()
-        mock_instance.get_library_playlists.return_value = []
-        mock_ytmusic_cls.return_value = mock_instance
+        with patch("src.core.auth.OAUTH_FILE", oauth_file):
+            first = load_auth()
+            second = load_auth()
+            assert first is second
+            assert mock_ytmusic_cls.call_count == 1
 
-        load_auth()
+            stat = oauth_file.stat()
+            os.utime(oauth_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 10**9))
+            load_auth()
+            assert mock_ytmusic_cls.call_count == 2
+
+    def test_load_auth_refreshes_expiring_token(
+        self,
+        mock_get_creds: MagicMock,
+        mock_ytmusic_cls: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """A token close to expiry is refreshed and written back before use."""
+        oauth_file = tmp_path / "oauth.json"
+        oauth_file.write_text(
+            json.dumps(
+                {
+                    "access_token": "old",
+                    "refresh_token": "refresh",
+                    "expires_at": int(time.time()) + 30,
+                }
+            )
+        )
+        mock_creds = MagicMock()
+        mock_creds.refresh_token.return_value = {
+            "access_token": "new",
+            "expires_in": 3600,
+        }
+        mock_get_creds.return_value = mock_creds
+
+        with patch("src.core.auth.OAUTH_FILE", oauth_file):
+            load_auth()
 
-        mock_instance.get_library_playlists.assert_called_once_with(limit=1)
+        mock_creds.refresh_token.assert_called_once_with("refresh")
+        data = json.loads(oauth_file.read_text())
+        assert data["access_token"] == "new"
+        assert data["expires_at"] > time.time() + 3000
+        assert not oauth_file.with_name("oauth.json.tmp").exists()
 
-    @patch("src.core.auth._get_oauth_credentials")
-    @patch("src.core.auth.OAUTH_FILE")
-    def test_load_auth_missing_oauth_credentials(
+    def test_interrupted_refresh_write_keeps_token_file(
+        self,
+        mock_get_creds: MagicMock,
+        mock_ytmusic_cls: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """A write cut short during refresh leaves oauth.json untouched."""
+        oauth_file = tmp_path / "oauth.json"
+        original = json.dumps(
+            {
+                "access_token": "old",
+                "refresh_token": "refresh",
+                "expires_at": int(time.time()) + 30,
+            }
+        )
+        oauth_file.write_text(original)
+        mock_creds = MagicMock()
+        mock_creds.refresh_token.return_value = {
+            "access_token": "new",
+            "expires_in": 3600,
+        }
+        mock_get_creds.return_value = mock_creds
+
+        def torn_write(path: Path, data: bytes) -> int:
+            with path.open("wb") as f:
+                f.write(data[:10])
+            raise OSError("disk full")
+
+        with (
+            patch("src.core.auth.OAUTH_FILE", oauth_file),
+            patch.object(Path, "write_bytes", torn_write),
+            pytest.raises(OSError, match="disk full"),
+        ):
+            load_auth()
+
+        assert oauth_file.read_text() == original
+
+    def test_load_auth_skips_refresh_for_fresh_token(
         self,
-        mock_oauth_file: MagicMock,
         mock_get_creds: MagicMock,
+        mock_ytmusic_cls: MagicMock,
+        tmp_path: Path,
     ) -> None:
-        """load_auth raises when config lacks client_id/secret."""
-        mock_oauth_file.exists.return_value = True
-        mock_get_creds.side_effect = AuthenticationError("Missing creds")
+        """A token well within its lifetime is not refreshed."""
+        oauth_file = tmp_path / "oauth.json"
+        oauth_file.write_text(
+            json.dumps(
+                {
+                    "access_token": "current",
+                    "refresh_token": "refresh",
+                    "expires_at": int(time.time()) + 3600,
+                }
+            )
+        )
+        mock_creds = MagicMock()
+        mock_get_creds.return_value = mock_creds
 
-        with pytest.raises(AuthenticationError, match="Missing creds"):
+        with patch("src.core.auth.OAUTH_FILE", oauth_file):
             load_auth()
+
+        mock_creds.refresh_token.assert_not_called()
+
+    def test_load_auth_refresh_failure(
+        self,
+        mock_get_creds: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """A failed refresh raises AuthenticationError."""
+        oauth_file = tmp_path / "oauth.json"
+        oauth_file.write_text(
+            json.dumps(
+                {
+                    "access_token": "old",
+                    "refresh_token": "revoked",
+                    "expires_at": int(time.time()) - 10,
+                }
+            )
+        )
+        mock_creds = MagicMock()
+        mock_creds.refresh_token.side_effect = Exception("invalid_grant")
+        mock_get_creds.return_value = mock_creds
+
+        with patch("src.core.auth.OAUTH_FILE", oauth_file):
+            with pytest.raises(AuthenticationError, match="refresh"):
+                load_auth()
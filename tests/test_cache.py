@@ -0,0 +1,80 @@
+"""Tests for the on-disk playlist cache."""
+
+import os
+from pathlib import Path
+from unittest.mock import MagicMock, patch
+
+from src.core.cache import PlaylistCache
+
+TRACKS = [{"videoId": "abc", "title": "Song"}]
+
+
+class TestPlaylistCache:
+    """Tests for PlaylistCache."""
+
+    def test_miss_when_empty(self, tmp_path: Path) -> None:
+        """An unknown key is a miss, even before the directory exists."""
+        cache = PlaylistCache(tmp_path / "playlists")
+        assert cache.get("PL001") is None
+
+    def test_round_trip(self, tmp_path: Path) -> None:
+        """Stored tracks are read back, by a fresh instance too."""
+        PlaylistCache(tmp_path).set("PL001", TRACKS)
+        assert PlaylistCache(tmp_path).get("PL001") == TRACKS
+
+    @patch("src.core.cache.time.time")
+    def test_expired_entry_is_dropped(
+        self, mock_time: MagicMock, tmp_path: Path
+    ) -> None:
+        """An entry older than the TTL is a miss and is deleted."""
+        cache = PlaylistCache(tmp_path, ttl=60)
+        mock_time.return_value = 1000.0
+        cache.set("PL001", TRACKS)
+
+        mock_time.return_value = 1061.0
+        assert cache.get("PL001") is None
+        assert list(tmp_path.glob("*.json")) == []
+
+    def test_evicts_least_recently_used(self, tmp_path: Path) -> None:
+        """Beyond max_entries the entry unused the longest goes first."""
+        cache = PlaylistCache(tmp_path, max_entries=2)
+        cache.set("PL001", TRACKS)
+        cache.set("PL002", TRACKS)
+        for age, key in ((300, "PL001"), (200, "PL002")):
+            path = cache._path(key)
+            past = path.stat().st_mtime - age
+            os.utime(path, (past, past))
+
+        cache.get("PL001")  # marks PL001 as used just now
+        cache.set("PL003", TRACKS)
+
+        assert cache.get("PL001") == TRACKS
+        assert cache.get("PL002") is None
+        assert cache.get("PL003") == TRACKS
+
+    def test_corrupt_entry_is_a_miss(self, tmp_path: Path) -> None:
+        """An unreadable entry is ignored rather than raised."""
+        cache = PlaylistCache(tmp_path)
+        cache.set("PL001", TRACKS)
+        cache._path("PL001").write_bytes(b"{not json")
+
+        assert cache.get("PL001") is None
+
+    def test_write_failure_is_not_raised(self, tmp_path: Path) -> None:
+        """A cache that can't be written doesn't fail the caller."""
+        blocker = tmp_path / "file"
+        blocker.write_text("")
+        cache = PlaylistCache(blocker / "playlists")
+
+        cache.set("PL001", TRACKS)
+        assert cache.get("PL001") is None
+
+    def test_clear(self, tmp_path: Path) -> None:
+        """clear() drops every entry."""
+        cache = PlaylistCache(tmp_path)
+        cache.set("PL001", TRACKS)
+        cache.set("__liked__", TRACKS)
+
+        cache.clear()
+        assert cache.get("PL001") is None
+        assert cache.get("__liked__") is None
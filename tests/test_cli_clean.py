@@ -1,12 +1,14 @@
 """Tests for CLI clean command."""
 
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
 from typer.testing import CliRunner
 
+from src.cli.commands.clean import _fetch_current_ids
 from src.cli.main import app
-from src.core.exceptions import AuthenticationError
+from src.core.exceptions import AuthenticationError, PlaylistNotFoundError
 
 runner = CliRunner()
 
@@ -20,7 +22,9 @@ class TestCliClean:
         self, mock_config: MagicMock, mock_sync_cls: MagicMock
     ) -> None:
         """Clean exits 0 when no sync state exists."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
+        mock_config.return_value = SimpleNamespace(
+            download_dir=Path("downloads"), rate_limit=5.0
+        )
         mock_state = MagicMock()
         mock_state.total_tracks = 0
         mock_sync_cls.return_value = mock_state
@@ -28,8 +32,8 @@ class TestCliClean:
         assert result.exit_code == 0
         assert "sync" in result.output.lower()
 
-    @patch("src.cli.commands.clean.YouTubeProvider")
-    @patch("src.cli.commands.clean.load_auth")
+    @patch("src.providers.youtube.YouTubeProvider")
+    @patch("src.core.auth.load_auth")
     @patch("src.cli.commands.clean.SyncState")
     @patch("src.cli.commands.clean.load_config")
     def test_clean_auth_failure(
@@ -40,7 +44,9 @@ class TestCliClean:
         mock_provider_cls: MagicMock,
     ) -> None:
         """Clean exits 1 when authentication fails."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
+        mock_config.return_value = SimpleNamespace(
+            download_dir=Path("downloads"), rate_limit=5.0
+        )
         mock_state = MagicMock()
         mock_state.total_tracks = 5
         mock_sync_cls.return_value = mock_state
@@ -48,8 +54,37 @@ class TestCliClean:
         result = runner.invoke(app, ["clean"])
         assert result.exit_code == 1
 
-    @patch("src.cli.commands.clean.YouTubeProvider")
-    @patch("src.cli.commands.clean.load_auth")
+    @patch("src.providers.youtube.YouTubeProvider")
+    @patch("src.core.auth.load_auth")
+    @patch("src.cli.commands.clean.SyncState")
+    @patch("src.cli.commands.clean.load_config")
+    def test_clean_rejected_credentials_abort(
+        self,
+        mock_config: MagicMock,
+        mock_sync_cls: MagicMock,
+        mock_auth: MagicMock,
+        mock_provider_cls: MagicMock,
+    ) -> None:
+        """Clean aborts, rather than treating everything as orphaned."""
+        mock_config.return_value = SimpleNamespace(
+            download_dir=Path("downloads"), rate_limit=5.0
+        )
+        mock_state = MagicMock()
+        mock_state.total_tracks = 5
+        mock_state.synced_playlists = {"PL001": {}}
+        mock_sync_cls.return_value = mock_state
+        mock_auth.return_value = MagicMock()
+        mock_provider = MagicMock()
+        mock_provider.iter_playlist_video_ids.side_effect = AuthenticationError(
+            "Stored credentials were rejected"
+        )
+        mock_provider_cls.return_value = mock_provider
+        result = runner.invoke(app, ["clean", "--yes"])
+        assert result.exit_code == 1
+        mock_state.get_orphaned_tracks.assert_not_called()
+
+    @patch("src.providers.youtube.YouTubeProvider")
+    @patch("src.core.auth.load_auth")
     @patch("src.cli.commands.clean.SyncState")
     @patch("src.cli.commands.clean.load_config")
     def test_clean_no_orphans(
@@ -60,7 +95,9 @@ class TestCliClean:
         mock_provider_cls: MagicMock,
     ) -> None:
         """Clean exits 0 when no orphaned tracks found."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
+        mock_config.return_value = SimpleNamespace(
+            download_dir=Path("downloads"), rate_limit=5.0
+        )
         mock_state = MagicMock()
         mock_state.total_tracks = 5
         mock_state.synced_playlists = {}
@@ -74,8 +111,8 @@ class TestCliClean:
         assert result.exit_code == 0
         assert "No orphaned" in result.output or "in sync" in result.output
 
-    @patch("src.cli.commands.clean.YouTubeProvider")
-    @patch("src.cli.commands.clean.load_auth")
+    @patch("src.providers.youtube.YouTubeProvider")
+    @patch("src.core.auth.load_auth")
     @patch("src.cli.commands.clean.SyncState")
     @patch("src.cli.commands.clean.load_config")
     def test_clean_dry_run(
@@ -86,7 +123,9 @@ class TestCliClean:
         mock_provider_cls: MagicMock,
     ) -> None:
         """Clean with --dry-run shows orphans but doesn't delete."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
+        mock_config.return_value = SimpleNamespace(
+            download_dir=Path("downloads"), rate_limit=5.0
+        )
         mock_state = MagicMock()
         mock_state.total_tracks = 5
         mock_state.synced_playlists = {}
@@ -105,4 +144,80 @@ class TestCliClean:
         mock_provider_cls.return_value = mock_provider
         result = runner.invoke(app, ["clean", "--dry-run"])
         assert result.exit_code == 0
-        assert "Dry run" in result.output or "dry run" in result.output.lower()
+        assert "dry run" in result.output.lower()
+        assert "Found 1 orphaned tracks:" in result.output
+        assert "Old Artist - Old Song" in result.output
+        assert "/tmp/old.mp3" in result.output
+
+    @patch("src.providers.youtube.YouTubeProvider")
+    @patch("src.core.auth.load_auth")
+    @patch("src.cli.commands.clean.SyncState")
+    @patch("src.cli.commands.clean.load_config")
+    def test_clean_removes_files_and_empty_dirs(
+        self,
+        mock_config: MagicMock,
+        mock_sync_cls: MagicMock,
+        mock_auth: MagicMock,
+        mock_provider_cls: MagicMock,
+        tmp_path: Path,
+    ) -> None:
+        """Clean deletes orphans and prunes only directories left empty."""
+        emptied = tmp_path / "Rock" / "Queen"
+        emptied.mkdir(parents=True)
+        kept = tmp_path / "Pop" / "Abba"
+        kept.mkdir(parents=True)
+        (kept / "Keep.mp3").write_text("x")
+
+        orphans = [emptied / "A.mp3", emptied / "B.mp3", kept / "C.mp3"]
+        for f in orphans:
+            f.write_text("x")
+
+        mock_config.return_value = SimpleNamespace(
+            download_dir=tmp_path, rate_limit=5.0
+        )
+        mock_state = MagicMock()
+        mock_state.total_tracks = 4
+        mock_state.synced_playlists = {}
+        mock_state.get_orphaned_tracks.return_value = [
+            {"artist": "A", "title": f.stem, "filepath": str(f), "video_id": f.stem}
+            for f in orphans
+        ]
+        mock_sync_cls.return_value = mock_state
+        mock_auth.return_value = MagicMock()
+        mock_provider_cls.return_value = MagicMock()
+
+        result = runner.invoke(app, ["clean", "--yes"])
+        assert result.exit_code == 0
+        assert "Removed 3 files" in result.output
+        assert not emptied.exists()
+        assert (kept / "Keep.mp3").exists()
+        assert mock_state.remove_track.call_count == 3
+        mock_state.save.assert_called_once()
+
+
+class TestFetchCurrentIds:
+    """Tests for gathering remote video IDs."""
+
+    def test_merges_playlists_and_liked(self) -> None:
+        """IDs from every playlist and liked songs are combined."""
+        provider = MagicMock()
+        provider.iter_playlist_video_ids.side_effect = lambda pid: iter(
+            {"PL1": ["a", "b"], "PL2": ["c"]}[pid]
+        )
+        provider.iter_liked_video_ids.return_value = iter(["d"])
+
+        assert _fetch_current_ids(provider, ["PL1", "PL2"]) == {"a", "b", "c", "d"}
+
+    def test_failed_playlist_skipped(self) -> None:
+        """A playlist that can't be fetched doesn't stop the others."""
+        provider = MagicMock()
+
+        def iter_ids(pid: str) -> list[str]:
+            if pid == "PL_BAD":
+                raise PlaylistNotFoundError("gone")
+            return ["a"]
+
+        provider.iter_playlist_video_ids.side_effect = iter_ids
+        provider.iter_liked_video_ids.return_value = iter([])
+
+        assert _fetch_current_ids(provider, ["PL_BAD", "PL1"]) == {"a"}
@@ -1,14 +1,27 @@
 """Tests for CLI config command."""
 
+from types import SimpleNamespace
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from src.cli.main import app
+from src.core.config import AppConfig
 
 runner = CliRunner()
 
 
+def _config_dump(*, mode: str = "python") -> dict[str, Any]:
+    """Stand-in for AppConfig.model_dump on a default config.
+
+    Takes model_dump's mode keyword because config --show calls it with
+    mode="json". Returns a fresh dict each call, since --set edits it.
+    """
+    return AppConfig().model_dump(mode=mode)
+
+
 class TestCliConfig:
     """Tests for the config CLI command."""
 
@@ -18,68 +31,70 @@ class TestCliConfig:
         result = runner.invoke(app, ["config", "--init"])
         assert result.exit_code == 0
         mock_save.assert_called_once()
-        assert "Created" in result.output or "config" in result.output.lower()
+        output = result.output.lower()
+        assert "created" in output or "config" in output
 
-    @patch("src.cli.commands.config_cmd.load_config")
+    @patch("src.cli.commands.config_cmd.AppConfig.load")
     def test_config_show(self, mock_load: MagicMock) -> None:
         """Config --show displays current configuration."""
-        mock_load.return_value = MagicMock(
-            model_dump=MagicMock(
-                return_value={
-                    "download_dir": "downloads",
-                    "audio_format": "best",
-                    "fallback_format": "mp3",
-                    "organize_by": "genre_artist",
-                    "max_filename_length": 120,
-                    "max_concurrent_downloads": 3,
-                    "default_genre": "Unknown",
-                    "client_id": "",
-                    "client_secret": "",
-                }
-            )
-        )
+        mock_load.return_value = SimpleNamespace(model_dump=_config_dump)
         result = runner.invoke(app, ["config", "--show"])
         assert result.exit_code == 0
         assert "download_dir" in result.output
 
     @patch("src.cli.commands.config_cmd.save_config")
-    @patch("src.cli.commands.config_cmd.load_config")
+    @patch("src.cli.commands.config_cmd.AppConfig.load")
     def test_config_set_value(self, mock_load: MagicMock, mock_save: MagicMock) -> None:
         """Config --set updates a config value."""
-        mock_load.return_value = MagicMock(
-            model_dump=MagicMock(
-                return_value={
-                    "download_dir": "downloads",
-                    "audio_format": "best",
-                    "fallback_format": "mp3",
-                    "organize_by": "genre_artist",
-                    "max_filename_length": 120,
-                    "max_concurrent_downloads": 3,
-                    "default_genre": "Unknown",
-                    "client_id": "",
-                    "client_secret": "",
-                }
-            )
-        )
+        mock_load.return_value = SimpleNamespace(model_dump=_config_dump)
         result = runner.invoke(app, ["config", "--set", "audio_format=mp3"])
         assert result.exit_code == 0
         mock_save.assert_called_once()
 
-    @patch("src.cli.commands.config_cmd.load_config")
-    def test_config_set_invalid_format(self, mock_load: MagicMock) -> None:
-        """Config --set with invalid format exits 1."""
-        mock_load.return_value = MagicMock(
-            model_dump=MagicMock(return_value={"download_dir": "downloads"})
-        )
-        result = runner.invoke(app, ["config", "--set", "invalid_no_equals"])
+    @pytest.mark.parametrize(
+        ("assignment", "message"),
+        [
+            ("invalid_no_equals", "Invalid format"),
+            ("nonexistent_key=value", "Unknown config key"),
+        ],
+        ids=["missing_equals", "unknown_key"],
+    )
+    @patch("src.cli.commands.config_cmd.AppConfig.load")
+    def test_config_set_rejects(
+        self, mock_load: MagicMock, assignment: str, message: str
+    ) -> None:
+        """Config --set with a malformed or unknown assignment exits 1."""
+        mock_load.return_value = SimpleNamespace(model_dump=_config_dump)
+        result = runner.invoke(app, ["config", "--set", assignment])
         assert result.exit_code == 1
+        assert message in result.output
 
-    @patch("src.cli.commands.config_cmd.load_config")
-    def test_config_set_unknown_key(self, mock_load: MagicMock) -> None:
-        """Config --set with unknown key exits 1."""
-        mock_load.return_value = MagicMock(
-            model_dump=MagicMock(return_value={"download_dir": "downloads"})
-        )
-        result = runner.invoke(app, ["config", "--set", "nonexistent_key=value"])
-        assert result.exit_code == 1
-        assert "Unknown" in result.output
+
+class TestFieldCasters:
+    """Tests for the config value cast table."""
+
+    def test_int_field(self) -> None:
+        """Integer fields are cast with int()."""
+        from src.cli.commands.config_cmd import _FIELD_CASTERS
+
+        assert _FIELD_CASTERS["max_concurrent_downloads"]("5") == 5
+
+    def test_float_field(self) -> None:
+        """Float fields are cast with float()."""
+        from src.cli.commands.config_cmd import _FIELD_CASTERS
+
+        assert _FIELD_CASTERS["rate_limit"]("2.5") == 2.5
+
+    def test_str_field(self) -> None:
+        """String fields are passed through unchanged."""
+        from src.cli.commands.config_cmd import _FIELD_CASTERS
+
+        assert _FIELD_CASTERS["audio_format"]("mp3") == "mp3"
+
+    def test_bool_caster_not_swallowed_by_int(self) -> None:
+        """bool annotations get a boolean parser, not int()."""
+        from src.cli.commands.config_cmd import _make_caster
+
+        caster = _make_caster(bool)
+        assert caster("yes") is True
+        assert caster("false") is False
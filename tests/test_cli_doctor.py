@@ -1,169 +1,174 @@
 """Tests for CLI doctor command."""
 
+import time
+from collections.abc import Iterator
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
+from src.cli.commands.doctor import (
+    _check_config,
+    _check_ffmpeg,
+    _check_oauth_credentials,
+    _check_oauth_tokens,
+)
 from src.cli.main import app
+from src.cli.ui import print_success
+from src.core.exceptions import ConfigError
 
 runner = CliRunner()
 
+# Doctor checks, as named in src.cli.commands.doctor without the _check_ prefix
+CHECK_NAMES = (
+    "config",
+    "oauth_credentials",
+    "oauth_tokens",
+    "yt_dlp",
+    "ffmpeg",
+    "download_dir",
+    "api_connection",
+)
+
 
 class TestCliDoctor:
     """Tests for the doctor CLI command."""
 
-    @patch("src.cli.commands.doctor._check_api_connection")
-    @patch("src.cli.commands.doctor._check_download_dir")
-    @patch("src.cli.commands.doctor._check_ffmpeg")
-    @patch("src.cli.commands.doctor._check_yt_dlp")
-    @patch("src.cli.commands.doctor._check_oauth_tokens")
-    @patch("src.cli.commands.doctor._check_oauth_credentials")
-    @patch("src.cli.commands.doctor._check_config")
-    def test_all_checks_pass(
-        self,
-        mock_config: MagicMock,
-        mock_creds: MagicMock,
-        mock_tokens: MagicMock,
-        mock_ytdlp: MagicMock,
-        mock_ffmpeg: MagicMock,
-        mock_dldir: MagicMock,
-        mock_api: MagicMock,
-    ) -> None:
-        """All checks passing exits with code 0."""
-        mock_config.return_value = True
-        mock_creds.return_value = True
-        mock_tokens.return_value = True
-        mock_ytdlp.return_value = True
-        mock_ffmpeg.return_value = True
-        mock_dldir.return_value = True
-        mock_api.return_value = True
+    @pytest.fixture
+    def checks(self) -> Iterator[SimpleNamespace]:
+        """Patch every doctor check to pass; tests override what they need.
 
+        Mocks are exposed by check name, e.g. checks.ffmpeg for _check_ffmpeg.
+        """
+        mocks = {name: MagicMock(return_value=True) for name in CHECK_NAMES}
+        with patch.multiple(
+            "src.cli.commands.doctor",
+            **{f"_check_{name}": mock for name, mock in mocks.items()},
+        ):
+            yield SimpleNamespace(**mocks)
+
+    def test_all_checks_pass(self, checks: SimpleNamespace) -> None:
+        """All checks passing exits with code 0."""
         result = runner.invoke(app, ["doctor"])
         assert result.exit_code == 0
         assert "passed" in result.output.lower()
 
+    def test_check_output_stays_in_order(self, checks: SimpleNamespace) -> None:
+        """Concurrent checks print their messages under their own heading."""
+
+        def _ytdlp() -> bool:
+            print_success("ytdlp-message")
+            return True
+
+        def _slow_api() -> bool:
+            time.sleep(0.05)
+            print_success("api-message")
+            return True
+
+        checks.yt_dlp.side_effect = _ytdlp
+        checks.api_connection.side_effect = _slow_api
+
+        result = runner.invoke(app, ["doctor"])
+        assert result.exit_code == 0
+        output = result.output
+        assert (
+            output.index("Checking yt-dlp")
+            < output.index("ytdlp-message")
+            < output.index("Checking ffmpeg")
+            < output.index("Checking API Connection")
+            < output.index("api-message")
+        )
+
     @patch("src.cli.commands.doctor._check_api_connection")
-    @patch("src.cli.commands.doctor._check_download_dir")
     @patch("src.cli.commands.doctor._check_ffmpeg")
     @patch("src.cli.commands.doctor._check_yt_dlp")
     @patch("src.cli.commands.doctor._check_oauth_tokens")
-    @patch("src.cli.commands.doctor._check_oauth_credentials")
-    @patch("src.cli.commands.doctor._check_config")
-    def test_some_checks_fail(
+    @patch("src.cli.commands.doctor.load_config")
+    def test_config_loaded_once(
         self,
-        mock_config: MagicMock,
-        mock_creds: MagicMock,
+        mock_load: MagicMock,
         mock_tokens: MagicMock,
         mock_ytdlp: MagicMock,
         mock_ffmpeg: MagicMock,
-        mock_dldir: MagicMock,
         mock_api: MagicMock,
     ) -> None:
-        """Some failing checks exits with code 1."""
-        mock_config.return_value = True
-        mock_creds.return_value = False
-        mock_tokens.return_value = False
+        """Config-dependent checks share a single load_config call."""
+        mock_load.return_value = MagicMock(download_dir=Path("/nonexistent/ymd"))
+        mock_tokens.return_value = True
         mock_ytdlp.return_value = True
         mock_ffmpeg.return_value = True
-        mock_dldir.return_value = True
         mock_api.return_value = True
 
+        runner.invoke(app, ["doctor"])
+        mock_load.assert_called_once()
+
+    def test_some_checks_fail(self, checks: SimpleNamespace) -> None:
+        """Some failing checks exits with code 1."""
+        checks.oauth_credentials.return_value = False
+        checks.oauth_tokens.return_value = False
+
         result = runner.invoke(app, ["doctor"])
         assert result.exit_code == 1
         assert "failed" in result.output.lower()
 
-    @patch("src.cli.commands.doctor._check_download_dir")
-    @patch("src.cli.commands.doctor._check_ffmpeg")
-    @patch("src.cli.commands.doctor._check_yt_dlp")
-    @patch("src.cli.commands.doctor._check_oauth_tokens")
-    @patch("src.cli.commands.doctor._check_oauth_credentials")
-    @patch("src.cli.commands.doctor._check_config")
-    def test_skip_api_flag(
-        self,
-        mock_config: MagicMock,
-        mock_creds: MagicMock,
-        mock_tokens: MagicMock,
-        mock_ytdlp: MagicMock,
-        mock_ffmpeg: MagicMock,
-        mock_dldir: MagicMock,
-    ) -> None:
+    def test_skip_api_flag(self, checks: SimpleNamespace) -> None:
         """--skip-api skips the API connection check."""
-        mock_config.return_value = True
-        mock_creds.return_value = True
-        mock_tokens.return_value = True
-        mock_ytdlp.return_value = True
-        mock_ffmpeg.return_value = True
-        mock_dldir.return_value = True
-
         result = runner.invoke(app, ["doctor", "--skip-api"])
         assert result.exit_code == 0
         assert "skip" in result.output.lower()
+        checks.api_connection.assert_not_called()
 
 
 class TestDoctorChecks:
     """Tests for individual doctor check functions."""
 
+    @pytest.mark.parametrize(
+        ("exists", "config", "error", "expected"),
+        [
+            (False, None, None, False),
+            (True, MagicMock(), None, True),
+            (True, None, ConfigError("bad value"), False),
+        ],
+        ids=["missing", "valid", "invalid"],
+    )
     @patch("src.cli.commands.doctor.CONFIG_FILE")
-    def test_check_config_missing(self, mock_path: MagicMock) -> None:
-        """_check_config returns False when config.json missing."""
-        mock_path.exists.return_value = False
-        from src.cli.commands.doctor import _check_config
-
-        assert _check_config() is False
-
-    @patch("src.cli.commands.doctor.load_config")
-    @patch("src.cli.commands.doctor.CONFIG_FILE")
-    def test_check_config_valid(
-        self, mock_path: MagicMock, mock_load: MagicMock
+    def test_check_config(
+        self,
+        mock_path: MagicMock,
+        exists: bool,
+        config: MagicMock | None,
+        error: ConfigError | None,
+        expected: bool,
     ) -> None:
-        """_check_config returns True when config is valid."""
-        mock_path.exists.return_value = True
-        mock_load.return_value = MagicMock()
-        from src.cli.commands.doctor import _check_config
-
-        assert _check_config() is True
-
-    @patch("src.cli.commands.doctor.load_config")
-    def test_check_oauth_credentials_missing(self, mock_load: MagicMock) -> None:
-        """_check_oauth_credentials returns False when creds empty."""
-        mock_load.return_value = MagicMock(client_id="", client_secret="")
-        from src.cli.commands.doctor import _check_oauth_credentials
-
-        assert _check_oauth_credentials() is False
-
-    @patch("src.cli.commands.doctor.load_config")
-    def test_check_oauth_credentials_present(self, mock_load: MagicMock) -> None:
-        """_check_oauth_credentials returns True when creds present."""
-        mock_load.return_value = MagicMock(
-            client_id="test_id", client_secret="test_secret"
-        )
-        from src.cli.commands.doctor import _check_oauth_credentials
-
-        assert _check_oauth_credentials() is True
+        """_check_config passes only for an existing file that loaded."""
+        mock_path.exists.return_value = exists
+        assert _check_config(config, error) is expected
+
+    @pytest.mark.parametrize(
+        ("client_id", "client_secret", "expected"),
+        [("", "", False), ("test_id", "test_secret", True)],
+        ids=["missing", "present"],
+    )
+    def test_check_oauth_credentials(
+        self, client_id: str, client_secret: str, expected: bool
+    ) -> None:
+        """_check_oauth_credentials passes only when both creds are set."""
+        config = MagicMock(client_id=client_id, client_secret=client_secret)
+        assert _check_oauth_credentials(config) is expected
 
     def test_check_oauth_tokens_missing(self, tmp_path: Path) -> None:
         """_check_oauth_tokens returns False when file missing."""
-        with patch("src.cli.commands.doctor.Path") as mock_path_cls:
-            mock_file = MagicMock()
-            mock_file.exists.return_value = False
-            mock_path_cls.return_value = mock_file
-            from src.cli.commands.doctor import _check_oauth_tokens
-
+        with patch("src.cli.commands.doctor.OAUTH_FILE", tmp_path / "oauth.json"):
             assert _check_oauth_tokens() is False
 
-    def test_check_ffmpeg_found(self) -> None:
-        """_check_ffmpeg returns True when ffmpeg in PATH."""
-        with patch("src.cli.commands.doctor.shutil.which") as mock_which:
-            mock_which.return_value = "/usr/bin/ffmpeg"
-            from src.cli.commands.doctor import _check_ffmpeg
-
-            assert _check_ffmpeg() is True
-
-    def test_check_ffmpeg_not_found(self) -> None:
-        """_check_ffmpeg returns False when ffmpeg not in PATH."""
-        with patch("src.cli.commands.doctor.shutil.which") as mock_which:
-            mock_which.return_value = None
-            from src.cli.commands.doctor import _check_ffmpeg
-
-            assert _check_ffmpeg() is False
+    @pytest.mark.parametrize(
+        ("which", "expected"),
+        [("/usr/bin/ffmpeg", True), (None, False)],
+        ids=["found", "not_found"],
+    )
+    def test_check_ffmpeg(self, which: str | None, expected: bool) -> None:
+        """_check_ffmpeg passes only when ffmpeg is in PATH."""
+        with patch("src.cli.commands.doctor.shutil.which", return_value=which):
+            assert _check_ffmpeg() is expected
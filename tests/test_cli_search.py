@@ -1,12 +1,16 @@
 """Tests for CLI search command."""
 
-from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import orjson
+import pytest
+from typer import BadParameter
+from typer.main import get_command
 from typer.testing import CliRunner
 
 from src.cli.main import app
-from src.core.exceptions import AuthenticationError
+from src.core.config import FastConfig
+from src.providers.youtube import YouTubeProvider
 
 runner = CliRunner()
 
@@ -14,28 +18,25 @@ runner = CliRunner()
 class TestCliSearch:
     """Tests for the search CLI command."""
 
-    @patch("src.cli.commands.search.load_auth")
-    @patch("src.cli.commands.search.load_config")
-    def test_search_auth_failure(
-        self, mock_config: MagicMock, mock_auth: MagicMock
-    ) -> None:
+    @pytest.mark.parametrize("mock_auth_failure", ["search"], indirect=True)
+    @pytest.mark.usefixtures("mock_auth_failure")
+    def test_search_auth_failure(self) -> None:
         """Search exits 1 when authentication fails."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
-        mock_auth.side_effect = AuthenticationError("Not authenticated")
         result = runner.invoke(app, ["search", "test query"])
         assert result.exit_code == 1
 
-    @patch("src.cli.commands.search.YouTubeProvider")
-    @patch("src.cli.commands.search.load_auth")
+    @patch("src.providers.youtube.YouTubeProvider")
+    @patch("src.core.auth.load_auth")
     @patch("src.cli.commands.search.load_config")
     def test_search_no_results(
         self,
         mock_config: MagicMock,
         mock_auth: MagicMock,
         mock_provider_cls: MagicMock,
+        fast_config: FastConfig,
     ) -> None:
         """Search exits 0 when no results found."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
+        mock_config.return_value = fast_config
         mock_auth.return_value = MagicMock()
         mock_provider = MagicMock()
         mock_provider.search.return_value = []
@@ -44,19 +45,20 @@ class TestCliSearch:
         assert result.exit_code == 0
         assert "No results" in result.output
 
-    @patch("src.cli.commands.search.questionary")
-    @patch("src.cli.commands.search.YouTubeProvider")
-    @patch("src.cli.commands.search.load_auth")
+    @patch("questionary.checkbox")
+    @patch("src.providers.youtube.YouTubeProvider")
+    @patch("src.core.auth.load_auth")
     @patch("src.cli.commands.search.load_config")
     def test_search_no_selection(
         self,
         mock_config: MagicMock,
         mock_auth: MagicMock,
         mock_provider_cls: MagicMock,
-        mock_questionary: MagicMock,
+        mock_checkbox: MagicMock,
+        fast_config: FastConfig,
     ) -> None:
         """Search exits 0 when user selects nothing."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
+        mock_config.return_value = fast_config
         mock_auth.return_value = MagicMock()
         mock_provider = MagicMock()
         mock_provider.search.return_value = [
@@ -69,24 +71,60 @@ class TestCliSearch:
             }
         ]
         mock_provider_cls.return_value = mock_provider
-        mock_questionary.checkbox.return_value.ask.return_value = None
+        mock_checkbox.return_value.ask.return_value = None
         result = runner.invoke(app, ["search", "test"])
         assert result.exit_code == 0
 
+    @patch("questionary.checkbox")
+    @patch("src.providers.youtube.YouTubeProvider")
+    @patch("src.core.auth.load_auth")
+    @patch("src.cli.commands.search.load_config")
+    def test_search_json_lists_without_prompt(
+        self,
+        mock_config: MagicMock,
+        mock_auth: MagicMock,
+        mock_provider_cls: MagicMock,
+        mock_checkbox: MagicMock,
+        fast_config: FastConfig,
+    ) -> None:
+        """--output json writes the results to stdout and skips the prompt."""
+        from src.cli.ui import set_output_format
+
+        mock_config.return_value = fast_config
+        mock_provider_cls.normalize_track.side_effect = YouTubeProvider.normalize_track
+        mock_provider_cls.return_value.search.return_value = [
+            {
+                "title": "Test Song",
+                "artists": [{"name": "Artist"}],
+                "videoId": "abc123",
+            }
+        ]
+        try:
+            result = runner.invoke(app, ["--output", "json", "search", "test"])
+        finally:
+            set_output_format("table")
+
+        assert result.exit_code == 0
+        [track] = orjson.loads(result.stdout)
+        assert track["video_id"] == "abc123"
+        mock_checkbox.assert_not_called()
+
     def test_search_requires_query(self) -> None:
         """Search command requires a query argument."""
-        result = runner.invoke(app, ["search"])
-        assert result.exit_code != 0
+        with pytest.raises(BadParameter) as excinfo:
+            get_command(app).main(["search"], standalone_mode=False)
+        assert excinfo.value.param is not None
+        assert excinfo.value.param.name == "query"
 
-    @patch("src.cli.commands.search.load_auth")
+    @patch("src.core.auth.load_auth")
     @patch("src.cli.commands.search.load_config")
     def test_search_with_limit(
-        self, mock_config: MagicMock, mock_auth: MagicMock
+        self, mock_config: MagicMock, mock_auth: MagicMock, fast_config: FastConfig
     ) -> None:
         """Search accepts --limit option."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
+        mock_config.return_value = fast_config
         mock_auth.return_value = MagicMock()
-        with patch("src.cli.commands.search.YouTubeProvider") as mock_prov_cls:
+        with patch("src.providers.youtube.YouTubeProvider") as mock_prov_cls:
             mock_prov = MagicMock()
             mock_prov.search.return_value = []
             mock_prov_cls.return_value = mock_prov
@@ -1,63 +1,64 @@
 """Tests for CLI status command."""
 
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
+import pytest
 from typer.testing import CliRunner
 
 from src.cli.main import app
+from src.core.config import FastConfig
 
 runner = CliRunner()
 
+# SyncState attributes for a library synced once, from one playlist
+_SYNCED_STATE: dict[str, Any] = {
+    "last_sync": "2026-02-07T10:00:00",
+    "total_tracks": 50,
+    "synced_playlists": {
+        "PL001": {
+            "name": "Rock Classics",
+            "track_count": 50,
+            "last_sync": "2026-02-07T10:00:00",
+        }
+    },
+}
+
 
 class TestCliStatus:
     """Tests for the status CLI command."""
 
+    @pytest.mark.parametrize(
+        ("state", "args", "state_dir", "expected"),
+        [
+            ({"last_sync": None}, [], Path("downloads"), "Never synced"),
+            (_SYNCED_STATE, [], Path("downloads"), "50"),
+            (
+                {"last_sync": None},
+                ["--output-dir", "/tmp/music"],
+                Path("/tmp/music"),
+                "Never synced",
+            ),
+        ],
+        ids=["never_synced", "with_sync_data", "with_output_dir"],
+    )
     @patch("src.cli.commands.status.SyncState")
     @patch("src.cli.commands.status.load_config")
-    def test_status_never_synced(
-        self, mock_config: MagicMock, mock_sync_cls: MagicMock
-    ) -> None:
-        """Status shows warning when never synced."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
-        mock_state = MagicMock()
-        mock_state.last_sync = None
-        mock_sync_cls.return_value = mock_state
-        result = runner.invoke(app, ["status"])
-        assert result.exit_code == 0
-        assert "Never synced" in result.output
-
-    @patch("src.cli.commands.status.SyncState")
-    @patch("src.cli.commands.status.load_config")
-    def test_status_with_sync_data(
-        self, mock_config: MagicMock, mock_sync_cls: MagicMock
-    ) -> None:
-        """Status displays sync info when state exists."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
-        mock_state = MagicMock()
-        mock_state.last_sync = "2026-02-07T10:00:00"
-        mock_state.total_tracks = 50
-        mock_state.synced_playlists = {
-            "PL001": {
-                "name": "Rock Classics",
-                "track_count": 50,
-                "last_sync": "2026-02-07T10:00:00",
-            }
-        }
-        mock_sync_cls.return_value = mock_state
-        result = runner.invoke(app, ["status"])
-        assert result.exit_code == 0
-        assert "50" in result.output
-
-    @patch("src.cli.commands.status.SyncState")
-    @patch("src.cli.commands.status.load_config")
-    def test_status_with_output_dir(
-        self, mock_config: MagicMock, mock_sync_cls: MagicMock
+    def test_status(
+        self,
+        mock_config: MagicMock,
+        mock_sync_cls: MagicMock,
+        fast_config: FastConfig,
+        state: dict[str, Any],
+        args: list[str],
+        state_dir: Path,
+        expected: str,
     ) -> None:
-        """Status accepts --output-dir option."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
-        mock_state = MagicMock()
-        mock_state.last_sync = None
-        mock_sync_cls.return_value = mock_state
-        result = runner.invoke(app, ["status", "--output-dir", "/tmp/music"])
+        """Status reads the state in the download dir and reports on it."""
+        mock_config.return_value = fast_config
+        mock_sync_cls.return_value = MagicMock(**state)
+        result = runner.invoke(app, ["status", *args])
         assert result.exit_code == 0
+        assert expected in result.output
+        mock_sync_cls.assert_called_once_with(state_dir / ".sync_state.json")
@@ -1,34 +1,64 @@
 """Tests for CLI sync command."""
 
+from collections.abc import Iterator
+from contextlib import ExitStack
+from dataclasses import replace
 from pathlib import Path
+from types import SimpleNamespace
 from unittest.mock import MagicMock, patch
 
+import pytest
+from typer import BadParameter
+from typer.main import get_command
 from typer.testing import CliRunner
 
 from src.cli.main import app
-from src.core.exceptions import AuthenticationError
+from src.core.config import MAX_CONCURRENT_DOWNLOADS, FastConfig
 
 runner = CliRunner()
 
+# Collaborators a full sync run reaches, keyed by their name in the pipeline fixture
+SYNC_PIPELINE_TARGETS = {
+    "load_config": "src.cli.commands.sync.load_config",
+    "load_auth": "src.core.auth.load_auth",
+    "provider_cls": "src.providers.youtube.YouTubeProvider",
+    "sync_state_cls": "src.cli.commands.sync.SyncState",
+    "organize_track": "src.cli.commands.sync.organize_track",
+    "tag_file": "src.core.tagger.tag_file",
+    "downloader_cls": "src.cli.commands.sync.Downloader",
+    "cleanup_temp_dir": "src.cli.commands.sync.cleanup_temp_dir",
+}
+
 
 class TestCliSync:
     """Tests for the sync CLI command."""
 
-    @patch("src.cli.commands.sync.load_auth")
-    @patch("src.cli.commands.sync.load_config")
-    def test_sync_auth_failure(
-        self, mock_config: MagicMock, mock_auth: MagicMock
-    ) -> None:
+    @pytest.fixture
+    def pipeline(self, fast_config: FastConfig) -> Iterator[SimpleNamespace]:
+        """Patch everything a sync touches, from config to temp cleanup.
+
+        Mocks are exposed by the keys of SYNC_PIPELINE_TARGETS; load_config
+        returns the default fast_config.
+        """
+        with ExitStack() as stack:
+            mocks = {
+                name: stack.enter_context(patch(target))
+                for name, target in SYNC_PIPELINE_TARGETS.items()
+            }
+            mocks["load_config"].return_value = fast_config
+            yield SimpleNamespace(**mocks)
+
+    @pytest.mark.parametrize("mock_auth_failure", ["sync"], indirect=True)
+    @pytest.mark.usefixtures("mock_auth_failure")
+    def test_sync_auth_failure(self) -> None:
         """Sync exits 1 when authentication fails."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
-        mock_auth.side_effect = AuthenticationError("Not authenticated")
         result = runner.invoke(app, ["sync", "--liked"])
         assert result.exit_code == 1
         assert "Not authenticated" in result.output
 
     @patch("src.cli.commands.sync.SyncState")
-    @patch("src.cli.commands.sync.YouTubeProvider")
-    @patch("src.cli.commands.sync.load_auth")
+    @patch("src.providers.youtube.YouTubeProvider")
+    @patch("src.core.auth.load_auth")
     @patch("src.cli.commands.sync.load_config")
     def test_sync_liked_no_tracks(
         self,
@@ -36,9 +66,10 @@ class TestCliSync:
         mock_auth: MagicMock,
         mock_provider_cls: MagicMock,
         mock_sync_state: MagicMock,
+        fast_config: FastConfig,
     ) -> None:
         """Sync exits 0 when liked songs returns no tracks."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
+        mock_config.return_value = fast_config
         mock_auth.return_value = MagicMock()
         mock_provider = MagicMock()
         mock_provider.get_liked_songs.return_value = []
@@ -46,35 +77,9 @@ class TestCliSync:
         result = runner.invoke(app, ["sync", "--liked"])
         assert result.exit_code == 0
 
-    @patch("src.cli.commands.sync.cleanup_temp_dir")
-    @patch("src.cli.commands.sync.download_track")
-    @patch("src.cli.commands.sync.tag_file")
-    @patch("src.cli.commands.sync.organize_track")
-    @patch("src.cli.commands.sync.SyncState")
-    @patch("src.cli.commands.sync.YouTubeProvider")
-    @patch("src.cli.commands.sync.load_auth")
-    @patch("src.cli.commands.sync.load_config")
-    def test_sync_liked_with_tracks(
-        self,
-        mock_config: MagicMock,
-        mock_auth: MagicMock,
-        mock_provider_cls: MagicMock,
-        mock_sync_state_cls: MagicMock,
-        mock_organize: MagicMock,
-        mock_tag: MagicMock,
-        mock_download: MagicMock,
-        mock_cleanup: MagicMock,
-    ) -> None:
+    def test_sync_liked_with_tracks(self, pipeline: SimpleNamespace) -> None:
         """Sync downloads new tracks from liked songs."""
-        mock_config.return_value = MagicMock(
-            download_dir=Path("downloads"),
-            audio_format="best",
-            fallback_format="mp3",
-            organize_by="genre_artist",
-            max_filename_length=120,
-            default_genre="Unknown",
-        )
-        mock_auth.return_value = MagicMock()
+        pipeline.load_auth.return_value = MagicMock()
 
         mock_provider = MagicMock()
         mock_provider.get_liked_songs.return_value = [
@@ -86,7 +91,7 @@ class TestCliSync:
                 "duration": "3:00",
             }
         ]
-        mock_provider_cls.return_value = mock_provider
+        pipeline.provider_cls.return_value = mock_provider
 
         mock_state = MagicMock()
         mock_state.get_new_tracks.return_value = [
@@ -99,10 +104,11 @@ class TestCliSync:
                 "genre": "",
             }
         ]
-        mock_sync_state_cls.return_value = mock_state
+        pipeline.sync_state_cls.return_value = mock_state
 
+        mock_download = pipeline.downloader_cls.return_value.download
         mock_download.return_value = Path("downloads/.tmp/abc123.mp3")
-        mock_organize.return_value = Path(
+        pipeline.organize_track.return_value = Path(
             "downloads/Unknown/Artist/Artist - Test Song.mp3"
         )
 
@@ -110,9 +116,146 @@ class TestCliSync:
         assert result.exit_code == 0
         mock_download.assert_called_once()
 
+    def test_sync_parallel_jobs(
+        self, pipeline: SimpleNamespace, fast_config: FastConfig
+    ) -> None:
+        """Sync downloads every track with --jobs and records each one."""
+        pipeline.load_config.return_value = replace(
+            fast_config, max_concurrent_downloads=1
+        )
+        pipeline.load_auth.return_value = MagicMock()
+
+        tracks = [
+            {
+                "title": f"Song {i}",
+                "artist": "Artist",
+                "album": "Album",
+                "video_id": f"vid{i}",
+                "duration": "3:00",
+                "genre": "",
+            }
+            for i in range(5)
+        ]
+        mock_provider = MagicMock()
+        mock_provider.get_liked_songs.return_value = [{"videoId": "x"}]
+        pipeline.provider_cls.return_value = mock_provider
+
+        mock_state = MagicMock()
+        mock_state.get_new_tracks.return_value = tracks
+        pipeline.sync_state_cls.return_value = mock_state
+
+        mock_download = pipeline.downloader_cls.return_value.download
+        mock_download.side_effect = lambda vid, *args: Path(f"downloads/.tmp/{vid}.m4a")
+        pipeline.organize_track.side_effect = lambda src, *args: src
+
+        result = runner.invoke(app, ["sync", "--liked", "--jobs", "3"])
+        assert result.exit_code == 0
+        assert mock_download.call_count == 5
+        assert mock_state.mark_downloaded.call_count == 5
+        assert "Downloaded:        5" in result.output
+        pipeline.downloader_cls.assert_called_once_with("best", "mp3")
+
+    def test_sync_unexpected_error_counts_as_failure(
+        self, pipeline: SimpleNamespace, fast_config: FastConfig
+    ) -> None:
+        """An unexpected error in one track is reported, not fatal."""
+        pipeline.load_config.return_value = replace(
+            fast_config, max_concurrent_downloads=2
+        )
+        tracks = [
+            {"title": f"Song {i}", "artist": "Artist", "video_id": f"vid{i}"}
+            for i in range(4)
+        ]
+        pipeline.provider_cls.return_value.get_liked_songs.return_value = [
+            {"videoId": "x"}
+        ]
+        pipeline.sync_state_cls.return_value.get_new_tracks.return_value = tracks
+
+        def download(video_id: str, *args: object) -> Path:
+            if video_id == "vid2":
+                raise RuntimeError("boom")
+            return Path(f"downloads/.tmp/{video_id}.m4a")
+
+        pipeline.downloader_cls.return_value.download.side_effect = download
+        pipeline.organize_track.side_effect = lambda src, *args: src
+
+        result = runner.invoke(app, ["sync", "--liked"])
+        assert result.exit_code == 0
+        assert "Downloaded:        3" in result.output
+        assert "Failed:            1" in result.output
+
+    @patch("src.cli.commands.sync.create_download_progress")
+    def test_sync_interrupt_cancels_queued_downloads(
+        self,
+        mock_progress: MagicMock,
+        pipeline: SimpleNamespace,
+        fast_config: FastConfig,
+    ) -> None:
+        """Ctrl-C drops queued downloads instead of draining the queue."""
+        pipeline.load_config.return_value = replace(
+            fast_config, max_concurrent_downloads=1
+        )
+        tracks = [
+            {"title": f"Song {i}", "artist": "Artist", "video_id": f"vid{i}"}
+            for i in range(30)
+        ]
+        pipeline.provider_cls.return_value.get_liked_songs.return_value = [
+            {"videoId": "x"}
+        ]
+        pipeline.sync_state_cls.return_value.get_new_tracks.return_value = tracks
+        mock_download = pipeline.downloader_cls.return_value.download
+        mock_download.side_effect = lambda vid, *args: Path(f"{vid}.m4a")
+        mock_progress.return_value.update.side_effect = KeyboardInterrupt
+
+        result = runner.invoke(app, ["sync", "--liked"])
+
+        assert result.exit_code == 130
+        assert mock_download.call_count < len(tracks)
+
+    @patch("src.cli.commands.sync.time.monotonic", return_value=100.0)
+    @patch("src.cli.commands.sync.create_download_progress")
+    def test_sync_batches_progress_updates(
+        self,
+        mock_progress: MagicMock,
+        mock_monotonic: MagicMock,
+        pipeline: SimpleNamespace,
+        fast_config: FastConfig,
+    ) -> None:
+        """Completions within one interval reach the bar as one update."""
+        pipeline.load_config.return_value = replace(
+            fast_config, max_concurrent_downloads=1
+        )
+        tracks = [
+            {"title": f"Song {i}", "artist": "Artist", "video_id": f"vid{i}"}
+            for i in range(5)
+        ]
+        tracks.append({"title": "No ID", "artist": "Artist", "video_id": ""})
+        pipeline.provider_cls.return_value.get_liked_songs.return_value = [
+            {"videoId": "x"}
+        ]
+        pipeline.sync_state_cls.return_value.get_new_tracks.return_value = tracks
+        mock_download = pipeline.downloader_cls.return_value.download
+        mock_download.side_effect = lambda vid, *args: Path(f"{vid}.m4a")
+
+        result = runner.invoke(app, ["sync", "--liked"])
+        assert result.exit_code == 0
+
+        updates = mock_progress.return_value.update.call_args_list
+        assert len(updates) == 2
+        assert sum(c.kwargs["advance"] for c in updates) == len(tracks)
+        mock_progress.return_value.advance.assert_not_called()
+
+    def test_jobs_bounded_like_config(self) -> None:
+        """--jobs accepts up to the same limit as max_concurrent_downloads."""
+        args = ["sync", "--liked", "--jobs", str(MAX_CONCURRENT_DOWNLOADS + 1)]
+        with pytest.raises(BadParameter) as excinfo:
+            get_command(app).main(args, standalone_mode=False)
+        assert excinfo.value.param is not None
+        assert excinfo.value.param.name == "jobs"
+
     @patch("src.cli.commands.sync.SyncState")
-    @patch("src.cli.commands.sync.YouTubeProvider")
-    @patch("src.cli.commands.sync.load_auth")
+    @patch("src.providers.youtube.YouTubeProvider")
+    @patch("src.core.auth.load_auth")
     @patch("src.cli.commands.sync.load_config")
     def test_sync_all_up_to_date(
         self,
@@ -120,9 +263,10 @@ class TestCliSync:
         mock_auth: MagicMock,
         mock_provider_cls: MagicMock,
         mock_sync_state_cls: MagicMock,
+        fast_config: FastConfig,
     ) -> None:
         """Sync exits 0 when all tracks already downloaded."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
+        mock_config.return_value = fast_config
         mock_auth.return_value = MagicMock()
 
         mock_provider = MagicMock()
@@ -145,16 +289,116 @@ class TestCliSync:
         assert result.exit_code == 0
         assert "up to date" in result.output.lower()
 
-    @patch("src.cli.commands.sync.load_config")
-    def test_sync_with_output_dir(self, mock_config: MagicMock) -> None:
+    @pytest.mark.parametrize("mock_auth_failure", ["sync"], indirect=True)
+    @pytest.mark.usefixtures("mock_auth_failure")
+    def test_sync_with_output_dir(self) -> None:
         """Sync accepts --output-dir option."""
-        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
-        # Will fail at auth, but we verify the option is accepted
-        with patch(
-            "src.cli.commands.sync.load_auth",
-            side_effect=AuthenticationError("No auth"),
-        ):
-            result = runner.invoke(
-                app, ["sync", "--liked", "--output-dir", "/tmp/test"]
-            )
-            assert result.exit_code == 1
+        # Fails at auth, after the option has been parsed
+        result = runner.invoke(app, ["sync", "--liked", "--output-dir", "/tmp/test"])
+        assert result.exit_code == 1
+        assert "Not authenticated" in result.output
+
+    @patch("src.cli.commands.sync.SyncState")
+    @patch("src.providers.youtube.YouTubeProvider")
+    @patch("src.core.auth.load_auth")
+    @patch("src.cli.commands.sync.load_config")
+    def test_sync_playlist_ids_preserve_order(
+        self,
+        mock_config: MagicMock,
+        mock_auth: MagicMock,
+        mock_provider_cls: MagicMock,
+        mock_sync_state_cls: MagicMock,
+        fast_config: FastConfig,
+    ) -> None:
+        """Playlists fetched concurrently keep the order they were given in."""
+        mock_config.return_value = fast_config
+        mock_auth.return_value = MagicMock()
+
+        mock_provider = MagicMock()
+        mock_provider.get_playlist_tracks.side_effect = lambda pid: [
+            {"title": f"{pid}-{i}", "videoId": f"{pid}-{i}"} for i in range(3)
+        ]
+        mock_provider_cls.return_value = mock_provider
+        mock_provider_cls.normalize_track.side_effect = lambda t: {
+            "title": t["title"],
+            "video_id": t["videoId"],
+        }
+
+        mock_state = MagicMock()
+        mock_state.get_new_tracks.return_value = []
+        mock_sync_state_cls.return_value = mock_state
+
+        result = runner.invoke(app, ["sync", "-p", "PL1", "-p", "PL2", "-p", "PL3"])
+        assert result.exit_code == 0
+        assert mock_provider.get_playlist_tracks.call_count == 3
+
+        fetched = mock_state.get_new_tracks.call_args.args[0]
+        assert [t["video_id"] for t in fetched] == [
+            f"{pid}-{i}" for pid in ("PL1", "PL2", "PL3") for i in range(3)
+        ]
+
+    @patch("src.cli.commands.sync.SyncState")
+    @patch("src.providers.youtube.YouTubeProvider")
+    @patch("src.core.auth.load_auth")
+    @patch("src.cli.commands.sync.load_config")
+    def test_sync_repeated_playlist_id_fetched_once(
+        self,
+        mock_config: MagicMock,
+        mock_auth: MagicMock,
+        mock_provider_cls: MagicMock,
+        mock_sync_state_cls: MagicMock,
+        fast_config: FastConfig,
+    ) -> None:
+        """A playlist ID given twice costs one fetch."""
+        mock_config.return_value = fast_config
+        mock_auth.return_value = MagicMock()
+
+        mock_provider = MagicMock()
+        mock_provider.get_playlist_tracks.side_effect = lambda pid: [
+            {"title": pid, "videoId": pid}
+        ]
+        mock_provider_cls.return_value = mock_provider
+        mock_provider_cls.normalize_track.side_effect = lambda t: {
+            "title": t["title"],
+            "video_id": t["videoId"],
+        }
+
+        mock_state = MagicMock()
+        mock_state.get_new_tracks.return_value = []
+        mock_sync_state_cls.return_value = mock_state
+
+        result = runner.invoke(app, ["sync", "-p", "PL1", "-p", "PL2", "-p", "PL1"])
+        assert result.exit_code == 0
+        assert sorted(
+            c.args[0] for c in mock_provider.get_playlist_tracks.call_args_list
+        ) == ["PL1", "PL2"]
+
+        fetched = mock_state.get_new_tracks.call_args.args[0]
+        assert [t["video_id"] for t in fetched] == ["PL1", "PL2", "PL1"]
+
+    @patch("src.cli.commands.sync.PlaylistCache")
+    @patch("src.providers.youtube.YouTubeProvider")
+    @patch("src.core.auth.load_auth")
+    @patch("src.cli.commands.sync.load_config")
+    def test_sync_refresh_clears_playlist_cache(
+        self,
+        mock_config: MagicMock,
+        mock_auth: MagicMock,
+        mock_provider_cls: MagicMock,
+        mock_cache_cls: MagicMock,
+        fast_config: FastConfig,
+    ) -> None:
+        """--refresh drops cached track lists; a plain sync keeps them."""
+        mock_config.return_value = fast_config
+        mock_auth.return_value = MagicMock()
+        mock_provider = MagicMock()
+        mock_provider.get_liked_songs.return_value = []
+        mock_provider_cls.return_value = mock_provider
+
+        runner.invoke(app, ["sync", "--liked"])
+        mock_cache_cls.return_value.clear.assert_not_called()
+
+        result = runner.invoke(app, ["sync", "--liked", "--refresh"])
+        assert result.exit_code == 0
+        mock_cache_cls.return_value.clear.assert_called_once()
+        assert mock_provider_cls.call_args.args[2] is mock_cache_cls.return_value
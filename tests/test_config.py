@@ -2,12 +2,21 @@
 
 import json
 import os
+from dataclasses import FrozenInstanceError, fields
 from pathlib import Path
 from unittest.mock import patch
 
 import pytest
 
-from src.core.config import AppConfig, load_config, save_config
+from src.core.config import (
+    CONFIG_DIR,
+    AppConfig,
+    FastConfig,
+    app_dir,
+    clear_config_cache,
+    load_config,
+    save_config,
+)
 from src.core.exceptions import ConfigError
 
 
@@ -63,29 +72,14 @@ class TestAppConfig:
         assert config.download_dir == Path("downloads")
 
     def test_save_creates_valid_json(self, tmp_path: Path) -> None:
-        """Saved config is valid JSON."""
+        """Saved config is valid JSON holding every field."""
         config_path = tmp_path / "config.json"
         config = AppConfig()
         config.save(config_path)
         data = json.loads(config_path.read_text())
-        assert "download_dir" in data
+        assert data.keys() == AppConfig.model_fields.keys()
         assert isinstance(data["download_dir"], str)
 
-    def test_save_preserves_all_fields(self, tmp_path: Path) -> None:
-        """Saved config includes every field."""
-        config_path = tmp_path / "config.json"
-        config = AppConfig()
-        config.save(config_path)
-        data = json.loads(config_path.read_text())
-        assert "audio_format" in data
-        assert "fallback_format" in data
-        assert "organize_by" in data
-        assert "max_filename_length" in data
-        assert "max_concurrent_downloads" in data
-        assert "default_genre" in data
-        assert "client_id" in data
-        assert "client_secret" in data
-
     def test_roundtrip_all_fields(self, tmp_path: Path) -> None:
         """All fields survive a save/load cycle."""
         config_path = tmp_path / "config.json"
@@ -157,6 +151,11 @@ class TestConfigValidation:
         with pytest.raises(ValueError):
             AppConfig(max_concurrent_downloads=20)
 
+    def test_non_positive_rate_limit(self) -> None:
+        """Rejects rate_limit <= 0."""
+        with pytest.raises(ValueError):
+            AppConfig(rate_limit=0)
+
     def test_valid_all_audio_formats(self) -> None:
         """Accepts all valid audio formats."""
         for fmt in ("best", "mp3", "m4a", "opus"):
@@ -311,3 +310,169 @@ class TestLoadSaveConfig:
         config = load_config(path)
         assert config.client_id == "my_id"
         assert config.client_secret == "my_secret"
+
+
+class TestAtomicSave:
+    """Tests for config file writes."""
+
+    def test_save_leaves_no_temp_file(self, tmp_path: Path) -> None:
+        """Save renames its temp file into place."""
+        path = tmp_path / "config.json"
+        AppConfig(audio_format="mp3").save(path)
+
+        assert list(tmp_path.iterdir()) == [path]
+        assert json.loads(path.read_text())["audio_format"] == "mp3"
+
+    def test_unchanged_save_skips_write(self, tmp_path: Path) -> None:
+        """Saving identical content doesn't rewrite the file."""
+        path = tmp_path / "config.json"
+        config = AppConfig(audio_format="mp3")
+        config.save(path)
+        os.utime(path, ns=(0, 0))
+
+        config.save(path)
+
+        assert path.stat().st_mtime_ns == 0
+
+
+class TestConfigCache:
+    """Tests for load_config memoization."""
+
+    def test_repeat_load_returns_cached_instance(self, tmp_path: Path) -> None:
+        """An unchanged file is parsed once."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"audio_format": "mp3"}))
+
+        assert load_config(path) is load_config(path)
+
+    def test_file_change_invalidates_cache(self, tmp_path: Path) -> None:
+        """Editing the file on disk is picked up by the next load."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"audio_format": "mp3"}))
+        load_config(path)
+
+        path.write_text(json.dumps({"audio_format": "opus"}))
+        assert load_config(path).audio_format == "opus"
+
+    def test_save_invalidates_cache(self, tmp_path: Path) -> None:
+        """save_config drops the cached instance."""
+        path = tmp_path / "config.json"
+        first = load_config(path)
+
+        save_config(AppConfig(audio_format="m4a"), path)
+        second = load_config(path)
+
+        assert second is not first
+        assert second.audio_format == "m4a"
+
+    def test_env_change_invalidates_cache(self, tmp_path: Path) -> None:
+        """Changing an env override is picked up by the next load."""
+        path = tmp_path / "config.json"
+        with patch.dict(os.environ, {"YMD_CLIENT_ID": "first"}):
+            assert load_config(path).client_id == "first"
+        with patch.dict(os.environ, {"YMD_CLIENT_ID": "second"}):
+            assert load_config(path).client_id == "second"
+
+    def test_clear_config_cache(self, tmp_path: Path) -> None:
+        """clear_config_cache forces a fresh load."""
+        path = tmp_path / "config.json"
+        first = load_config(path)
+        clear_config_cache()
+        assert load_config(path) is not first
+
+
+class TestTrustedReload:
+    """Tests for skipping validation on configs this process saved."""
+
+    def test_reload_of_saved_file_skips_validation(self, tmp_path: Path) -> None:
+        """Reading back our own save uses model_construct."""
+        path = tmp_path / "config.json"
+        save_config(AppConfig(audio_format="opus", download_dir=tmp_path), path)
+
+        with patch.object(
+            AppConfig, "model_construct", wraps=AppConfig.model_construct
+        ) as mock_construct:
+            loaded = load_config(path)
+
+        mock_construct.assert_called_once()
+        assert loaded.audio_format == "opus"
+        assert loaded.download_dir == tmp_path
+
+    def test_reload_applies_env_overrides(self, tmp_path: Path) -> None:
+        """Env secrets still override a trusted reload."""
+        path = tmp_path / "config.json"
+        save_config(AppConfig(client_id="file_id"), path)
+
+        with patch.dict(os.environ, {"YMD_CLIENT_ID": "env_id"}):
+            assert load_config(path).client_id == "env_id"
+
+    def test_external_edit_is_validated(self, tmp_path: Path) -> None:
+        """A file changed behind our back goes through full validation."""
+        path = tmp_path / "config.json"
+        save_config(AppConfig(), path)
+        path.write_text(json.dumps({"audio_format": "wav"}))
+
+        with pytest.raises(ConfigError):
+            load_config(path)
+
+
+class TestFastConfig:
+    """Tests for the read-only snapshot returned by load_config."""
+
+    def test_mirrors_app_config_fields(self) -> None:
+        """FastConfig declares exactly AppConfig's fields."""
+        assert [f.name for f in fields(FastConfig)] == list(AppConfig.model_fields)
+
+    def test_load_config_returns_fast_config(self, tmp_path: Path) -> None:
+        """load_config hands out a validated, immutable snapshot."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"audio_format": "mp3"}))
+
+        config = load_config(path)
+
+        assert isinstance(config, FastConfig)
+        assert config.audio_format == "mp3"
+        assert config.download_dir == Path("downloads")
+        with pytest.raises(FrozenInstanceError):
+            config.audio_format = "opus"  # type: ignore[misc]
+
+    def test_load_config_still_validates(self, tmp_path: Path) -> None:
+        """Invalid values are rejected before a snapshot is built."""
+        path = tmp_path / "config.json"
+        path.write_text(json.dumps({"audio_format": "wav"}))
+
+        with pytest.raises(ConfigError):
+            load_config(path)
+
+
+class TestAppDir:
+    """Tests for locating per-user files."""
+
+    @pytest.mark.parametrize("name", ["config.json", "oauth.json"])
+    def test_prefers_working_directory_copy(
+        self, name: str, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Either file in the working directory keeps both there."""
+        monkeypatch.chdir(tmp_path)
+        (tmp_path / name).write_text("{}")
+
+        assert app_dir() == tmp_path.resolve()
+
+    def test_falls_back_to_config_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Without a local copy both files live in CONFIG_DIR."""
+        monkeypatch.chdir(tmp_path)
+
+        path = app_dir()
+
+        assert path == CONFIG_DIR
+        assert path.is_absolute()
+
+    def test_save_creates_parent_dir(self, tmp_path: Path) -> None:
+        """Saving into a missing config dir creates it."""
+        path = tmp_path / "ymd" / "config.json"
+
+        save_config(AppConfig(), path)
+
+        assert path.exists()
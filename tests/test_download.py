@@ -1,17 +1,22 @@
 """Tests for download engine."""
 
 import sys
+import threading
 from pathlib import Path
 from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+from yt_dlp.postprocessor.ffmpeg import FFmpegExtractAudioPP, resolve_mapping
 
 from src.core.download import (
     BEST_AUDIO_FORMAT,
+    MAX_BACKOFF,
+    Downloader,
     _build_yt_dlp_opts,
     _is_retryable_error,
-    download_tracks_parallel,
+    _retry_delay,
+    download_track,
 )
 from src.core.exceptions import DownloadError
 
@@ -32,14 +37,25 @@ class TestBuildYtDlpOpts:
         assert opts["format"] == BEST_AUDIO_FORMAT
 
     def test_mp3_postprocessor(self, tmp_path: Path) -> None:
-        """MP3 fallback adds FFmpeg audio extraction postprocessor."""
-        opts = _build_yt_dlp_opts(tmp_path, fallback_format="mp3")
+        """Requesting mp3 converts every download to mp3."""
+        opts = _build_yt_dlp_opts(tmp_path, audio_format="mp3")
         codecs = [
             p.get("preferredcodec")
             for p in opts["postprocessors"]
             if "preferredcodec" in p
         ]
-        assert "mp3" in codecs
+        assert codecs == ["mp3"]
+
+    def test_best_keeps_dap_formats(self, tmp_path: Path) -> None:
+        """'best' keeps m4a as-is and converts only others to the fallback."""
+        opts = _build_yt_dlp_opts(tmp_path, "best", "mp3")
+        extract = opts["postprocessors"][0]
+        mapping = extract["preferredcodec"]
+
+        assert extract["key"] == "FFmpegExtractAudio"
+        assert resolve_mapping("m4a", mapping)[0] == "m4a"
+        assert resolve_mapping("webm", mapping)[0] == "mp3"
+        assert FFmpegExtractAudioPP.FORMAT_RE.match(mapping)
 
     def test_output_template(self, tmp_path: Path) -> None:
         """Output template uses video ID."""
@@ -116,7 +132,29 @@ class TestDownloadTrack:
 
         assert result == fake_file
 
-    def test_download_failure_raises(self, tmp_path: Path) -> None:
+    def test_uses_reported_filepath(self, tmp_path: Path) -> None:
+        """The path yt-dlp reports wins over probing the directory."""
+        mock_module, mock_ydl = self._make_mock_yt_dlp()
+        reported = tmp_path / "testid.mp3"
+        mock_ydl.extract_info.return_value = {
+            "id": "testid",
+            "requested_downloads": [{"filepath": str(reported)}],
+        }
+
+        # A sibling the probe would have picked first
+        (tmp_path / "testid.m4a").write_bytes(b"stale")
+
+        with patch.dict(sys.modules, {"yt_dlp": mock_module}):
+            from src.core.download import download_track
+
+            result = download_track("testid", tmp_path)
+
+        assert result == reported
+
+    @patch("src.core.download.time.sleep")
+    def test_download_failure_raises(
+        self, mock_sleep: MagicMock, tmp_path: Path
+    ) -> None:
         """Download failure raises DownloadError."""
         mock_module, mock_ydl = self._make_mock_yt_dlp()
         mock_ydl.extract_info.side_effect = Exception("Network error")
@@ -171,79 +209,83 @@ class TestDownloadTrack:
         assert result == output / "testid.mp3"
 
 
-class TestDownloadTracksParallel:
-    """Tests for parallel download."""
+class TestDownloader:
+    """Tests for the reusable Downloader."""
 
-    @patch("src.core.download.download_track")
-    def test_parallel_downloads(self, mock_download: MagicMock, tmp_path: Path) -> None:
-        """Parallel download processes multiple tracks."""
-        mock_download.return_value = tmp_path / "song.mp3"
+    def _make_mock_yt_dlp(self) -> MagicMock:
+        """Create a mock yt_dlp module whose downloads write the file."""
+        mock_module = MagicMock()
 
-        tracks: list[dict[str, str]] = [
-            {"video_id": "vid1", "title": "Song 1"},
-            {"video_id": "vid2", "title": "Song 2"},
-        ]
+        def make_ydl(opts: dict[str, Any]) -> MagicMock:
+            ydl = MagicMock()
 
-        results = download_tracks_parallel(tracks, tmp_path, max_workers=2)
+            def extract(url: str, download: bool = True) -> dict[str, str]:
+                video_id = url.rsplit("=", 1)[1]
+                output_dir = Path(opts["outtmpl"]).parent
+                (output_dir / f"{video_id}.m4a").write_bytes(b"audio")
+                return {"id": video_id}
 
-        assert len(results) == 2
-        assert mock_download.call_count == 2
+            ydl.extract_info.side_effect = extract
+            return ydl
 
-    @patch("src.core.download.download_track")
-    def test_missing_video_id(self, mock_download: MagicMock, tmp_path: Path) -> None:
-        """Tracks without video_id are reported as errors."""
-        tracks: list[dict[str, str]] = [{"title": "No ID Track"}]
-        results = download_tracks_parallel(tracks, tmp_path)
+        mock_module.YoutubeDL.side_effect = make_ydl
+        return mock_module
 
-        assert len(results) == 1
-        assert results[0]["error"] == "Missing video_id"
-        assert results[0]["filepath"] is None
-        mock_download.assert_not_called()
+    def test_reuses_instance_across_tracks(self, tmp_path: Path) -> None:
+        """One YoutubeDL instance serves several downloads."""
+        mock_module = self._make_mock_yt_dlp()
 
-    @patch("src.core.download.download_track")
-    def test_partial_failure(self, mock_download: MagicMock, tmp_path: Path) -> None:
-        """One failed download doesn't block others."""
+        with patch.dict(sys.modules, {"yt_dlp": mock_module}):
+            with Downloader() as downloader:
+                first = downloader.download("vid1", tmp_path)
+                second = downloader.download("vid2", tmp_path)
 
-        def side_effect(video_id: str, *args: Any, **kwargs: Any) -> Path:
-            if video_id == "bad":
-                raise DownloadError("Failed to download bad")
-            return tmp_path / f"{video_id}.mp3"
+        assert first == tmp_path / "vid1.m4a"
+        assert second == tmp_path / "vid2.m4a"
+        mock_module.YoutubeDL.assert_called_once()
 
-        mock_download.side_effect = side_effect
+    def test_one_instance_per_thread(self, tmp_path: Path) -> None:
+        """Worker threads get their own YoutubeDL instance."""
+        mock_module = self._make_mock_yt_dlp()
 
-        tracks: list[dict[str, str]] = [
-            {"video_id": "good", "title": "Good Song"},
-            {"video_id": "bad", "title": "Bad Song"},
-        ]
+        with patch.dict(sys.modules, {"yt_dlp": mock_module}):
+            with Downloader() as downloader:
+                downloader.download("vid1", tmp_path)
+                worker = threading.Thread(
+                    target=downloader.download, args=("vid2", tmp_path)
+                )
+                worker.start()
+                worker.join()
 
-        results = download_tracks_parallel(tracks, tmp_path, max_workers=2)
-        assert len(results) == 2
+        assert mock_module.YoutubeDL.call_count == 2
+        assert (tmp_path / "vid2.m4a").exists()
 
-        errors = [r for r in results if r["error"] is not None]
-        successes = [r for r in results if r["error"] is None]
-        assert len(errors) == 1
-        assert len(successes) == 1
+    def test_download_track_reuses_shared_downloader(self, tmp_path: Path) -> None:
+        """download_track builds no YoutubeDL of its own when given one."""
+        mock_module = self._make_mock_yt_dlp()
 
-    @patch("src.core.download.download_track")
-    def test_progress_callback(self, mock_download: MagicMock, tmp_path: Path) -> None:
-        """Progress callback is called for each track."""
-        mock_download.return_value = tmp_path / "song.mp3"
-        callback = MagicMock()
+        with patch.dict(sys.modules, {"yt_dlp": mock_module}):
+            with Downloader() as downloader:
+                first = download_track("vid1", tmp_path, downloader=downloader)
+                second = download_track("vid2", tmp_path, downloader=downloader)
 
-        tracks: list[dict[str, str]] = [
-            {"video_id": "vid1", "title": "Song 1"},
-        ]
+        assert first == tmp_path / "vid1.m4a"
+        assert second == tmp_path / "vid2.m4a"
+        mock_module.YoutubeDL.assert_called_once()
 
-        download_tracks_parallel(tracks, tmp_path, progress_callback=callback)
+    def test_close_closes_instances(self, tmp_path: Path) -> None:
+        """close() closes every created YoutubeDL instance."""
+        mock_module = MagicMock()
+        mock_ydl = mock_module.YoutubeDL.return_value
+        mock_ydl.extract_info.return_value = {"id": "vid1"}
+        (tmp_path / "vid1.mp3").write_bytes(b"audio")
 
-        callback.assert_called_once()
+        with patch.dict(sys.modules, {"yt_dlp": mock_module}):
+            downloader = Downloader()
+            downloader.download("vid1", tmp_path)
+            downloader.close()
 
-    @patch("src.core.download.download_track")
-    def test_empty_tracks_list(self, mock_download: MagicMock, tmp_path: Path) -> None:
-        """Empty tracks list returns empty results."""
-        results = download_tracks_parallel([], tmp_path)
-        assert results == []
-        mock_download.assert_not_called()
+        mock_ydl.close.assert_called_once()
 
 
 class TestIsRetryableError:
@@ -273,6 +315,69 @@ class TestIsRetryableError:
         """Format errors are not retryable."""
         assert _is_retryable_error(Exception("No suitable format")) is False
 
+    def test_case_insensitive(self) -> None:
+        """Markers match regardless of case."""
+        assert _is_retryable_error(Exception("RATE LIMIT exceeded")) is True
+        assert _is_retryable_error(Exception("Service Temporarily Unavailable"))
+
+
+class TestRetryDelay:
+    """Tests for _retry_delay backoff computation."""
+
+    @patch("src.core.download.random.uniform", side_effect=lambda lo, hi: hi)
+    def test_exponential_upper_bound(self, mock_uniform: MagicMock) -> None:
+        """Without jitter the delay doubles per attempt."""
+        error = Exception("HTTP Error 503")
+        assert [_retry_delay(a, error) for a in range(3)] == [2, 4, 8]
+
+    def test_jitter_range(self) -> None:
+        """Delays fall within half to all of the exponential step."""
+        error = Exception("HTTP Error 503")
+        for _ in range(50):
+            assert 2.0 <= _retry_delay(1, error) <= 4.0
+
+    def test_capped(self) -> None:
+        """Late attempts never wait longer than MAX_BACKOFF."""
+        assert _retry_delay(10, Exception("timeout")) <= MAX_BACKOFF
+
+    def test_retry_after_in_message_wins(self) -> None:
+        """A server-supplied Retry-After overrides the computed delay."""
+        error = Exception("HTTP Error 429: Too Many Requests (Retry-After: 25)")
+        assert _retry_delay(0, error) == 25.0
+
+    def test_retry_after_capped(self) -> None:
+        """A long server-requested wait is clamped to MAX_BACKOFF."""
+        http_error = Exception("HTTP Error 429")
+        http_error.headers = {"Retry-After": "3600"}  # type: ignore[attr-defined]
+        assert _retry_delay(0, http_error) == MAX_BACKOFF
+        assert _retry_delay(0, Exception("Retry-After: 3600")) == MAX_BACKOFF
+
+    def test_retry_after_header_from_yt_dlp_error(self) -> None:
+        """The header on the HTTPError wrapped in exc_info is honored."""
+        http_error = Exception("HTTP Error 429: Too Many Requests")
+        http_error.response = MagicMock(headers={"Retry-After": "17"})  # type: ignore[attr-defined]
+        error = Exception("ERROR: unable to download video data")
+        error.exc_info = (type(http_error), http_error, None)  # type: ignore[attr-defined]
+
+        assert _retry_delay(0, error) == 17.0
+
+    def test_retry_after_header_http_date(self) -> None:
+        """An HTTP-date Retry-After becomes the seconds remaining."""
+        http_error = Exception("HTTP Error 503")
+        http_error.headers = {"Retry-After": "Wed, 21 Oct 2015 07:28:00 GMT"}  # type: ignore[attr-defined]
+
+        with patch("src.core.download.time.time", return_value=1445412470.0):
+            delay = _retry_delay(0, http_error)
+
+        assert delay == pytest.approx(10.0)
+
+    def test_unparseable_header_falls_back(self) -> None:
+        """A malformed header falls back to computed backoff."""
+        http_error = Exception("HTTP Error 429")
+        http_error.headers = {"Retry-After": "soon"}  # type: ignore[attr-defined]
+
+        assert _retry_delay(0, http_error) <= 2.0
+
 
 class TestDownloadTrackRetry:
     """Tests for download retry with exponential backoff."""
@@ -344,3 +449,29 @@ class TestDownloadTrackRetry:
 
         # Should have slept for each retry attempt
         assert mock_sleep.call_count == 2
+
+    @patch("src.core.download.time.sleep")
+    def test_throttling_pauses_other_downloads(
+        self, mock_sleep: MagicMock, tmp_path: Path
+    ) -> None:
+        """A 429 on one track delays the next track's first attempt."""
+        mock_module, mock_ydl = self._make_mock_yt_dlp()
+
+        def extract(url: str, download: bool = True) -> dict[str, str]:
+            video_id = url.rsplit("=", 1)[1]
+            if video_id == "limited":
+                raise Exception("HTTP Error 429: Too Many Requests")
+            (tmp_path / f"{video_id}.mp3").write_bytes(b"audio")
+            return {"id": video_id}
+
+        mock_ydl.extract_info.side_effect = extract
+
+        with patch.dict(sys.modules, {"yt_dlp": mock_module}):
+            with Downloader(max_retries=0) as downloader:
+                with pytest.raises(DownloadError):
+                    downloader.download("limited", tmp_path)
+                mock_sleep.assert_not_called()
+
+                downloader.download("other", tmp_path)
+
+        mock_sleep.assert_called_once()
@@ -4,6 +4,9 @@ Tests the data flow between modules:
 download -> tag -> organize -> sync_state
 """
 
+import logging
+import subprocess
+import sys
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
@@ -144,7 +147,7 @@ class TestDownloadToTagger:
 
     def test_mp3_postprocessor_creates_taggable_file(self) -> None:
         """MP3 postprocessor produces .mp3 files tagger can handle."""
-        opts = _build_yt_dlp_opts(Path("/tmp"), "best", "mp3")
+        opts = _build_yt_dlp_opts(Path("/tmp"), "mp3", "mp3")
         postprocessors = opts.get("postprocessors", [])
         has_mp3_extract = any(
             pp.get("key") == "FFmpegExtractAudio" and pp.get("preferredcodec") == "mp3"
@@ -285,3 +288,156 @@ class TestFullPipelineMocked:
             [{"video_id": "int_test_001", "title": "Integration Test"}]
         )
         assert len(new) == 0
+
+
+class TestCliImportCost:
+    """Test that the CLI entry point stays cheap to import."""
+
+    def test_main_does_not_import_heavy_deps(self) -> None:
+        """Importing src.cli.main does not pull in API/tagging libraries."""
+        code = (
+            "import sys, src.cli.main; "
+            "heavy = ('ytmusicapi', 'questionary', 'mutagen', 'yt_dlp'); "
+            "print(','.join(m for m in heavy if m in sys.modules))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent.parent,
+        )
+        assert result.stdout.strip() == ""
+
+    def test_main_imports_only_invoked_command(self) -> None:
+        """Running one subcommand doesn't import the other command modules."""
+        code = (
+            "import sys; sys.argv = ['ymd', 'status', '--help']; "
+            "from src.cli.main import main\n"
+            "try:\n    main()\nexcept SystemExit:\n    pass\n"
+            "print(sorted(m for m in sys.modules "
+            "if m.startswith('src.cli.commands.')))"
+        )
+        result = subprocess.run(
+            [sys.executable, "-c", code],
+            capture_output=True,
+            text=True,
+            check=True,
+            cwd=Path(__file__).parent.parent,
+        )
+        loaded = result.stdout.strip().splitlines()[-1]
+        assert loaded == "['src.cli.commands.status']"
+
+    def test_build_app_registers_requested_commands(self) -> None:
+        """build_app registers only the named subcommands."""
+        from src.cli.main import build_app
+
+        cli = build_app(["status", "config"])
+        assert [c.name for c in cli.registered_commands] == ["status", "config"]
+
+    def test_requested_command_skips_option_values(self) -> None:
+        """The value of --output isn't mistaken for the subcommand."""
+        from src.cli.main import _requested_command
+
+        assert _requested_command(["--output", "json", "status"]) == "status"
+        assert _requested_command(["-v", "--output=tsv", "sync"]) == "sync"
+        assert _requested_command(["--output", "json"]) is None
+
+
+class TestSetupLogging:
+    """Test CLI logging configuration."""
+
+    def teardown_method(self) -> None:
+        logging.disable(logging.NOTSET)
+
+    @patch("logging.basicConfig")
+    def test_quiet_disables_info_records(self, mock_basic_config: MagicMock) -> None:
+        """Without --verbose, INFO and DEBUG calls are short-circuited."""
+        from src.cli.main import _setup_logging
+
+        _setup_logging(verbose=False)
+
+        log = logging.getLogger("ymd.test")
+        assert log.isEnabledFor(logging.INFO) is False
+        assert log.isEnabledFor(logging.WARNING) is True
+        assert "asctime" not in mock_basic_config.call_args.kwargs["format"]
+
+    @patch("logging.basicConfig")
+    def test_verbose_enables_debug(self, mock_basic_config: MagicMock) -> None:
+        """--verbose re-enables every level and logs at DEBUG."""
+        from src.cli.main import _setup_logging
+
+        _setup_logging(verbose=False)
+        _setup_logging(verbose=True)
+
+        assert logging.root.manager.disable == logging.NOTSET
+        assert mock_basic_config.call_args.kwargs["level"] == logging.DEBUG
+
+
+class TestOutputOption:
+    """Test the root --output option."""
+
+    def teardown_method(self) -> None:
+        from src.cli.ui import set_output_format
+
+        set_output_format("table")
+
+    def test_rejects_unknown_format(self) -> None:
+        """An unsupported --output value is a usage error."""
+        from typer.testing import CliRunner
+
+        from src.cli.main import app
+
+        result = CliRunner().invoke(app, ["--output", "xml", "status"])
+        assert result.exit_code == 2
+
+    @patch("src.cli.commands.status.SyncState")
+    @patch("src.cli.commands.status.load_config")
+    def test_sets_listing_format(
+        self, mock_config: MagicMock, mock_state_cls: MagicMock
+    ) -> None:
+        """The chosen format is applied before the command runs."""
+        from typer.testing import CliRunner
+
+        import src.cli.ui as ui
+        from src.cli.main import app
+
+        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
+        mock_state_cls.return_value.last_sync = None
+
+        result = CliRunner().invoke(app, ["--output", "json", "status"])
+
+        assert result.exit_code == 0
+        assert ui._output_format == "json"
+
+    @patch("src.cli.commands.status.SyncState")
+    @patch("src.cli.commands.status.load_config")
+    def test_status_json_keeps_stdout_parseable(
+        self, mock_config: MagicMock, mock_state_cls: MagicMock
+    ) -> None:
+        """Only the listing reaches stdout; headers go to stderr."""
+        import orjson
+        from typer.testing import CliRunner
+
+        from src.cli.main import app
+
+        mock_config.return_value = MagicMock(download_dir=Path("downloads"))
+        state = mock_state_cls.return_value
+        state.last_sync = "2026-01-01T00:00:00"
+        state.total_tracks = 3
+        state.synced_playlists = {
+            "PL1": {"name": "Rock", "track_count": 3, "last_sync": "2026-01-01"}
+        }
+
+        result = CliRunner().invoke(app, ["--output", "json", "status"])
+
+        assert result.exit_code == 0
+        assert orjson.loads(result.stdout) == [
+            {
+                "playlist_id": "PL1",
+                "name": "Rock",
+                "track_count": 3,
+                "last_sync": "2026-01-01",
+            }
+        ]
+        assert "Sync Status" in result.stderr
@@ -1,11 +1,16 @@
 """Tests for file organizer module."""
 
+import errno
+import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
+from unittest.mock import patch
 
 import pytest
 
 from src.core.exceptions import OrganizationError
 from src.core.organizer import (
+    _move,
     cleanup_temp_dir,
     organize_track,
     sanitize_dirname,
@@ -42,6 +47,10 @@ class TestSanitizeFilename:
         """Multiple spaces are collapsed to one."""
         assert sanitize_filename("My   Song   Title") == "My Song Title"
 
+    def test_unicode_whitespace_collapsed(self) -> None:
+        """Non-breaking and ideographic spaces collapse like ASCII ones."""
+        assert sanitize_filename("My\u00a0 Song\u3000Title ") == "My Song Title"
+
     def test_empty_name_fallback(self) -> None:
         """Empty name returns 'Unknown'."""
         assert sanitize_filename("") == "Unknown"
@@ -101,6 +110,13 @@ class TestSanitizeDirname:
         assert ":" not in result
         assert '"' not in result
 
+    def test_repeated_names_cached(self) -> None:
+        """Repeated directory names are served from the cache."""
+        sanitize_dirname.cache_clear()
+        sanitize_dirname("Cached Artist")
+        sanitize_dirname("Cached Artist")
+        assert sanitize_dirname.cache_info().hits == 1
+
 
 class TestOrganizeTrack:
     """Tests for track organization."""
@@ -207,6 +223,107 @@ class TestOrganizeTrack:
         assert result2.exists()
         assert "(1)" in result2.name
 
+    def test_duplicate_picks_first_free_counter(self, tmp_path: Path) -> None:
+        """Counters already taken, in any letter case, are skipped."""
+        target_dir = tmp_path / "output" / "Rock" / "Artist"
+        target_dir.mkdir(parents=True)
+        for name in (
+            "Artist - Song.mp3",
+            "Artist - Song (1).mp3",
+            "ARTIST - SONG (2).MP3",
+        ):
+            (target_dir / name).write_bytes(b"old")
+        source = tmp_path / "test.mp3"
+        source.write_bytes(b"new")
+
+        result = organize_track(
+            source,
+            tmp_path / "output",
+            {"title": "Song", "artist": "Artist", "genre": "Rock"},
+        )
+
+        assert result.name == "Artist - Song (3).mp3"
+        assert result.read_bytes() == b"new"
+
+    def test_parallel_duplicates_get_distinct_paths(self, tmp_path: Path) -> None:
+        """Workers organizing the same track at once never share a target."""
+        metadata = {"title": "Song", "artist": "Artist", "genre": "Rock"}
+        sources = []
+        for i in range(8):
+            source = tmp_path / f"test{i}.mp3"
+            source.write_bytes(f"data{i}".encode())
+            sources.append(source)
+
+        real_move = _move
+
+        def slow_move(src: Path, dst: Path) -> None:
+            # Widen the gap between choosing a name and moving onto it
+            time.sleep(0.05)
+            real_move(src, dst)
+
+        with (
+            patch("src.core.organizer._move", side_effect=slow_move),
+            ThreadPoolExecutor(max_workers=8) as executor,
+        ):
+            results = list(
+                executor.map(
+                    lambda src: organize_track(src, tmp_path / "output", metadata),
+                    sources,
+                )
+            )
+
+        assert len(set(results)) == 8
+        assert {r.read_bytes() for r in results} == {
+            f"data{i}".encode() for i in range(8)
+        }
+
+    def test_failed_move_releases_claim(self, tmp_path: Path) -> None:
+        """A failed move leaves no placeholder at the target."""
+        source = tmp_path / "test.mp3"
+        source.write_bytes(b"data")
+        output = tmp_path / "output"
+
+        with (
+            patch("src.core.organizer._move", side_effect=OSError("full")),
+            pytest.raises(OrganizationError, match="Failed to move"),
+        ):
+            organize_track(source, output, {"title": "Song", "artist": "Artist"})
+
+        assert not any(p.is_file() for p in output.rglob("*"))
+
+    def test_cross_device_move_falls_back_to_copy(self, tmp_path: Path) -> None:
+        """When a rename can't cross devices the file is copied instead."""
+        source = tmp_path / "test.mp3"
+        source.write_bytes(b"data")
+
+        with patch(
+            "src.core.organizer.os.replace",
+            side_effect=OSError(errno.EXDEV, "Invalid cross-device link"),
+        ):
+            result = organize_track(
+                source, tmp_path / "output", {"title": "Song", "artist": "Artist"}
+            )
+
+        assert result.read_bytes() == b"data"
+        assert not source.exists()
+
+    def test_long_duplicate_keeps_counter(self, tmp_path: Path) -> None:
+        """Truncated duplicate names keep their counter and stay unique."""
+        metadata = {"title": "A" * 200, "artist": "B", "genre": "Rock"}
+        results = []
+        for i in range(3):
+            source = tmp_path / f"test{i}.mp3"
+            source.write_bytes(b"data")
+            results.append(
+                organize_track(
+                    source, tmp_path / "output", metadata, max_filename_length=40
+                )
+            )
+
+        assert len({r.name for r in results}) == 3
+        assert results[2].name.endswith(" (2).mp3")
+        assert all(len(r.name) <= 40 for r in results)
+
     def test_source_not_found_raises(self, tmp_path: Path) -> None:
         """OrganizationError raised for missing source."""
         with pytest.raises(OrganizationError, match="Source file not found"):
@@ -257,6 +374,26 @@ class TestOrganizeTrack:
 
         assert not source.exists()
 
+    def test_created_dirs_skips_repeat_mkdir(self, tmp_path: Path) -> None:
+        """Known directories are recorded and not created again."""
+        metadata = {"title": "Song", "artist": "Artist", "genre": "Rock"}
+        created_dirs: set[Path] = set()
+
+        first = tmp_path / "a.mp3"
+        first.write_bytes(b"data")
+        result = organize_track(
+            first, tmp_path / "output", metadata, created_dirs=created_dirs
+        )
+        assert created_dirs == {result.parent}
+
+        second = tmp_path / "b.mp3"
+        second.write_bytes(b"data")
+        with patch.object(Path, "mkdir") as mock_mkdir:
+            organize_track(
+                second, tmp_path / "output", metadata, created_dirs=created_dirs
+            )
+        mock_mkdir.assert_not_called()
+
 
 class TestCleanupTempDir:
     """Tests for temp directory cleanup."""
@@ -1,10 +1,13 @@
 """Tests for YouTube Music provider."""
 
+from pathlib import Path
 from typing import Any
-from unittest.mock import MagicMock
+from unittest.mock import MagicMock, patch
 
 import pytest
+from ytmusicapi.auth.oauth.exceptions import UnauthorizedOAuthClient
 
+from src.core.cache import PlaylistCache
 from src.core.exceptions import AuthenticationError, PlaylistNotFoundError
 from src.providers.youtube import YouTubeProvider
 
@@ -51,7 +54,7 @@ class TestYouTubeProvider:
         self, mock_ytmusic: MagicMock
     ) -> None:
         """Liked songs fetch failure raises AuthenticationError."""
-        mock_ytmusic.get_liked_songs.side_effect = Exception("Unauthorized")
+        mock_ytmusic.get_liked_songs.side_effect = Exception("API Error")
         provider = YouTubeProvider(mock_ytmusic)
 
         with pytest.raises(AuthenticationError, match="Could not fetch liked songs"):
@@ -79,6 +82,108 @@ class TestYouTubeProvider:
         with pytest.raises(PlaylistNotFoundError, match="PL_INVALID"):
             provider.get_playlist_tracks("PL_INVALID")
 
+    def test_rejected_credentials_raise_auth_error(
+        self, mock_ytmusic: MagicMock
+    ) -> None:
+        """An auth rejection raises AuthenticationError."""
+        mock_ytmusic.get_playlist.side_effect = Exception("HTTP 401: Unauthorized")
+        provider = YouTubeProvider(mock_ytmusic)
+
+        with pytest.raises(AuthenticationError, match="rejected"):
+            provider.get_playlist_tracks("PL001")
+
+    def test_search_rejected_credentials_raise(self, mock_ytmusic: MagicMock) -> None:
+        """Search surfaces auth rejections instead of returning no results."""
+        mock_ytmusic.search.side_effect = Exception("invalid_grant")
+        provider = YouTubeProvider(mock_ytmusic)
+
+        with pytest.raises(AuthenticationError):
+            provider.search("query")
+
+    def test_oauth_client_error_raises_auth_error(
+        self, mock_ytmusic: MagicMock
+    ) -> None:
+        """ytmusicapi's OAuth client exceptions count as auth rejections."""
+        mock_ytmusic.get_playlist.side_effect = UnauthorizedOAuthClient(
+            "Token refresh error."
+        )
+        provider = YouTubeProvider(mock_ytmusic)
+
+        with pytest.raises(AuthenticationError, match="rejected"):
+            provider.get_playlist_tracks("PL001")
+
+    def test_incidental_401_is_not_auth_error(self, mock_ytmusic: MagicMock) -> None:
+        """A "401" inside an ID or byte count isn't mistaken for a rejection."""
+        mock_ytmusic.get_playlist.side_effect = Exception(
+            "Playlist PLx401abc not found after 14010 bytes"
+        )
+        provider = YouTubeProvider(mock_ytmusic)
+
+        with pytest.raises(PlaylistNotFoundError):
+            provider.get_playlist_tracks("PLx401abc")
+
+    def test_playlist_tracks_cached(self, mock_ytmusic: MagicMock) -> None:
+        """Repeat playlist fetches within the TTL hit the cache."""
+        mock_ytmusic.get_playlist.return_value = {"tracks": [{"title": "T"}]}
+        provider = YouTubeProvider(mock_ytmusic)
+
+        first = provider.get_playlist_tracks("PL001")
+        second = provider.get_playlist_tracks("PL001")
+
+        assert first == second
+        mock_ytmusic.get_playlist.assert_called_once()
+
+    def test_liked_songs_cache_expires(self, mock_ytmusic: MagicMock) -> None:
+        """Liked songs are refetched once the cache TTL has passed."""
+        mock_ytmusic.get_liked_songs.return_value = {"tracks": []}
+        provider = YouTubeProvider(mock_ytmusic)
+
+        with patch("src.providers.youtube.time.monotonic") as mock_clock:
+            mock_clock.return_value = 1000.0
+            provider.get_liked_songs()
+            provider.get_liked_songs()
+            assert mock_ytmusic.get_liked_songs.call_count == 1
+
+            mock_clock.return_value = 1061.0
+            provider.get_liked_songs()
+            assert mock_ytmusic.get_liked_songs.call_count == 2
+
+    def test_playlist_tracks_from_disk_cache(
+        self, mock_ytmusic: MagicMock, tmp_path: Path
+    ) -> None:
+        """A new provider serves tracks another one fetched, from disk."""
+        mock_ytmusic.get_playlist.return_value = {"tracks": [{"title": "T"}]}
+        cache = PlaylistCache(tmp_path)
+
+        first = YouTubeProvider(mock_ytmusic, disk_cache=cache)
+        second = YouTubeProvider(mock_ytmusic, disk_cache=cache)
+
+        assert first.get_playlist_tracks("PL001") == [{"title": "T"}]
+        assert second.get_playlist_tracks("PL001") == [{"title": "T"}]
+        mock_ytmusic.get_playlist.assert_called_once()
+
+    def test_iter_playlist_video_ids(self, mock_ytmusic: MagicMock) -> None:
+        """Yields only non-empty video IDs from a playlist."""
+        mock_ytmusic.get_playlist.return_value = {
+            "tracks": [
+                {"title": "Track 1", "videoId": "v1"},
+                {"title": "Unavailable", "videoId": None},
+                {"title": "Track 2", "videoId": "v2"},
+            ]
+        }
+        provider = YouTubeProvider(mock_ytmusic)
+
+        assert list(provider.iter_playlist_video_ids("PL001")) == ["v1", "v2"]
+
+    def test_iter_liked_video_ids(self, mock_ytmusic: MagicMock) -> None:
+        """Yields only non-empty video IDs from liked songs."""
+        mock_ytmusic.get_liked_songs.return_value = {
+            "tracks": [{"videoId": "v1"}, {"title": "No ID"}, {"videoId": "v3"}]
+        }
+        provider = YouTubeProvider(mock_ytmusic)
+
+        assert list(provider.iter_liked_video_ids()) == ["v1", "v3"]
+
     def test_search(self, mock_ytmusic: MagicMock) -> None:
         """Search returns results."""
         mock_ytmusic.search.return_value = [
@@ -109,6 +214,31 @@ class TestYouTubeProvider:
         assert results == []
 
 
+class TestRateLimiting:
+    """Tests for metering API requests through a LeakyBucket."""
+
+    def test_each_request_acquires_a_slot(self, mock_ytmusic: MagicMock) -> None:
+        """Every API call waits on the shared limiter first."""
+        limiter = MagicMock()
+        provider = YouTubeProvider(mock_ytmusic, rate_limiter=limiter)
+
+        provider.get_playlists()
+        provider.get_liked_songs()
+        provider.search("query")
+
+        assert limiter.acquire.call_count == 3
+
+    def test_cached_tracks_skip_the_limiter(self, mock_ytmusic: MagicMock) -> None:
+        """A cache hit makes no request, so it doesn't wait."""
+        limiter = MagicMock()
+        provider = YouTubeProvider(mock_ytmusic, rate_limiter=limiter)
+
+        provider.get_liked_songs()
+        provider.get_liked_songs()
+
+        assert limiter.acquire.call_count == 1
+
+
 class TestNormalizeTrack:
     """Tests for track normalization."""
 
@@ -0,0 +1,118 @@
+"""Tests for API rate limiting."""
+
+import threading
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from src.core.rate_limit import LeakyBucket, ThrottleController
+
+
+class TestLeakyBucket:
+    """Tests for LeakyBucket."""
+
+    @patch("src.core.rate_limit.time.sleep")
+    @patch("src.core.rate_limit.time.monotonic", return_value=100.0)
+    def test_first_call_does_not_wait(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """An idle bucket lets the first request through immediately."""
+        LeakyBucket(rate=5).acquire()
+        mock_sleep.assert_not_called()
+
+    @patch("src.core.rate_limit.time.sleep")
+    @patch("src.core.rate_limit.time.monotonic", return_value=100.0)
+    def test_back_to_back_calls_are_spaced(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """Each queued request waits one more interval than the last."""
+        bucket = LeakyBucket(rate=4)
+        for _ in range(3):
+            bucket.acquire()
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [0.25, 0.5]
+
+    @patch("src.core.rate_limit.time.sleep")
+    @patch("src.core.rate_limit.time.monotonic")
+    def test_idle_time_is_not_banked(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """A long pause doesn't allow a burst afterwards."""
+        mock_monotonic.side_effect = [100.0, 200.0, 200.0]
+        bucket = LeakyBucket(rate=2)
+        for _ in range(3):
+            bucket.acquire()
+
+        delays = [c.args[0] for c in mock_sleep.call_args_list]
+        assert delays == [0.5]
+
+    @patch("src.core.rate_limit.time.sleep")
+    @patch("src.core.rate_limit.time.monotonic", return_value=100.0)
+    def test_threads_get_distinct_slots(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """Concurrent callers are metered as one stream."""
+        bucket = LeakyBucket(rate=10)
+        threads = [threading.Thread(target=bucket.acquire) for _ in range(8)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        delays = sorted(c.args[0] for c in mock_sleep.call_args_list)
+        assert delays == pytest.approx([0.1 * n for n in range(1, 8)])
+
+
+class TestThrottleController:
+    """Tests for ThrottleController."""
+
+    @patch("src.core.rate_limit.time.sleep")
+    def test_no_cooldown_without_throttling(self, mock_sleep: MagicMock) -> None:
+        """Workers aren't delayed until a throttling response is seen."""
+        ThrottleController().wait()
+        mock_sleep.assert_not_called()
+
+    @patch("src.core.rate_limit.time.monotonic", return_value=100.0)
+    def test_cooldown_doubles_within_window(self, mock_monotonic: MagicMock) -> None:
+        """Each further 429 inside the window doubles the cooldown."""
+        controller = ThrottleController(base_delay=1.0, max_delay=30.0)
+        delays = []
+        for _ in range(4):
+            controller.record_throttled()
+            delays.append(controller.remaining())
+
+        assert delays == [1.0, 2.0, 4.0, 8.0]
+
+    @patch("src.core.rate_limit.time.monotonic", return_value=100.0)
+    def test_cooldown_capped(self, mock_monotonic: MagicMock) -> None:
+        """The cooldown never exceeds max_delay."""
+        controller = ThrottleController(base_delay=1.0, max_delay=5.0)
+        for _ in range(10):
+            controller.record_throttled()
+
+        assert controller.remaining() == 5.0
+
+    @patch("src.core.rate_limit.time.monotonic")
+    def test_old_responses_expire(self, mock_monotonic: MagicMock) -> None:
+        """429s older than the window no longer lengthen the cooldown."""
+        controller = ThrottleController(window=60.0, base_delay=1.0)
+        mock_monotonic.return_value = 100.0
+        controller.record_throttled()
+        controller.record_throttled()
+
+        mock_monotonic.return_value = 200.0
+        controller.record_throttled()
+        assert controller.remaining() == 1.0
+
+    @patch("src.core.rate_limit.time.sleep")
+    @patch("src.core.rate_limit.time.monotonic", return_value=100.0)
+    def test_wait_sleeps_out_cooldown(
+        self, mock_monotonic: MagicMock, mock_sleep: MagicMock
+    ) -> None:
+        """wait() blocks for whatever is left of the cooldown."""
+        controller = ThrottleController(base_delay=2.0)
+        controller.record_throttled()
+        controller.wait()
+
+        mock_sleep.assert_called_once_with(2.0)
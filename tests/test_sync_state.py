@@ -2,8 +2,9 @@
 
 import json
 from pathlib import Path
+from unittest.mock import patch
 
-from src.core.sync_state import SyncState
+from src.core.sync_state import CHECKPOINT_OPS, SyncState
 
 
 class TestSyncState:
@@ -82,6 +83,17 @@ class TestSyncState:
         new = state.get_new_tracks(tracks)
         assert len(new) == 2
 
+    def test_get_new_tracks_empty_state_returns_copy(self, tmp_path: Path) -> None:
+        """With no state every track is new, including ones without an ID."""
+        state = SyncState(tmp_path / ".sync_state.json")
+        tracks: list[dict[str, str]] = [
+            {"video_id": "vid1", "title": "A"},
+            {"title": "No ID"},
+        ]
+        new = state.get_new_tracks(tracks)
+        assert new == tracks
+        assert new is not tracks
+
     def test_get_new_tracks_none_new(self, tmp_path: Path) -> None:
         """Returns empty list when all are downloaded."""
         state = SyncState(tmp_path / ".sync_state.json")
@@ -95,6 +107,15 @@ class TestSyncState:
         new = state.get_new_tracks(tracks)
         assert len(new) == 0
 
+    def test_get_new_tracks_after_remove(self, tmp_path: Path) -> None:
+        """A removed track is reported as new again."""
+        state = SyncState(tmp_path / ".sync_state.json")
+        state.mark_downloaded("vid1", "/a.mp3", {"title": "A"})
+        state.remove_track("vid1")
+
+        tracks: list[dict[str, str]] = [{"video_id": "vid1", "title": "A"}]
+        assert state.get_new_tracks(tracks) == tracks
+
     def test_get_orphaned_tracks(self, tmp_path: Path) -> None:
         """Detects tracks no longer in remote playlists."""
         state = SyncState(tmp_path / ".sync_state.json")
@@ -189,3 +210,152 @@ class TestSyncState:
         state.save()
 
         assert state_file.exists()
+
+    def test_compact_is_atomic(self, tmp_path: Path) -> None:
+        """Compact replaces the snapshot and leaves no temp or log file."""
+        state_file = tmp_path / ".sync_state.json"
+        state_file.write_text('{"version": 1, "tracks": {}}')
+
+        state = SyncState(state_file)
+        state.mark_downloaded("vid1", "/a.mp3", {"title": "A"})
+        state.compact()
+
+        assert list(tmp_path.iterdir()) == [state_file]
+        assert "vid1" in json.loads(state_file.read_text())["tracks"]
+
+    def test_compact_syncs_snapshot_before_dropping_log(self, tmp_path: Path) -> None:
+        """The new snapshot is on disk before the log it replaces is gone."""
+        state_file = tmp_path / ".sync_state.json"
+        log_file = tmp_path / ".sync_state.jsonl"
+        state = SyncState(state_file)
+        state.mark_downloaded("vid1", "/a.mp3", {"title": "A"})
+        state.save()
+        state.mark_downloaded("vid2", "/b.mp3", {"title": "B"})
+        state.save()
+
+        events: list[str] = []
+        real_replace = Path.replace
+
+        def record_replace(self: Path, target: Path) -> Path:
+            events.append("replace")
+            return real_replace(self, target)
+
+        with (
+            patch(
+                "src.core.sync_state.os.fsync",
+                side_effect=lambda fd: events.append("fsync"),
+            ),
+            patch.object(Path, "replace", record_replace),
+        ):
+            state.compact()
+
+        assert events == ["fsync", "replace"]
+        assert not log_file.exists()
+
+    def test_save_appends_only_new_ops(self, tmp_path: Path) -> None:
+        """Saves after the first snapshot append changes to the log."""
+        state_file = tmp_path / ".sync_state.json"
+        log_file = tmp_path / ".sync_state.jsonl"
+        state = SyncState(state_file)
+        for vid in ("vid1", "vid2", "vid3"):
+            state.mark_downloaded(vid, f"/{vid}.mp3", {"title": vid})
+        state.save()
+        snapshot = state_file.read_bytes()
+
+        state.mark_downloaded("vid4", "/vid4.mp3", {"title": "vid4"})
+        state.save()
+        state.save()
+
+        assert state_file.read_bytes() == snapshot
+        ops = [json.loads(line) for line in log_file.read_text().splitlines()]
+        assert [op["video_id"] for op in ops] == ["vid4"]
+
+    def test_reload_replays_log(self, tmp_path: Path) -> None:
+        """Reloading applies logged operations on top of the snapshot."""
+        state_file = tmp_path / ".sync_state.json"
+        state = SyncState(state_file)
+        for vid in ("vid1", "vid2", "vid3"):
+            state.mark_downloaded(vid, f"/{vid}.mp3", {"title": vid})
+        state.save()
+        state.remove_track("vid2")
+        state.mark_playlist_synced("PL1", "Rock", 2)
+        state.update_last_sync()
+        state.save()
+
+        reloaded = SyncState(state_file)
+        assert not reloaded.is_downloaded("vid2")
+        assert reloaded.total_tracks == 2
+        assert reloaded.synced_playlists["PL1"]["name"] == "Rock"
+        assert reloaded.last_sync == state.last_sync
+
+    def test_log_compacted_when_large(self, tmp_path: Path) -> None:
+        """The log is folded into the snapshot once it outgrows the state."""
+        state_file = tmp_path / ".sync_state.json"
+        log_file = tmp_path / ".sync_state.jsonl"
+        state = SyncState(state_file)
+        state.mark_downloaded("vid1", "/a.mp3", {"title": "A"})
+        state.save()
+
+        for _ in range(3):
+            state.mark_downloaded("vid1", "/a.mp3", {"title": "A"})
+        state.save()
+
+        assert not log_file.exists()
+        assert SyncState(state_file).is_downloaded("vid1")
+
+    def test_truncated_log_line_skipped(self, tmp_path: Path) -> None:
+        """A partial trailing log entry is ignored on load."""
+        state_file = tmp_path / ".sync_state.json"
+        state = SyncState(state_file)
+        state.mark_downloaded("vid1", "/a.mp3", {"title": "A"})
+        state.mark_downloaded("vid2", "/b.mp3", {"title": "B"})
+        state.save()
+        state.mark_downloaded("vid3", "/c.mp3", {"title": "C"})
+        state.save()
+        with (tmp_path / ".sync_state.jsonl").open("a") as f:
+            f.write('{"op": "add", "video_')
+
+        reloaded = SyncState(state_file)
+        assert reloaded.total_tracks == 3
+
+    def test_mutations_do_not_write(self, tmp_path: Path) -> None:
+        """mark_downloaded and remove_track only touch in-memory state."""
+        state_file = tmp_path / ".sync_state.json"
+        state = SyncState(state_file)
+        state.mark_downloaded("vid1", "/a.mp3", {"title": "A"})
+        state.remove_track("vid1")
+
+        assert not state_file.exists()
+
+    def test_get_orphaned_tracks_keeps_state_order(self, tmp_path: Path) -> None:
+        """Orphaned tracks are returned in the order they were downloaded."""
+        state = SyncState(tmp_path / ".sync_state.json")
+        for vid in ("vid3", "vid1", "vid2", "vid4"):
+            state.mark_downloaded(vid, f"/{vid}.mp3", {"title": vid})
+
+        orphaned = state.get_orphaned_tracks({"vid1"})
+        assert [t["video_id"] for t in orphaned] == ["vid3", "vid2", "vid4"]
+
+    def test_snapshot_without_tracks_key(self, tmp_path: Path) -> None:
+        """A snapshot missing 'tracks' still accepts and reports downloads."""
+        state_file = tmp_path / ".sync_state.json"
+        state_file.write_text(json.dumps({"version": 1, "last_sync": None}))
+
+        state = SyncState(state_file)
+        state.mark_downloaded("vid1", "/a.mp3", {"title": "A"})
+        state.save()
+
+        assert state.is_downloaded("vid1")
+        assert SyncState(state_file).is_downloaded("vid1")
+
+    def test_checkpoint_after_many_ops(self, tmp_path: Path) -> None:
+        """Pending operations are saved once the checkpoint size is reached."""
+        state_file = tmp_path / ".sync_state.json"
+        state = SyncState(state_file)
+        for i in range(CHECKPOINT_OPS - 1):
+            state.mark_downloaded(f"vid{i}", f"/{i}.mp3", {"title": str(i)})
+        assert not state_file.exists()
+
+        state.mark_downloaded("last", "/last.mp3", {"title": "last"})
+
+        assert SyncState(state_file).total_tracks == CHECKPOINT_OPS
@@ -1,12 +1,14 @@
 """Tests for metadata tagger."""
 
 from pathlib import Path
+from typing import Any
 from unittest.mock import MagicMock, patch
 
 import pytest
+from mutagen.id3 import ID3
 
 from src.core.exceptions import MetadataError
-from src.core.tagger import tag_file
+from src.core.tagger import _read_cover, _tag_mp3, clear_cover_cache, tag_file
 
 
 class TestTagFile:
@@ -121,3 +123,73 @@ class TestTagFile:
 
         with pytest.raises(MetadataError, match="Failed to tag"):
             tag_file(mp3_file, {"title": "Song", "artist": "Artist"})
+
+
+class TestReadCover:
+    """Tests for the cover image cache."""
+
+    def setup_method(self) -> None:
+        clear_cover_cache()
+
+    def test_unchanged_cover_read_once(self, tmp_path: Path) -> None:
+        """Tracks sharing a cover read the file only once."""
+        cover = tmp_path / "cover.jpg"
+        cover.write_bytes(b"image")
+
+        with patch.object(Path, "read_bytes", autospec=True) as mock_read:
+            mock_read.return_value = b"image"
+            assert _read_cover(cover) == b"image"
+            assert _read_cover(cover) == b"image"
+
+        mock_read.assert_called_once()
+
+    def test_rewritten_cover_is_reread(self, tmp_path: Path) -> None:
+        """A cover replaced on disk is not served from the cache."""
+        cover = tmp_path / "cover.jpg"
+        cover.write_bytes(b"old")
+        assert _read_cover(cover) == b"old"
+
+        cover.write_bytes(b"newer")
+        assert _read_cover(cover) == b"newer"
+
+
+def _id3_frames(path: Path, frame_id: str) -> list[Any]:
+    """Read back every frame_id frame from path's ID3 tag."""
+    frames: list[Any] = ID3(str(path)).getall(frame_id)  # type: ignore[no-untyped-call]
+    return frames
+
+
+class TestTagMp3:
+    """Tests for MP3 ID3 tagging."""
+
+    def test_untagged_file_gets_tags_and_cover(self, tmp_path: Path) -> None:
+        """A file without an ID3 header is tagged in one pass."""
+        mp3_file = tmp_path / "song.mp3"
+        mp3_file.write_bytes(b"\xff\xfb" + b"\x00" * 64)
+        cover = tmp_path / "cover.png"
+        cover.write_bytes(b"image")
+
+        _tag_mp3(
+            mp3_file,
+            {"title": "Song", "artist": "Artist", "genre": "Rock"},
+            cover,
+        )
+
+        assert _id3_frames(mp3_file, "TIT2")[0].text == ["Song"]
+        assert _id3_frames(mp3_file, "TPE1")[0].text == ["Artist"]
+        assert _id3_frames(mp3_file, "TALB")[0].text == ["Unknown"]
+        assert _id3_frames(mp3_file, "TCON")[0].text == ["Rock"]
+        apic = _id3_frames(mp3_file, "APIC")[0]
+        assert (apic.mime, apic.data) == ("image/png", b"image")
+
+    def test_retagging_replaces_frames(self, tmp_path: Path) -> None:
+        """Tagging an already tagged file overwrites rather than appends."""
+        mp3_file = tmp_path / "song.mp3"
+        mp3_file.write_bytes(b"\xff\xfb" + b"\x00" * 64)
+
+        _tag_mp3(mp3_file, {"title": "Old", "artist": "Artist"})
+        _tag_mp3(mp3_file, {"title": "New", "artist": "Artist"})
+
+        titles = _id3_frames(mp3_file, "TIT2")
+        assert len(titles) == 1
+        assert titles[0].text == ["New"]
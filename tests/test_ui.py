@@ -1,10 +1,20 @@
 """Tests for CLI UI components."""
 
+import io
 from typing import Any
 from unittest.mock import MagicMock, patch
 
+import orjson
+import pytest
+from rich.console import Console
+from rich.progress import BarColumn, SpinnerColumn, TextColumn
+
 from src.cli.ui import (
+    PROGRESS_REFRESH_PER_SECOND,
+    PROGRESS_REFRESH_PER_SECOND_NON_TTY,
+    TRACK_TABLE_CHUNK_THRESHOLD,
     confirm_action,
+    console,
     create_download_progress,
     print_error,
     print_header,
@@ -12,8 +22,10 @@ from src.cli.ui import (
     print_playlist_table,
     print_success,
     print_sync_summary,
+    print_synced_playlists,
     print_track_table,
     print_warning,
+    set_output_format,
 )
 
 
@@ -60,6 +72,12 @@ class TestPrintFunctions:
         call_args = str(mock_console.print.call_args)
         assert "Some info" in call_args
 
+    def test_brackets_printed_literally(self) -> None:
+        """Messages aren't parsed as markup, so brackets survive."""
+        with console.capture() as capture:
+            print_success("Song [Official Video] [bold]")
+        assert capture.get() == " -> Song [Official Video] [bold]\n"
+
 
 class TestTrackTable:
     """Tests for track table rendering."""
@@ -112,6 +130,27 @@ class TestTrackTable:
         # Should print table only, no "and X more" message
         assert mock_console.print.call_count == 1
 
+    @patch("src.cli.ui.console")
+    def test_print_track_table_show_all_chunked(self, mock_console: MagicMock) -> None:
+        """Long show_all tables are printed in fixed-width chunks."""
+        tracks = [
+            {
+                "artist": f"Artist {i}",
+                "title": f"Song {i}",
+                "album": f"Album {i}",
+            }
+            for i in range(TRACK_TABLE_CHUNK_THRESHOLD + 1)
+        ]
+        print_track_table(tracks, show_all=True)
+
+        tables = [c.args[0] for c in mock_console.print.call_args_list]
+        assert len(tables) == 3
+        assert [t.row_count for t in tables] == [100, 100, 1]
+        assert tables[0].show_header
+        assert not any(t.show_header for t in tables[1:])
+        widths = {tuple(col.width for col in t.columns) for t in tables}
+        assert len(widths) == 1
+
     @patch("src.cli.ui.console")
     def test_print_track_table_empty(self, mock_console: MagicMock) -> None:
         """print_track_table handles empty list."""
@@ -149,6 +188,28 @@ class TestProgressBar:
         progress = create_download_progress()
         assert progress is not None
 
+    def test_progress_refresh_rate_capped(self) -> None:
+        """Live progress redraws at the capped rate."""
+        with patch("src.cli.ui.console", Console(force_terminal=True)):
+            progress = create_download_progress()
+        assert progress.live.refresh_per_second == PROGRESS_REFRESH_PER_SECOND
+
+    def test_terminal_progress_has_spinner_and_bar(self) -> None:
+        """A terminal gets the animated columns."""
+        with patch("src.cli.ui.console", Console(force_terminal=True)):
+            progress = create_download_progress()
+        column_types = {type(c) for c in progress.columns}
+        assert SpinnerColumn in column_types
+        assert BarColumn in column_types
+
+    def test_non_terminal_progress_is_plain(self) -> None:
+        """Piped output drops animated columns and redraws less often."""
+        with patch("src.cli.ui.console", Console(file=io.StringIO())):
+            progress = create_download_progress()
+        column_types = {type(c) for c in progress.columns}
+        assert column_types == {TextColumn}
+        assert progress.live.refresh_per_second == PROGRESS_REFRESH_PER_SECOND_NON_TTY
+
 
 class TestConfirmAction:
     """Tests for confirm_action."""
@@ -179,10 +240,162 @@ class TestSyncSummary:
     def test_print_sync_summary(self, mock_console: MagicMock) -> None:
         """print_sync_summary displays all statistics."""
         print_sync_summary(total=100, downloaded=80, skipped=15, failed=5)
-        assert mock_console.print.call_count >= 4
+        mock_console.print.assert_called_once()
+        summary = mock_console.print.call_args.args[0].plain
+        for expected in ("100", "80", "Already synced:    15", "Failed:            5"):
+            assert expected in summary
 
     @patch("src.cli.ui.console")
     def test_print_sync_summary_no_failures(self, mock_console: MagicMock) -> None:
         """print_sync_summary omits failed when 0 failures."""
         print_sync_summary(total=50, downloaded=50, skipped=0, failed=0)
-        assert mock_console.print.called
+        summary = mock_console.print.call_args.args[0].plain
+        assert "Failed" not in summary
+        assert "Already synced" not in summary
+
+    @patch("src.cli.ui.console")
+    def test_print_sync_summary_styles_lines_separately(
+        self, mock_console: MagicMock
+    ) -> None:
+        """Only the heading carries the header style."""
+        print_sync_summary(total=1, downloaded=1, skipped=0, failed=0)
+        summary = mock_console.print.call_args.args[0]
+        assert summary.style == ""
+        assert [span.style for span in summary.spans] == ["header", "success"]
+
+
+class TestLazyConsole:
+    """Tests for deferred console construction."""
+
+    def test_console_built_on_first_access(self) -> None:
+        """The shared console is created when first requested, then reused."""
+        import src.cli.ui as ui
+
+        with patch.object(ui, "_console", None):
+            first = ui.console
+            assert first is ui._console
+            assert ui.console is first
+
+    def test_patched_console_takes_precedence(self) -> None:
+        """Helpers print through a console patched onto the module."""
+        with patch("src.cli.ui.console") as mock_console:
+            print_info("hello")
+        mock_console.print.assert_called_once()
+
+    def test_import_is_stable(self) -> None:
+        """The console imported by name is the one helpers use."""
+        import src.cli.ui as ui
+
+        assert console is ui._get_console()
+
+    def test_registering_commands_leaves_console_unbuilt(self) -> None:
+        """Importing and registering every command doesn't build the console."""
+        import sys
+
+        import src.cli.ui as ui
+        from src.cli.main import COMMANDS, build_app
+
+        with patch.object(ui, "_console", None), patch.dict(sys.modules):
+            for module_name, _ in COMMANDS.values():
+                sys.modules.pop(module_name, None)
+            build_app()
+            assert ui._console is None
+
+
+class TestTheme:
+    """Tests for the ymd theme."""
+
+    def test_styles_match_string_definitions(self) -> None:
+        """Prebuilt styles are equivalent to their markup strings."""
+        from rich.style import Style
+
+        from src.cli.ui import ymd_theme
+
+        assert ymd_theme.styles["info"] == Style.parse("bold cyan")
+        assert ymd_theme.styles["track.album"] == Style.parse("yellow")
+
+    def test_inherits_rich_defaults(self) -> None:
+        """Progress and table styles from Rich's defaults stay available."""
+        from src.cli.ui import ymd_theme
+
+        assert "progress.percentage" in ymd_theme.styles
+        assert "table.header" in ymd_theme.styles
+
+
+class TestMachineOutput:
+    """Tests for JSON and TSV listings selected by --output."""
+
+    def teardown_method(self) -> None:
+        set_output_format("table")
+
+    @patch("src.cli.ui.Table")
+    def test_json_tracks_skip_rich(
+        self, mock_table: MagicMock, capsys: pytest.CaptureFixture[str]
+    ) -> None:
+        """JSON output dumps every track without building a table."""
+        tracks = [
+            {"artist": f"Artist {i}", "title": f"Song {i}", "album": f"Album {i}"}
+            for i in range(25)
+        ]
+        set_output_format("json")
+
+        print_track_table(tracks)
+
+        mock_table.assert_not_called()
+        assert orjson.loads(capsys.readouterr().out) == tracks
+
+    def test_tsv_tracks(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """TSV output writes one line per track with whitespace flattened."""
+        tracks = [
+            {"artist": "A", "title": "Tab\there", "album": "X", "video_id": "v1"},
+            {"artist": "B", "title": "Line\nbreak", "album": "", "video_id": "v2"},
+        ]
+        set_output_format("tsv")
+
+        print_track_table(tracks)
+
+        assert capsys.readouterr().out.splitlines() == [
+            "A\tTab here\tX\tv1",
+            "B\tLine break\t\tv2",
+        ]
+
+    def test_tsv_playlists(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Playlists are listed as title, count and ID."""
+        set_output_format("tsv")
+
+        print_playlist_table([{"title": "Rock", "count": 3, "playlistId": "PL1"}])
+
+        assert capsys.readouterr().out == "Rock\t3\tPL1\n"
+
+    def test_console_moves_to_stderr(self) -> None:
+        """Machine formats rebuild the console on stderr."""
+        import src.cli.ui as ui
+
+        with patch.object(ui, "_console", None):
+            assert not ui._get_console().stderr
+            set_output_format("json")
+            assert ui._get_console().stderr
+            assert ui.is_machine_output()
+
+    def test_synced_playlists_json(self, capsys: pytest.CaptureFixture[str]) -> None:
+        """Synced playlists are listed with their ID as a field."""
+        set_output_format("json")
+
+        print_synced_playlists({"PL1": {"name": "Rock", "track_count": 3}})
+
+        assert orjson.loads(capsys.readouterr().out) == [
+            {"playlist_id": "PL1", "name": "Rock", "track_count": 3}
+        ]
+
+    @patch("src.cli.ui.console")
+    def test_synced_playlists_table(self, mock_console: MagicMock) -> None:
+        """Table output prints a heading and one line per playlist."""
+        print_synced_playlists({"PL1": {"name": "Rock", "track_count": 3}})
+        printed = [c.args[0] for c in mock_console.print.call_args_list]
+        assert "Rock: 3 tracks" in printed[1]
+
+    @patch("src.cli.ui.console")
+    def test_synced_playlists_table_empty(self, mock_console: MagicMock) -> None:
+        """Nothing is printed for an empty table listing."""
+        print_synced_playlists({})
+        mock_console.print.assert_not_called()